@@ -0,0 +1,7 @@
+""" Module that runs the command line interface with python -m pythonalgos
+"""
+
+import sys
+from . cli import main
+
+sys.exit(main())
@@ -0,0 +1,241 @@
+""" Module that contains the command line interface, which runs an algorithm on
+a directed graph that is read from a file and writes the results as JSON
+lines, one line per result item.
+
+Two file formats are supported: a text edge list, with one edge "tail head"
+per line (a line with a single label adds a vertex without edges, lines
+starting with # are skipped), and the binary edge files of the external
+module, with pairs of native 64-bit vertex ids """
+
+import argparse
+import io
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, \
+    Sequence
+from . util.advisor import Advisor
+
+ALGORITHMS = ["is_cyclic", "sccs", "trail", "topological"]
+FORMATS = ["edges", "binary"]
+
+
+class Profiler(object):
+    """ Class that measures the wall time and the peak memory of the phases
+    of a run, and reports them as JSON lines. The allocation hooks of
+    tracemalloc slow a run down, so the phases are timed in a run without
+    tracing, and their peak memory is traced in a second run """
+
+    def __init__(self, enabled: bool, out: IO[str]):
+        self._enabled = enabled
+        self._out = out
+        self._tracemalloc: Any = None
+        self._seconds: Dict[str, float] = dict()
+        self._peaks: Dict[str, int] = dict()
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    @contextmanager
+    def tracing(self) -> Iterator[None]:
+        """ Context manager that traces memory, the phases within it report
+        their peak memory instead of their wall time """
+
+        import tracemalloc
+        tracemalloc.start()
+        self._tracemalloc = tracemalloc
+        try:
+            yield
+        finally:
+            self._tracemalloc = None
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """ Context manager that measures a phase
+
+        Args:
+            name(str): the name of the phase """
+
+        if not self._enabled:
+            yield
+        elif self._tracemalloc is None:
+            start = time.perf_counter()
+            yield
+            self._seconds[name] = time.perf_counter() - start
+        else:
+            self._tracemalloc.reset_peak()
+            yield
+            self._peaks[name] = self._tracemalloc.get_traced_memory()[1]
+
+    def report(self):
+        """ Writes the wall time and the peak memory per phase """
+
+        for name, seconds in self._seconds.items():
+            _write(self._out, {"phase": name, "seconds": round(seconds, 6),
+                               "peak_bytes": self._peaks.get(name)})
+
+
+class _TrailWriter(Advisor):
+    """ Advisor that writes the edges of the trail as they are traversed """
+
+    def __init__(self, out: IO[str]):
+        super().__init__()
+        self._out = out
+
+    def edge_not_visited(self, directed_graph, edge):
+        _write(self._out, [edge.get_tail().get_label(),
+                           edge.get_head().get_label()])
+
+
+def read_edge_list(lines: Iterator[str]) -> Dict[str, List[str]]:
+    """ Function that reads a text edge list into a dict with the vertices
+    and their heads in it
+
+    Args:
+        lines: the lines of the edge list
+
+    Returns:
+        dict: the labels of the vertices and of their heads """
+
+    vertices: Dict[str, List[str]] = dict()
+    for number, line in enumerate(lines, 1):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        if len(fields) > 2:
+            raise RuntimeError(f"line {number} has more than two labels")
+        heads = vertices.setdefault(fields[0], list())
+        if len(fields) == 2:
+            heads.append(fields[1])
+            vertices.setdefault(fields[1], list())
+    return vertices
+
+
+def read_binary(path: str) -> Dict[int, List[int]]:
+    """ Function that reads a binary edge file into a dict with the vertices
+    and their heads in it
+
+    Args:
+        path(str): the path of the edge file
+
+    Returns:
+        dict: the ids of the vertices and of their heads """
+
+    from . graph.external import read_edge_blocks
+    vertices: Dict[int, List[int]] = dict()
+    for block in read_edge_blocks(path):
+        for i in range(0, len(block), 2):
+            tail, head = block[i], block[i + 1]
+            vertices.setdefault(tail, list()).append(head)
+            vertices.setdefault(head, list())
+    return vertices
+
+
+def run(algorithm: str, directed_graph: Any, out: IO[str],
+        trivial: bool = False):
+    """ Function that runs the algorithm on the directed graph and writes
+    the results as JSON lines
+
+    Args:
+        algorithm(str): one of ALGORITHMS
+        directed_graph (DirectedGraph): the directed graph
+        out: the stream to write to
+        trivial(bool): if True, the trivial sccs are written as well """
+
+    if algorithm == "is_cyclic":
+        _write(out, directed_graph.is_cyclic())
+    elif algorithm == "sccs":
+        for scc in directed_graph.create_sccs_kosaraju_dfs(not trivial):
+            _write(out, sorted((vertex.get_label() for vertex in scc),
+                               key=str))
+    elif algorithm == "trail":
+        directed_graph.trail(_TrailWriter(out))
+    elif algorithm == "topological":
+        from . graph.topological_sort import topological_order
+        for vertex in topological_order(
+                directed_graph.get_direct_graph_core()):
+            _write(out, vertex.get_label())
+    else:
+        raise RuntimeError(f"Unknown algorithm {algorithm}")
+
+
+def main(argv: Optional[Sequence[str]] = None,
+         out: Optional[IO[str]] = None, err: Optional[IO[str]] = None) -> int:
+    """ Function that parses the arguments and runs the algorithm
+
+    Args:
+        argv: the arguments, sys.argv[1:] if not provided
+        out: the stream for the results, sys.stdout if not provided
+        err: the stream for errors and profiling, sys.stderr if not provided
+
+    Returns:
+        int: the exit status """
+
+    out = sys.stdout if out is None else out
+    err = sys.stderr if err is None else err
+    parser = argparse.ArgumentParser(
+        prog="pythonalgos",
+        description="Runs an algorithm on a directed graph in a file and "
+                    "writes the results as JSON lines")
+    parser.add_argument("algorithm", choices=ALGORITHMS)
+    parser.add_argument("path", help="the graph file, - for stdin")
+    parser.add_argument("--format", choices=FORMATS,
+                        help="the file format, binary for .bin files and "
+                             "edges otherwise if not provided")
+    parser.add_argument("--trivial", action="store_true",
+                        help="also write the sccs of a single vertex")
+    parser.add_argument("--profile", action="store_true",
+                        help="write the time and peak memory per phase to "
+                             "stderr, the phases are run a second time to "
+                             "trace the memory")
+    args = parser.parse_args(argv)
+
+    file_format = args.format
+    if file_format is None:
+        file_format = "binary" if args.path.endswith(".bin") else "edges"
+    profiler = Profiler(args.profile, err)
+    try:
+        lines: Optional[Iterable[str]] = None
+        if file_format == "edges" and args.path == "-":
+            # Standard input can only be read once, so it is kept for the
+            # traced run
+            lines = sys.stdin.readlines() if profiler.is_enabled() else \
+                sys.stdin
+        _run_phases(args, file_format, lines, out, profiler)
+        if profiler.is_enabled():
+            with profiler.tracing():
+                _run_phases(args, file_format, lines, io.StringIO(),
+                            profiler)
+            profiler.report()
+    except (OSError, RuntimeError) as e:
+        _write(err, {"error": str(e)})
+        return 1
+    return 0
+
+
+def _run_phases(args: argparse.Namespace, file_format: str,
+                lines: Optional[Iterable[str]], out: IO[str],
+                profiler: Profiler):
+    """ Function that reads the directed graph, builds it and runs the
+    algorithm, as phases of the profiler """
+
+    with profiler.phase("read"):
+        if file_format == "binary":
+            vertices = read_binary(args.path)
+        elif lines is not None:
+            vertices = read_edge_list(iter(lines))
+        else:
+            with open(args.path) as f:
+                vertices = read_edge_list(f)
+    with profiler.phase("build"):
+        from . graph.directed_graph import DirectedGraph
+        directed_graph = DirectedGraph(vertices)
+    with profiler.phase(args.algorithm):
+        run(args.algorithm, directed_graph, out, args.trivial)
+
+
+def _write(out: IO[str], item: Any):
+    out.write(json.dumps(item))
+    out.write("\n")
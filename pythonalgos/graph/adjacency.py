@@ -0,0 +1,268 @@
+""" Module that contains a compressed, array based snapshot of the adjacency of
+a directed graph.
+
+Algorithms keep their scratch state in per-call arrays that are indexed by the
+dense positions of this snapshot. No state is written into the vertices or the
+edges of the directed graph itself, which makes the algorithms reentrant and
+safe to run concurrently on the same (unmodified) directed graph """
+
+from __future__ import annotations
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, \
+    Sequence
+
+
+class Adjacency(object):
+    """ Class that represents the adjacency of a directed graph in compressed
+    sparse row form. The vertex at position i has its heads stored at
+    heads[offsets[i]:offsets[i + 1]], the corresponding edge objects are
+    stored at the same positions in edges """
+
+    def __init__(self, vertices: Sequence[Any], offsets: array, heads: array,
+                 edges: Optional[Sequence[Any]] = None):
+        """ Initialises the adjacency
+
+        Args:
+            vertices: the vertices, indexed by their dense position
+            offsets(array): n + 1 offsets into the heads array
+            heads(array): the positions of the heads of all edges
+            edges: the edge objects, at the same positions as the heads
+        """
+
+        self._vertices = vertices
+        self._offsets = offsets
+        self._heads = heads
+        self._edges = edges
+        self._positions: Optional[Dict[Any, int]] = None
+        self._origins: Optional[array] = None
+        self._dense_ids = False
+        self._id_positions: Optional[array] = None
+
+    @classmethod
+    def from_graph(cls, directed_graph) -> Adjacency:
+        """ Creates the adjacency of a directed graph. Vertices and edges
+        keep the order in which the directed graph hands them out, so the
+        algorithm ordering of the directed graph is respected
+
+        Args:
+            directed_graph (DirectedGraphCore): The directed graph
+
+        Returns:
+            Adjacency: the snapshot of the adjacency """
+
+        vertices: List[Any] = list(directed_graph.get_vertices())
+        positions = {vertex: i for i, vertex in enumerate(vertices)}
+        offsets = array("l", [0])
+        heads = array("l")
+        edges: List[Any] = list()
+        for vertex in vertices:
+            for edge in vertex.get_edges():
+                heads.append(positions[edge.get_head()])
+                edges.append(edge)
+            offsets.append(len(heads))
+
+        adjacency = cls(vertices, offsets, heads, edges)
+        adjacency._positions = positions
+        return adjacency
+
+    @classmethod
+    def from_dense_vertices(cls, vertices: List[Any]) -> Adjacency:
+        """ Creates the adjacency of vertices that are listed by their dense
+        integer id. The positions of the adjacency are the ids, so no
+        position lookup is needed
+
+        Args:
+            vertices(list): the vertices, the vertex with id i at index i
+
+        Returns:
+            Adjacency: the snapshot of the adjacency """
+
+        offsets = array("l", [0])
+        heads = array("l")
+        edges: List[Any] = list()
+        for vertex in vertices:
+            for edge in vertex.get_edges():
+                heads.append(edge.get_head().get_id())
+                edges.append(edge)
+            offsets.append(len(heads))
+
+        adjacency = cls(list(vertices), offsets, heads, edges)
+        adjacency._dense_ids = True
+        return adjacency
+
+    @classmethod
+    def from_filtered_vertices(cls, vertices: List[Any], id_count: int,
+                               edge_predicate: Optional[Callable[[Any], bool]]
+                               = None) -> Adjacency:
+        """ Creates the adjacency of a subset of the vertices of a directed
+        graph. Only the edges between vertices of the subset, that satisfy
+        the edge predicate, are part of the adjacency. The positions of the
+        vertices are looked up in an array that is indexed by vertex id
+
+        Args:
+            vertices(list): the vertices of the subset, in algorithm order
+            id_count(int): the amount of vertex ids in the directed graph
+            edge_predicate: if provided, only edges for which it returns True
+                are part of the adjacency
+
+        Returns:
+            Adjacency: the snapshot of the adjacency """
+
+        positions = array("l", [-1]) * id_count
+        for i, vertex in enumerate(vertices):
+            positions[vertex.get_id()] = i
+        offsets = array("l", [0])
+        heads = array("l")
+        edges: List[Any] = list()
+        for vertex in vertices:
+            for edge in vertex.get_edges():
+                head = positions[edge.get_head().get_id()]
+                if head != -1 and (edge_predicate is None or
+                                   edge_predicate(edge)):
+                    heads.append(head)
+                    edges.append(edge)
+            offsets.append(len(heads))
+
+        adjacency = cls(list(vertices), offsets, heads, edges)
+        adjacency._id_positions = positions
+        return adjacency
+
+    @classmethod
+    def from_mapping(cls, vertices: Mapping[Any, Iterable[Any]]) -> Adjacency:
+        """ Creates an adjacency directly from a dict with the labels of the
+        vertices and the labels of their heads, without creating vertex or
+        edge objects. The vertices of the adjacency are the labels
+
+        Args:
+            vertices(dict): a dict with the vertices and their heads in it
+
+        Returns:
+            Adjacency: the adjacency """
+
+        labels: List[Any] = list(vertices.keys())
+        positions = {label: i for i, label in enumerate(labels)}
+        offsets = array("l", [0])
+        heads = array("l")
+        for label in labels:
+            for head in vertices[label]:
+                if head not in positions:
+                    raise RuntimeError(
+                        f"label {head} couldn't be found in vertices")
+                heads.append(positions[head])
+            offsets.append(len(heads))
+
+        adjacency = cls(labels, offsets, heads)
+        adjacency._positions = positions
+        return adjacency
+
+    def get_vertices(self) -> Sequence[Any]:
+        return self._vertices
+
+    def get_offsets(self) -> array:
+        return self._offsets
+
+    def get_heads(self) -> array:
+        return self._heads
+
+    def get_edges(self) -> Optional[Sequence[Any]]:
+        return self._edges
+
+    def get_id_positions(self) -> Optional[array]:
+        """ Returns, for the adjacency of a subset of the vertices of a
+        directed graph, the position per vertex id (-1 if the vertex is not
+        part of the subset)
+
+        Returns:
+            array: the positions per vertex id, or None """
+
+        return self._id_positions
+
+    def get_origins(self) -> Optional[array]:
+        """ Returns, for a transposed adjacency, the position that every edge
+        has in the adjacency it was transposed from. Per-edge arrays of that
+        adjacency can be permuted with it, instead of being extracted again
+
+        Returns:
+            array: the original edge positions, or None if this adjacency is
+                not transposed """
+
+        return self._origins
+
+    def get_vertices_count(self) -> int:
+        return len(self._vertices)
+
+    def get_edges_count(self) -> int:
+        return len(self._heads)
+
+    def get_position(self, vertex: Any) -> int:
+        """ Returns the dense position of a vertex
+
+        Args:
+            vertex: the vertex
+
+        Returns:
+            int: the position of the vertex in this adjacency """
+
+        if self._dense_ids:
+            return vertex.get_id()
+        if self._id_positions is not None:
+            position = self._id_positions[vertex.get_id()]
+            if position == -1:
+                raise KeyError(vertex)
+            return position
+        if self._positions is None:
+            self._positions = {v: i for i, v in enumerate(self._vertices)}
+        return self._positions[vertex]
+
+    def has_self_loop(self, position: int) -> bool:
+        """ Checks whether the vertex at the position has an edge to itself
+
+        Args:
+            position(int): the position of the vertex
+
+        Returns:
+            bool: True if there is a self-loop, otherwise False """
+
+        heads = self._heads
+        for i in range(self._offsets[position], self._offsets[position + 1]):
+            if heads[i] == position:
+                return True
+        return False
+
+    def transpose(self) -> Adjacency:
+        """ Creates the transposed adjacency, in which every edge is reversed.
+        The edge objects are not touched, the transposed adjacency refers to
+        the same edge objects as this adjacency
+
+        Returns:
+            Adjacency: the transposed adjacency """
+
+        n = len(self._vertices)
+        offsets, heads = self._offsets, self._heads
+        counts = array("l", [0]) * (n + 1)
+        for head in heads:
+            counts[head + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+
+        t_offsets = array("l", counts)
+        t_heads = array("l", [0]) * len(heads)
+        t_origins = array("l", [0]) * len(heads)
+        t_edges: Optional[List[Any]] = None \
+            if self._edges is None else [None] * len(heads)
+        for tail in range(n):
+            for i in range(offsets[tail], offsets[tail + 1]):
+                head = heads[i]
+                j = counts[head]
+                counts[head] = j + 1
+                t_heads[j] = tail
+                t_origins[j] = i
+                if t_edges is not None:
+                    t_edges[j] = self._edges[i]
+
+        transposed = Adjacency(self._vertices, t_offsets, t_heads, t_edges)
+        transposed._positions = self._positions
+        transposed._origins = t_origins
+        transposed._dense_ids = self._dense_ids
+        transposed._id_positions = self._id_positions
+        return transposed
@@ -0,0 +1,156 @@
+""" Module that contains asyncio variants of the algorithms on directed graphs.
+
+The algorithms are run as step generators. Between steps, control is given
+back to the event loop, progress is reported and cancellation is honoured, so
+that other tasks keep being served while a long running algorithm is busy.
+The algorithms also yield between their phases, like creating the adjacency,
+transposing it and converting the result, which each take a pass over the
+directed graph.
+
+Alternatively, the steps are run in a thread pool executor, in which case the
+event loop is not involved in the processing at all. Process pools are not
+supported, as the steps work on the directed graph of the caller and report
+progress to its event loop
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Set
+from .. util.advisor import Advisor
+from .. util.steps import Steps, STEP_SIZE
+from . import cyclic
+from . import kosaraju_sccs
+from . directed_graph_core import DirectedGraphCore
+from . vertex import Vertex
+
+Progress = Callable[[int, int], Any]
+
+
+async def is_cyclic_async(directed_graph: DirectedGraphCore,
+                          advisor: Advisor = Advisor(),
+                          progress: Optional[Progress] = None,
+                          step_size: int = STEP_SIZE,
+                          executor: Optional[ThreadPoolExecutor] = None) -> \
+        bool:
+    """ Function that checks whether a directed graph contains a cycle or not,
+    without blocking the event loop
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        advisor(Advisor): Object that contains advice which can be inserted at
+            join points
+        progress: Callable that is called with the amount of processed
+            vertices and the total amount of vertices
+        step_size(int): The amount of vertices to process between yields
+        executor(ThreadPoolExecutor): If provided, the algorithm is run in
+            the executor
+
+    Returns:
+        bool: True if the directed graph contains a cycle, otherwise False """
+
+    return await run_steps_async(
+        lambda: cyclic.is_cyclic_steps(directed_graph, advisor, step_size),
+        directed_graph.get_vertices_count(), progress, executor)
+
+
+async def create_sccs_kosaraju_dfs_async(
+        directed_graph: DirectedGraphCore, nontrivial: bool = True,
+        advisor: Advisor = Advisor(), progress: Optional[Progress] = None,
+        step_size: int = STEP_SIZE,
+        executor: Optional[ThreadPoolExecutor] = None) -> List[Set[Vertex]]:
+    """ Function that calculates the strongly connected components of a
+    directed graph according to Kosaraju's algorithm, without blocking the
+    event loop
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        nontrivial: if true, retrieves the nontrivial sccs, if not, also the
+            trivial ones
+        advisor(Advisor): Object that contains advice which can be inserted at
+            join points
+        progress: Callable that is called with the amount of processed
+            vertices and the total amount of vertices
+        step_size(int): The amount of vertices to process between yields
+        executor(ThreadPoolExecutor): If provided, the algorithm is run in
+            the executor
+
+    Returns:
+        list(set()) of SCCs: Each SCC is a set of vertices """
+
+    return await run_steps_async(
+        lambda: kosaraju_sccs.create_sccs_kosaraju_dfs_steps(
+            directed_graph, nontrivial, advisor, step_size),
+        directed_graph.get_vertices_count(), progress, executor)
+
+
+async def run_steps_async(create_steps: Callable[[], Steps], total: int,
+                          progress: Optional[Progress] = None,
+                          executor: Optional[ThreadPoolExecutor] = None) -> \
+        Any:
+    """ Function that runs a step generator cooperatively. When the awaiting
+    task is cancelled, the step generator is stopped at its next step
+
+    Args:
+        create_steps: Callable that creates the step generator
+        total(int): The total amount of work, reported with the progress
+        progress: Callable that is called with the amount of work done and
+            the total amount of work
+        executor(ThreadPoolExecutor): If provided, the steps are run in the
+            executor and progress is reported on the event loop
+
+    Returns:
+        The result of the algorithm """
+
+    if executor is not None:
+        if not isinstance(executor, ThreadPoolExecutor):
+            raise RuntimeError("The steps of an algorithm can only be run in "
+                               "a thread pool executor")
+        return await _run_steps_in_executor(create_steps, total, progress,
+                                            executor)
+
+    steps = create_steps()
+    try:
+        while True:
+            try:
+                done = next(steps)
+            except StopIteration as stop:
+                if progress is not None:
+                    progress(total, total)
+                return stop.value
+            if progress is not None:
+                progress(done, total)
+            await asyncio.sleep(0)
+    finally:
+        steps.close()
+
+
+async def _run_steps_in_executor(create_steps: Callable[[], Steps],
+                                 total: int, progress: Optional[Progress],
+                                 executor: ThreadPoolExecutor) -> Any:
+    loop = asyncio.get_running_loop()
+    cancelled = threading.Event()
+
+    def run():
+        steps = create_steps()
+        try:
+            while True:
+                try:
+                    done = next(steps)
+                except StopIteration as stop:
+                    return stop.value
+                if cancelled.is_set():
+                    raise asyncio.CancelledError()
+                if progress is not None:
+                    loop.call_soon_threadsafe(progress, done, total)
+        finally:
+            steps.close()
+
+    try:
+        result = await loop.run_in_executor(executor, run)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+    if progress is not None:
+        progress(total, total)
+    return result
@@ -0,0 +1,132 @@
+""" Module that contains a batch API that runs an algorithm over many directed
+graphs on a process pool.
+
+Directed graphs are not pickled as vertex and edge objects. Each of them is
+encoded as a flat tuple of its labels and the offsets and heads arrays of its
+adjacency, the workers run the algorithms directly on that adjacency. Graphs
+are sent to the workers in chunks, results are streamed back in input order
+"""
+
+from collections import deque
+from collections.abc import Mapping
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, \
+    Optional, Tuple
+from . adjacency import Adjacency
+from . import cyclic
+from . import kosaraju_sccs
+
+Encoded = Tuple[List[Any], Any, Any]
+
+
+def encode(graph: Any) -> Encoded:
+    """ Function that encodes a directed graph, or a dict with the vertices
+    and their heads in it, into its flat form
+
+    Args:
+        graph: a DirectedGraph, a DirectedGraphCore or a dict
+
+    Returns:
+        tuple: the labels, and the offsets and heads arrays """
+
+    if isinstance(graph, Mapping):
+        adjacency = Adjacency.from_mapping(graph)
+        labels = adjacency.get_vertices()
+    else:
+        adjacency = graph.get_adjacency()
+        labels = [vertex.get_label() for vertex in adjacency.get_vertices()]
+    return labels, adjacency.get_offsets(), adjacency.get_heads()
+
+
+def decode(encoded: Encoded) -> Adjacency:
+    """ Function that decodes the flat form into an adjacency, of which the
+    vertices are the labels
+
+    Args:
+        encoded(tuple): the flat form
+
+    Returns:
+        Adjacency: the adjacency """
+
+    labels, offsets, heads = encoded
+    return Adjacency(labels, offsets, heads)
+
+
+def _is_cyclic(adjacency: Adjacency) -> bool:
+    return cyclic.is_cyclic_adjacency(adjacency)
+
+
+def _sccs(adjacency: Adjacency) -> List[List[Any]]:
+    labels = adjacency.get_vertices()
+    sccs = kosaraju_sccs.filter_nontrivial(
+        adjacency, kosaraju_sccs.sccs_positions(adjacency))
+    return [[labels[i] for i in scc] for scc in sccs]
+
+
+def _sccs_trivial(adjacency: Adjacency) -> List[List[Any]]:
+    labels = adjacency.get_vertices()
+    return [[labels[i] for i in scc]
+            for scc in kosaraju_sccs.sccs_positions(adjacency)]
+
+
+ALGORITHMS: Dict[str, Callable[[Adjacency], Any]] = {
+    "is_cyclic": _is_cyclic,
+    "sccs": _sccs,
+    "sccs_trivial": _sccs_trivial
+}
+
+
+def _run_chunk(algorithm: str, chunk: List[Encoded]) -> List[Any]:
+    run = ALGORITHMS[algorithm]
+    return [run(decode(encoded)) for encoded in chunk]
+
+
+def run_batch(graphs: Iterable[Any], algorithm: str = "is_cyclic",
+              chunksize: int = 64, max_workers: Optional[int] = None,
+              executor: Optional[Executor] = None) -> Iterator[Any]:
+    """ Function that runs an algorithm over many directed graphs on a
+    process pool and streams the results back in input order. The iterable
+    of graphs is consumed lazily, only a bounded amount of chunks is in
+    flight at any time
+
+    Args:
+        graphs: iterable of DirectedGraph, DirectedGraphCore or dict objects
+        algorithm(str): one of "is_cyclic", "sccs" (the nontrivial SCCs as
+            lists of labels) or "sccs_trivial" (all SCCs)
+        chunksize(int): the amount of graphs that is sent to a worker at once
+        max_workers(int): the amount of worker processes
+        executor(Executor): the executor to use instead of a new process pool
+
+    Returns:
+        iterator: the results, one per graph, in input order """
+
+    if algorithm not in ALGORITHMS:
+        raise RuntimeError(f"algorithm {algorithm} is not supported")
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    in_flight: Deque[Any] = deque()
+    try:
+        chunk: List[Encoded] = list()
+        for graph in graphs:
+            chunk.append(encode(graph))
+            if len(chunk) == chunksize:
+                in_flight.append(executor.submit(_run_chunk, algorithm,
+                                                 chunk))
+                chunk = list()
+                while len(in_flight) >= window:
+                    yield from in_flight.popleft().result()
+        if chunk:
+            in_flight.append(executor.submit(_run_chunk, algorithm, chunk))
+        while in_flight:
+            yield from in_flight.popleft().result()
+    finally:
+        # The chunks that haven't started yet are cancelled when the results
+        # aren't consumed to the end
+        for future in in_flight:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
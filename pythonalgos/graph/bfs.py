@@ -0,0 +1,330 @@
+""" Module that contains a breadth-first search engine on the adjacency of a
+directed graph (https://en.wikipedia.org/wiki/Breadth-first_search).
+
+The search is level synchronous, every level is a frontier array. It is
+direction optimizing: as long as the frontier is small, its edges are followed
+top-down. When the edges of the frontier outnumber the unexplored edges by a
+factor alpha, every unvisited vertex instead looks for a parent in the
+frontier among its in-edges (bottom-up), which stops at the first parent
+found. The search switches back to top-down when the frontier shrinks below
+1/beta of the vertices. The transposed adjacency, which holds the in-edges,
+is only created when it is needed.
+
+The functions on directed graphs keep one engine per directed graph until it
+changes, and search sparsely: the hops are kept per visited vertex, so a
+query that only reaches a few vertices doesn't touch the others. A sparse
+search continues densely once a bottom-up step pays off """
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Set
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . vertex import Vertex
+
+UNVISITED = -1
+ALPHA = 14
+BETA = 24
+
+
+class BreadthFirstSearch(object):
+    """ Class that runs breadth-first searches on an adjacency. The engine can
+    be reused for many searches on the same (unmodified) directed graph, in
+    which case the adjacency and its transpose are created only once """
+
+    def __init__(self, adjacency: Adjacency, alpha: float = ALPHA,
+                 beta: float = BETA):
+        """ Initialises the engine
+
+        Args:
+            adjacency (Adjacency): The adjacency to search
+            alpha(float): The search switches to bottom-up steps when the
+                edges of the frontier times alpha exceed the unexplored edges
+            beta(float): The search switches back to top-down steps when the
+                size of the frontier times beta is below the vertices count
+        """
+
+        self._adjacency = adjacency
+        self._transposed: Optional[Adjacency] = None
+        self._alpha = alpha
+        self._beta = beta
+
+    def get_adjacency(self) -> Adjacency:
+        return self._adjacency
+
+    def get_transposed(self) -> Adjacency:
+        if self._transposed is None:
+            self._transposed = self._adjacency.transpose()
+        return self._transposed
+
+    def distances(self, sources: Iterable[int],
+                  max_hops: Optional[int] = None,
+                  reverse: bool = False) -> array:
+        """ Method that calculates the amount of hops from the nearest source
+        to every position
+
+        Args:
+            sources: The positions to start from
+            max_hops(int): If provided, the search stops after this amount of
+                hops
+            reverse(bool): If True, the edges are followed backwards
+
+        Returns:
+            array: The hops per position, -1 if it can't be reached (within
+                max_hops) """
+
+        adjacency = self.get_transposed() if reverse else self._adjacency
+        hops = array("l", [UNVISITED]) * adjacency.get_vertices_count()
+        frontier = array("l")
+        for source in sources:
+            if hops[source] == UNVISITED:
+                hops[source] = 0
+                frontier.append(source)
+        return self._levels(hops, frontier, 0, adjacency.get_edges_count(),
+                            max_hops, reverse)
+
+    def sparse_distances(self, sources: Iterable[int],
+                         max_hops: Optional[int] = None,
+                         reverse: bool = False) -> Dict[int, int]:
+        """ Method that calculates the amount of hops from the nearest source
+        to the positions that can be reached, see distances. The hops are
+        kept per visited position, as long as the search steps top-down
+
+        Args:
+            sources: The positions to start from
+            max_hops(int): If provided, the search stops after this amount of
+                hops
+            reverse(bool): If True, the edges are followed backwards
+
+        Returns:
+            dict: The hops per reachable position (within max_hops) """
+
+        adjacency = self.get_transposed() if reverse else self._adjacency
+        offsets = adjacency.get_offsets()
+        heads = adjacency.get_heads()
+        hops: Dict[int, int] = dict()
+        frontier = array("l")
+        for source in sources:
+            if source not in hops:
+                hops[source] = 0
+                frontier.append(source)
+
+        unexplored = adjacency.get_edges_count()
+        level = 0
+        while frontier and (max_hops is None or level < max_hops):
+            frontier_edges = 0
+            for vertex in frontier:
+                frontier_edges += offsets[vertex + 1] - offsets[vertex]
+            if frontier_edges * self._alpha > unexplored:
+                dense = array("l", [UNVISITED]) * \
+                    adjacency.get_vertices_count()
+                for vertex, hop in hops.items():
+                    dense[vertex] = hop
+                dense = self._levels(dense, frontier, level, unexplored,
+                                     max_hops, reverse)
+                return {vertex: hop for vertex, hop in enumerate(dense)
+                        if hop != UNVISITED}
+            unexplored -= frontier_edges
+            level += 1
+            next_frontier = array("l")
+            for vertex in frontier:
+                for i in range(offsets[vertex], offsets[vertex + 1]):
+                    head = heads[i]
+                    if head not in hops:
+                        hops[head] = level
+                        next_frontier.append(head)
+            frontier = next_frontier
+        return hops
+
+    def _levels(self, hops: array, frontier: array, level: int,
+                unexplored: int, max_hops: Optional[int],
+                reverse: bool) -> array:
+        """ Method that visits the levels after the frontier, which is at the
+        given level, stepping top-down or bottom-up """
+
+        adjacency = self.get_transposed() if reverse else self._adjacency
+        n = adjacency.get_vertices_count()
+        offsets = adjacency.get_offsets()
+        heads = adjacency.get_heads()
+        bottom_up = False
+        while frontier and (max_hops is None or level < max_hops):
+            frontier_edges = 0
+            for vertex in frontier:
+                frontier_edges += offsets[vertex + 1] - offsets[vertex]
+            if bottom_up:
+                bottom_up = len(frontier) * self._beta >= n
+            else:
+                bottom_up = frontier_edges * self._alpha > unexplored
+            unexplored -= frontier_edges
+            level += 1
+            if bottom_up:
+                frontier = self._bottom_up_step(hops, frontier, level,
+                                                reverse)
+            else:
+                next_frontier = array("l")
+                for vertex in frontier:
+                    for i in range(offsets[vertex], offsets[vertex + 1]):
+                        head = heads[i]
+                        if hops[head] == UNVISITED:
+                            hops[head] = level
+                            next_frontier.append(head)
+                frontier = next_frontier
+        return hops
+
+    def _bottom_up_step(self, hops: array, frontier: array, level: int,
+                        reverse: bool) -> array:
+        """ Method that visits the next level by letting every unvisited
+        position look for a parent in the frontier among its in-edges """
+
+        backward = self._adjacency if reverse else self.get_transposed()
+        offsets = backward.get_offsets()
+        heads = backward.get_heads()
+        n = backward.get_vertices_count()
+        in_frontier = bytearray(n)
+        for vertex in frontier:
+            in_frontier[vertex] = 1
+        next_frontier = array("l")
+        for vertex in range(n):
+            if hops[vertex] == UNVISITED:
+                for i in range(offsets[vertex], offsets[vertex + 1]):
+                    if in_frontier[heads[i]]:
+                        hops[vertex] = level
+                        next_frontier.append(vertex)
+                        break
+        return next_frontier
+
+    def shortest_path(self, source: int, target: int) -> Optional[array]:
+        """ Method that calculates a path with the fewest edges from the
+        source to the target, by searching forward from the source and
+        backward from the target. The side with the fewest frontier edges is
+        expanded, the search stops at the level at which both sides meet
+
+        Args:
+            source(int): The position of the source
+            target(int): The position of the target
+
+        Returns:
+            array: The positions on the path, or None if there is no path """
+
+        if source == target:
+            return array("l", [source])
+        forward = self._adjacency
+        backward = self.get_transposed()
+        parents: List[Dict[int, int]] = [{source: UNVISITED},
+                                         {target: UNVISITED}]
+        frontiers = [array("l", [source]), array("l", [target])]
+        sides = [forward, backward]
+        while frontiers[0] and frontiers[1]:
+            costs = [0, 0]
+            for side in (0, 1):
+                offsets = sides[side].get_offsets()
+                for vertex in frontiers[side]:
+                    costs[side] += offsets[vertex + 1] - offsets[vertex]
+            side = 0 if costs[0] <= costs[1] else 1
+            offsets = sides[side].get_offsets()
+            heads = sides[side].get_heads()
+            own, other = parents[side], parents[1 - side]
+            next_frontier = array("l")
+            for vertex in frontiers[side]:
+                for i in range(offsets[vertex], offsets[vertex + 1]):
+                    head = heads[i]
+                    if head not in own:
+                        own[head] = vertex
+                        if head in other:
+                            return _join(parents, head)
+                        next_frontier.append(head)
+            frontiers[side] = next_frontier
+        return None
+
+
+def _join(parents: List[Dict[int, int]], meeting: int) -> array:
+    """ Function that joins the forward and backward half of a path, which
+    meet at a position """
+
+    path = array("l")
+    vertex = meeting
+    while vertex != UNVISITED:
+        path.append(vertex)
+        vertex = parents[0][vertex]
+    path.reverse()
+    vertex = parents[1][meeting]
+    while vertex != UNVISITED:
+        path.append(vertex)
+        vertex = parents[1][vertex]
+    return path
+
+
+def search_engine(directed_graph: DirectedGraphCore) -> BreadthFirstSearch:
+    """ Function that returns the search engine of the directed graph, which
+    is kept until the directed graph changes
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+
+    Returns:
+        BreadthFirstSearch: The engine on the adjacency of the directed
+            graph """
+
+    return directed_graph.get_derived(
+        "bfs", lambda: BreadthFirstSearch(directed_graph.get_adjacency()))
+
+
+def hop_distances(directed_graph: DirectedGraphCore, source: Any,
+                  max_hops: Optional[int] = None) -> Dict[Vertex, int]:
+    """ Function that calculates the amount of hops from a source vertex to
+    the vertices that can be reached from it
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        source: The label of the source vertex
+        max_hops(int): If provided, only vertices within this amount of hops
+            are included
+
+    Returns:
+        dict: The hops per reachable vertex, 0 for the source """
+
+    engine = search_engine(directed_graph)
+    adjacency = engine.get_adjacency()
+    hops = engine.sparse_distances(
+        [adjacency.get_position(directed_graph.get_vertex(source))], max_hops)
+    vertices = adjacency.get_vertices()
+    return {vertices[i]: hop for i, hop in hops.items()}
+
+
+def k_hop(directed_graph: DirectedGraphCore, source: Any,
+          k: int) -> Set[Vertex]:
+    """ Function that calculates the k-hop neighbourhood of a source vertex
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        source: The label of the source vertex
+        k(int): The maximum amount of hops
+
+    Returns:
+        set: The vertices that can be reached in at most k hops, including
+            the source itself """
+
+    return set(hop_distances(directed_graph, source, k))
+
+
+def shortest_unweighted_path(directed_graph: DirectedGraphCore, source: Any,
+                             target: Any) -> Optional[List[Vertex]]:
+    """ Function that calculates a path with the fewest edges between two
+    vertices, with a bidirectional breadth-first search
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        source: The label of the source vertex
+        target: The label of the target vertex
+
+    Returns:
+        list: The vertices on the path, or None if there is no path """
+
+    engine = search_engine(directed_graph)
+    adjacency = engine.get_adjacency()
+    path = engine.shortest_path(
+        adjacency.get_position(directed_graph.get_vertex(source)),
+        adjacency.get_position(directed_graph.get_vertex(target)))
+    if path is None:
+        return None
+    vertices = adjacency.get_vertices()
+    return [vertices[i] for i in path]
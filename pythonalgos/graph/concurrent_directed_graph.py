@@ -0,0 +1,141 @@
+""" Module that contains an opt-in thread-safe wrapper around a directed graph,
+for services that mutate a shared directed graph from one thread while other
+threads run algorithms on it
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Mapping, Optional, Set, Tuple
+from . directed_graph import DirectedGraph
+from . result_cache import ResultCache
+from . views import DirectedGraphCoreView, DirectedGraphView
+from . vertex import Vertex
+from .. util.advisor import Advisor
+from .. util.rwlock import ReadWriteLock
+
+
+class ConcurrentDirectedGraph(object):
+    """ Class that guards a directed graph with a reader-writer lock.
+
+    Algorithms run under the read lock, so they never block each other.
+    Mutations are collected in a write batch and applied under the write lock
+    in one go. Alternatively, readers can take a read-only snapshot, which is
+    created at most once per write batch and is read without any locking.
+    Every applied write batch starts a new generation, a snapshot is only
+    handed out for the generation in which it was copied """
+
+    def __init__(self, vertices: Mapping[Any, List[Any]] = None):
+        """ Initialises the thread-safe directed graph
+
+        Args:
+            vertices(dict): a dict with the vertices and their tails in it
+        """
+
+        self._directed_graph = DirectedGraph(vertices)
+        self._lock = ReadWriteLock()
+        self._generation = 0
+        self._snapshot: Optional[Tuple[int, DirectedGraphView]] = None
+
+    @contextmanager
+    def read(self) -> Iterator[DirectedGraph]:
+        """ Context manager that gives read access to the directed graph. The
+        directed graph must not be mutated inside the context
+
+        Yields:
+            DirectedGraph: the guarded directed graph """
+
+        with self._lock.read_locked():
+            yield self._directed_graph
+
+    @contextmanager
+    def write(self) -> Iterator[WriteBatch]:
+        """ Context manager that collects mutations in a batch. The batch is
+        applied under the write lock when the context is left without an
+        exception, otherwise it is discarded
+
+        Yields:
+            WriteBatch: the batch to which mutations are added """
+
+        batch = WriteBatch()
+        yield batch
+        with self._lock.write_locked():
+            batch.apply(self._directed_graph)
+            self._generation += 1
+            self._snapshot = None
+
+    def snapshot(self) -> DirectedGraphView:
+        """ Returns a read-only snapshot of the directed graph, a view on a
+        copy of it that raises on mutations. The snapshot is shared between
+        readers. A new snapshot is only created after a write batch has been
+        applied. The snapshot is published while the read lock is held, so a
+        write batch can't be applied between copying and publishing it
+
+        Returns:
+            DirectedGraphView: the snapshot """
+
+        published = self._snapshot
+        if published is not None and published[0] == self._generation:
+            return published[1]
+        with self._lock.read_locked():
+            published = self._snapshot
+            if published is None or published[0] != self._generation:
+                copy = self._directed_graph.copy()
+                published = (self._generation, DirectedGraphView(
+                    DirectedGraphCoreView(copy.get_direct_graph_core())))
+                self._snapshot = published
+            return published[1]
+
+    def is_cyclic(self, advisor: Advisor = Advisor(),
+                  cache: Optional[ResultCache] = None) -> bool:
+        with self._lock.read_locked():
+            return self._directed_graph.is_cyclic(advisor, cache)
+
+    def create_sccs_kosaraju_dfs(
+            self, nontrivial: bool = True,
+            advisor: Advisor = Advisor(),
+            cache: Optional[ResultCache] = None) -> List[Set[Vertex]]:
+        with self._lock.read_locked():
+            return self._directed_graph.create_sccs_kosaraju_dfs(nontrivial,
+                                                                advisor, cache)
+
+    def fingerprint(self, labels: bool = False) -> str:
+        with self._lock.read_locked():
+            return self._directed_graph.fingerprint(labels)
+
+    def trail(self, advisor: Advisor = Advisor()):
+        with self._lock.read_locked():
+            return self._directed_graph.trail(advisor)
+
+    def get_vertices_count(self) -> int:
+        with self._lock.read_locked():
+            return self._directed_graph.get_vertices_count()
+
+
+class WriteBatch(object):
+    """ Class that collects mutations of a directed graph, identified by
+    labels, so that they can be applied under a single write lock """
+
+    def __init__(self):
+        self._vertices: List[Any] = list()
+        self._edges: List[Tuple[Any, Any]] = list()
+
+    def add_vertex(self, label: Any):
+        self._vertices.append(label)
+
+    def add_edge(self, tail: Any, head: Any):
+        """ Adds an edge, tail and head are labels of vertices that are
+        either in the directed graph already, or added in this batch """
+
+        self._edges.append((tail, head))
+
+    def apply(self, directed_graph: DirectedGraph):
+        """ Applies the mutations to the directed graph, in one transaction
+
+        Args:
+            directed_graph: the directed graph to mutate """
+
+        with directed_graph.transaction() as transaction:
+            for label in self._vertices:
+                transaction.add_vertex(label)
+            for tail, head in self._edges:
+                transaction.add_edge(tail, head)
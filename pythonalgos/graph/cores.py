@@ -0,0 +1,98 @@
+""" Module that contains the logic for the k-core decomposition of a directed
+graph with the bucket queue algorithm of Batagelj and Zaversnik
+(https://en.wikipedia.org/wiki/Degeneracy_(graph_theory))
+
+The k-core is the largest subgraph in which every vertex has a degree of at
+least k within the subgraph, the core number of a vertex is the largest k for
+which it is part of the k-core. The degree is the indegree, the outdegree or
+their sum (the total degree). The vertices are bucket sorted by degree once,
+every vertex is then moved to a lower bucket in O(1) when a neighbour is
+removed, which makes the decomposition O(V + E). Self-loops don't count """
+
+from array import array
+from typing import Dict
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . vertex import Vertex
+
+MODES = ["in", "out", "total"]
+
+
+def core_numbers(directed_graph: DirectedGraphCore,
+                 mode: str = "total") -> Dict[Vertex, int]:
+    """ Function that calculates the core number of every vertex
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        mode(str): The degree to use, "in", "out" or "total"
+
+    Returns:
+        dict: The core number per vertex """
+
+    adjacency = directed_graph.get_adjacency()
+    cores = core_positions(adjacency, mode)
+    return {vertex: cores[i]
+            for i, vertex in enumerate(adjacency.get_vertices())}
+
+
+def core_positions(adjacency: Adjacency, mode: str = "total") -> array:
+    """ Function that calculates the core number of every position
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        mode(str): The degree to use, "in", "out" or "total"
+
+    Returns:
+        array: The core number per position """
+
+    if mode not in MODES:
+        raise RuntimeError(f"Unknown degree mode {mode}")
+    n = adjacency.get_vertices_count()
+    sides = list()
+    if mode in ("in", "total"):
+        sides.append(adjacency)
+    if mode in ("out", "total"):
+        sides.append(adjacency.transpose())
+
+    # The vertices lose degree along the edges of the sides: removing a
+    # vertex lowers the indegree of its heads and the outdegree of its tails
+    degrees = array("l", [0]) * n
+    for side in sides:
+        offsets, heads = side.get_offsets(), side.get_heads()
+        for tail in range(n):
+            for i in range(offsets[tail], offsets[tail + 1]):
+                if heads[i] != tail:
+                    degrees[heads[i]] += 1
+
+    highest = max(degrees, default=0)
+    starts = array("l", [0]) * (highest + 2)
+    for degree in degrees:
+        starts[degree + 1] += 1
+    for degree in range(highest + 1):
+        starts[degree + 1] += starts[degree]
+    order = array("l", [0]) * n
+    places = array("l", [0]) * n
+    cursors = array("l", starts)
+    for vertex in range(n):
+        places[vertex] = cursors[degrees[vertex]]
+        order[places[vertex]] = vertex
+        cursors[degrees[vertex]] += 1
+
+    for i in range(n):
+        vertex = order[i]
+        degree = degrees[vertex]
+        for side in sides:
+            offsets, heads = side.get_offsets(), side.get_heads()
+            for j in range(offsets[vertex], offsets[vertex + 1]):
+                neighbour = heads[j]
+                neighbour_degree = degrees[neighbour]
+                if neighbour_degree > degree:
+                    first = starts[neighbour_degree]
+                    other = order[first]
+                    if other != neighbour:
+                        place = places[neighbour]
+                        order[first], order[place] = neighbour, other
+                        places[neighbour], places[other] = first, place
+                    starts[neighbour_degree] += 1
+                    degrees[neighbour] = neighbour_degree - 1
+    return degrees
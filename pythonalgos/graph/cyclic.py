@@ -5,84 +5,187 @@ Calls to advice insertions are included at join-points. These calls belong to a
 abstract class Advisor, which must be implemented by interested parties """
 
 from .. util.advisor import Advisor
+from .. util.steps import run_steps, Steps, STEP_SIZE
+from . adjacency import Adjacency
 from . directed_graph_core import DirectedGraphCore
+from . edge import Edge
 from . vertex import Vertex
-from typing import MutableMapping
+from typing import Dict, Iterable, Iterator, List
+
+NOT_VISITED = 0
+IN_CYCLE = 1
+DONE = 2
 
 
 def is_cyclic(directed_graph: DirectedGraphCore, advisor: Advisor):
     """ Function that checks whether a directed graph contains a cycle or not
 
+    The directed graph is searched depth first, iteratively. The state of the
+    search is kept in a per-call bytearray that is indexed by the dense
+    positions of the adjacency of the directed graph, the directed graph
+    itself is not modified.
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        advisor(Advisor): Object that contains advice which can be inserted at
+            join points
+
+    Returns:
+        bool: True if the directed graph contains a cycle, otherwise False """
+
+    return run_steps(is_cyclic_steps(directed_graph, advisor))
+
+
+def is_cyclic_steps(directed_graph: DirectedGraphCore, advisor: Advisor,
+                    step_size: int = STEP_SIZE) -> Steps:
+    """ Step generator version of is_cyclic, it yields the amount of vertices
+    that were visited after every step_size vertices
+
     Args:
         directed_graph (DirectedGraph): The directed graph
         advisor(Advisor): Object that contains advice which can be inserted at
             join points
+        step_size(int): The amount of vertices to visit between yields
 
     Returns:
         bool: True if the directed graph contains a cycle, otherwise False """
 
-    def _is_cyclic_dfs(vertex: Vertex,
-                       visited_already: MutableMapping[Vertex, bool],
-                       in_cycle: MutableMapping[Vertex, bool]):
-        """ Function that recursively searches the directed graph depth first
-        and checks if a vertex was already in_cycle before.
-
-        It checks all vertices that have not been traversed before. The heads
-        of those
-        vertices are followed. If in that traversal, a vertex is found that is
-        present in the dict "in_cycle" with a value of true, then a cycle is
-        present
-
-        Args:
-            vertex(Vertex): The current vertex
-            visited_already (dict): A dictionary that maintains whether
-                vertices have been traversed already. It's a performance
-                measure put in place in order to shortcut processing if a
-                vertex was already processed by another subtree in_cycle
-                (list): A list that, if a vertex has been found to part be
-                part of cycle, for that vertex, has a value of true. If
-                that vertex is not part of a cycle, it's value is false
-
-        Returns:
-            bool: True if the vertex was in_cycle before, False otherwise """
-
-        visited_already[vertex] = True
-        in_cycle[vertex] = True
-        advisor.advise("visit_vertex", directed_graph, vertex)
-
-        for edge in vertex.get_edges():
-            if visited_already.get(edge.get_head()) is None:
-                if _is_cyclic_dfs(edge.get_head(),
-                                  visited_already, in_cycle):
-                    advisor.advise("cycle_reported_recursive", directed_graph,
-                                   edge.get_head())
-                    return True
-                else:
+    adjacency = directed_graph.get_adjacency()
+    yield 0
+    return (yield from is_cyclic_adjacency_steps(adjacency, directed_graph,
+                                                 advisor, step_size))
+
+
+def is_cyclic_adjacency(adjacency: Adjacency, directed_graph=None,
+                        advisor: Advisor = None) -> bool:
+    """ Function that checks whether an adjacency contains a cycle or not
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        directed_graph (DirectedGraph): The directed graph, passed to advice
+        advisor(Advisor): Object that contains advice, optional
+
+    Returns:
+        bool: True if the adjacency contains a cycle, otherwise False """
+
+    return run_steps(is_cyclic_adjacency_steps(adjacency, directed_graph,
+                                               advisor))
+
+
+def is_cyclic_adjacency_steps(adjacency: Adjacency, directed_graph=None,
+                              advisor: Advisor = None,
+                              step_size: int = STEP_SIZE) -> Steps:
+    """ Step generator version of is_cyclic_adjacency
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        directed_graph (DirectedGraph): The directed graph, passed to advice
+        advisor(Advisor): Object that contains advice, optional
+        step_size(int): The amount of vertices to visit between yields
+
+    Returns:
+        bool: True if the adjacency contains a cycle, otherwise False """
+
+    vertices = adjacency.get_vertices()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    edges = adjacency.get_edges()
+
+    # A vertex is NOT_VISITED, IN_CYCLE (on the current path of the depth
+    # first search), or DONE
+    state = bytearray(len(vertices))
+    visited = 0
+    for start in range(len(vertices)):
+        if state[start] != NOT_VISITED:
+            continue
+
+        state[start] = IN_CYCLE
+        if advisor is not None:
+            advisor.advise("visit_vertex", directed_graph, vertices[start])
+        visited += 1
+        if visited % step_size == 0:
+            yield visited
+        path: List[int] = [start]
+        cursors: List[int] = [offsets[start]]
+        while path:
+            vertex = path[-1]
+            cursor = cursors[-1]
+            if cursor == offsets[vertex + 1]:
+                state[vertex] = DONE
+                path.pop()
+                cursors.pop()
+                if path and advisor is not None:
                     advisor.advise("no_cycle_reported_recursive",
-                                   directed_graph, vertex)
-            elif in_cycle[edge.get_head()]:
-                advisor.advise("cycle_found", directed_graph, vertex,
-                               edge.get_head())
+                                   directed_graph, vertices[path[-1]])
+                continue
+
+            cursors[-1] = cursor + 1
+            head = heads[cursor]
+            if state[head] == NOT_VISITED:
+                state[head] = IN_CYCLE
+                if advisor is not None:
+                    advisor.advise("visit_vertex", directed_graph,
+                                   vertices[head])
+                path.append(head)
+                cursors.append(offsets[head])
+                visited += 1
+                if visited % step_size == 0:
+                    yield visited
+            elif state[head] == IN_CYCLE:
+                if advisor is not None:
+                    advisor.advise("cycle_found", directed_graph,
+                                   vertices[vertex], vertices[head])
+                    for i in range(len(path) - 1, 0, -1):
+                        advisor.advise("cycle_reported_recursive",
+                                       directed_graph, vertices[path[i]])
                 return True
-            elif visited_already.get(edge.get_head().get_label()):
-                advisor.advise("vertex_already_visited", directed_graph, edge)
+            elif advisor is not None:
+                advisor.advise("vertex_already_visited", directed_graph,
+                               edges[cursor])
 
-        in_cycle[vertex] = False
-        return False
+    return False
 
-    def _is_cyclic_inner():
-        """ Main function that loops through the vertices and starts
-        the traversal for each vertex."""
 
-        visited_already: MutableMapping[Vertex, bool] = dict()
-        in_cycle: MutableMapping[Vertex, bool] = {
-            vertex: False for vertex in directed_graph.get_vertices()}
-        for vertex in directed_graph.get_vertices():
-            if vertex not in visited_already:
-                if _is_cyclic_dfs(vertex, visited_already,
-                                  in_cycle):
-                    return True
+def is_cyclic_from(directed_graph: DirectedGraphCore,
+                   vertices: Iterable[Vertex]) -> bool:
+    """ Function that checks whether a cycle can be reached from the provided
+    vertices. Only the vertices that can be reached from them are visited, so
+    the cost is proportional to that region of the directed graph, not to the
+    whole directed graph. After adding edges to an acyclic directed graph, a
+    new cycle must run through an added edge, so it suffices to check from the
+    heads of the added edges
 
-        return False
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        vertices: The vertices to start the depth first search from
+
+    Returns:
+        bool: True if a cycle can be reached, otherwise False """
+
+    # The region is sparse compared to the directed graph, so the state is
+    # kept in a dict keyed by vertex id rather than in a bytearray
+    state: Dict[int, int] = dict()
+    for start in vertices:
+        if start.get_id() in state:
+            continue
+
+        state[start.get_id()] = IN_CYCLE
+        path: List[Vertex] = [start]
+        iterators: List[Iterator[Edge]] = [iter(start.get_edges())]
+        while path:
+            edge = next(iterators[-1], None)
+            if edge is None:
+                state[path.pop().get_id()] = DONE
+                iterators.pop()
+                continue
+
+            head = edge.get_head()
+            head_state = state.get(head.get_id(), NOT_VISITED)
+            if head_state == NOT_VISITED:
+                state[head.get_id()] = IN_CYCLE
+                path.append(head)
+                iterators.append(iter(head.get_edges()))
+            elif head_state == IN_CYCLE:
+                return True
 
-    return _is_cyclic_inner()
+    return False
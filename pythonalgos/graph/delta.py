@@ -0,0 +1,170 @@
+""" Module that contains deltas of directed graphs: compactly encoded batches
+of changes, to keep replicas of a directed graph in sync in time proportional
+to the changes instead of the size of the directed graph.
+
+Vertices are identified by their dense ids, which are equal on a directed
+graph and its replicas as long as the same changes are applied to both in
+the same order. A delta stores an operation code per change, the integer
+arguments of the changes in a flat array and the labels of the added
+vertices in a list. Vertex and edge attributes are not part of deltas """
+
+from __future__ import annotations
+from array import array
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from . directed_graph_core import DirectedGraphCore
+
+ADD_VERTEX = 0
+ADD_EDGE = 1
+REMOVE_EDGE = 2
+REMOVE_VERTICES_FROM = 3
+REVERSE = 4
+
+ARGUMENTS = {ADD_VERTEX: 0, ADD_EDGE: 2, REMOVE_EDGE: 2,
+             REMOVE_VERTICES_FROM: 1, REVERSE: 0}
+
+
+class Delta(object):
+    """ Class that represents an append-only batch of changes to a directed
+    graph """
+
+    def __init__(self):
+        self._operations = array("B")
+        self._arguments = array("q")
+        self._labels: List[Any] = list()
+
+    def add_vertex(self, label: Any):
+        self._operations.append(ADD_VERTEX)
+        self._labels.append(label)
+
+    def add_edge(self, tail_id: int, head_id: int):
+        self._operations.append(ADD_EDGE)
+        self._arguments.append(tail_id)
+        self._arguments.append(head_id)
+
+    def remove_edge(self, tail_id: int, head_id: int):
+        self._operations.append(REMOVE_EDGE)
+        self._arguments.append(tail_id)
+        self._arguments.append(head_id)
+
+    def remove_vertices_from(self, vertex_id: int):
+        self._operations.append(REMOVE_VERTICES_FROM)
+        self._arguments.append(vertex_id)
+
+    def reverse(self):
+        self._operations.append(REVERSE)
+
+    def extend(self, delta: Delta):
+        """ Appends the changes of another delta to this delta
+
+        Args:
+            delta (Delta): the delta with the later changes """
+
+        self._operations.extend(delta._operations)
+        self._arguments.extend(delta._arguments)
+        self._labels.extend(delta._labels)
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def apply(self, directed_graph: DirectedGraphCore):
+        """ Applies the changes to a replica of the directed graph on which
+        they were recorded. The invariants of subclasses of the directed
+        graph are not checked again
+
+        Args:
+            directed_graph (DirectedGraphCore): the replica """
+
+        arguments = self._arguments
+        labels = iter(self._labels)
+        a = 0
+        for operation in self._operations:
+            if operation == ADD_VERTEX:
+                directed_graph.create_add_vertex(next(labels))
+            elif operation == ADD_EDGE:
+                directed_graph.add_edge(
+                    directed_graph.get_vertex_by_id(arguments[a]),
+                    directed_graph.get_vertex_by_id(arguments[a + 1]))
+            elif operation == REMOVE_EDGE:
+                directed_graph.remove_edge(_find_edge(
+                    directed_graph, arguments[a], arguments[a + 1]))
+            elif operation == REMOVE_VERTICES_FROM:
+                directed_graph.remove_vertices_from(arguments[a])
+            elif operation == REVERSE:
+                directed_graph.reversed(inplace=True)
+            else:
+                raise RuntimeError(f"Unknown delta operation {operation}")
+            a += ARGUMENTS[operation]
+
+
+def diff(old: DirectedGraphCore, new: DirectedGraphCore) -> Delta:
+    """ Function that calculates the delta that turns one directed graph
+    into another, vertices are matched by label. Later deltas that are
+    recorded on the new directed graph address vertices by id, so applying
+    the delta must give every vertex its id in the new directed graph: the
+    vertices that are in both must have the same id in both, the missing
+    vertices are added in the order of their ids in the new directed graph.
+    Vertices can only be removed if they have the highest ids of the old
+    directed graph
+
+    Args:
+        old (DirectedGraphCore): the directed graph to change
+        new (DirectedGraphCore): the directed graph to change it into
+
+    Returns:
+        Delta: the delta to apply to the old directed graph """
+
+    delta = Delta()
+    old_ids: Dict[Any, int] = {vertex.get_label(): vertex.get_id()
+                               for vertex in old.get_vertices()}
+    removed = [vertex_id for label, vertex_id in old_ids.items()
+               if not new.has_vertex(label)]
+    first_removed = old.get_vertices_count() - len(removed)
+    if removed and min(removed) != first_removed:
+        raise RuntimeError("Only the vertices with the highest ids can be "
+                           "removed by a delta")
+
+    new_ids: Dict[Any, int] = dict()
+    added: List[Any] = list()
+    for vertex in sorted(new.get_vertices(), key=lambda v: v.get_id()):
+        label = vertex.get_label()
+        new_ids[label] = vertex.get_id()
+        if label not in old_ids:
+            added.append(label)
+        elif old_ids[label] != vertex.get_id():
+            raise RuntimeError(f"Vertex = {label} has id {old_ids[label]} "
+                               f"in the old directed graph and id "
+                               f"{vertex.get_id()} in the new one")
+
+    old_edges, new_edges = _edge_counts(old), _edge_counts(new)
+    for (tail, head), amount in (old_edges - new_edges).items():
+        for _ in range(amount):
+            delta.remove_edge(old_ids[tail], old_ids[head])
+    if removed:
+        delta.remove_vertices_from(first_removed)
+    for label in added:
+        delta.add_vertex(label)
+    for (tail, head), amount in (new_edges - old_edges).items():
+        for _ in range(amount):
+            delta.add_edge(new_ids[tail], new_ids[head])
+    return delta
+
+
+def _edge_counts(directed_graph: DirectedGraphCore) -> Counter:
+    """ Function that counts the edges per pair of labels """
+
+    return Counter((edge.get_tail().get_label(), edge.get_head().get_label())
+                   for vertex in directed_graph.get_vertices()
+                   for edge in vertex.get_edges())
+
+
+def _find_edge(directed_graph: DirectedGraphCore, tail_id: int,
+               head_id: int):
+    head = directed_graph.get_vertex_by_id(head_id)
+    for edge in directed_graph.get_vertex_by_id(tail_id).get_edges():
+        if edge.get_head() is head:
+            return edge
+    raise RuntimeError(f"There is no edge from vertex id {tail_id} to vertex "
+                       f"id {head_id}")
@@ -1,7 +1,10 @@
 """ Module that contains the definition of a directed acyclic graph
 """
 
+from __future__ import annotations
 from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph import cyclic
+from pythonalgos.graph.edge import Edge
 from typing import Any, List, Mapping
 
 
@@ -9,7 +12,7 @@ class DirectedAcyclicGraph(DirectedGraph):
     """ Class to represent a directed acyclic graph. It inherits from
     DirectedGraph and when calling the __init__ constructor, it will check
     whether the graph adheres to the fact that the graph doesn't contain a
-    cycle """
+    cycle. Edges that are added later on are checked as well """
 
     def __init__(self, vertices: Mapping[Any, List[Any]]):
         """ Initializer that calls the super() initializer and then performs
@@ -18,3 +21,64 @@ class DirectedAcyclicGraph(DirectedGraph):
         super().__init__(vertices)
         if super().is_cyclic():
             raise RuntimeError("Directed graph has a cycle")
+
+    def add_edge(self, tail: Any, head: Any) -> Edge:
+        """ Adds an edge to the graph, unless it would create a cycle, in
+        which case a RuntimeError is raised
+
+        Args:
+            tail: the edge that represents the start vertex
+            head: the edge that represents the destination vertex
+
+        Returns:
+            Edge: the added edge """
+
+        edge = super().add_edge(tail, head)
+        try:
+            self.check_added_edges([edge])
+        except RuntimeError:
+            self.directed_graph.remove_edge(edge)
+            raise
+        return edge
+
+    def check_added_edges(self, edges: List[Edge]):
+        """ Method that checks that the added edges didn't create a cycle. A
+        new cycle must run through one of the added edges, so only the part
+        of the directed graph that can be reached from their heads is checked
+
+        Args:
+            edges: the added edges """
+
+        if cyclic.is_cyclic_from(self.directed_graph,
+                                 [edge.get_head() for edge in edges]):
+            raise RuntimeError("Directed graph has a cycle")
+
+    def transitive_reduction(self) -> DirectedAcyclicGraph:
+        """ Method that calculates the transitive reduction, the directed
+        acyclic graph with the fewest edges that has the same reachability.
+        Vertex and edge attributes are kept
+
+        Returns:
+            DirectedAcyclicGraph: the transitive reduction, a new graph """
+
+        from pythonalgos.graph import transitive
+        reduction = self.copy()
+        core = reduction.get_direct_graph_core()
+        for edge in transitive.redundant_edges(core):
+            core.remove_edge(edge)
+        return reduction
+
+    def transitive_closure(self) -> DirectedAcyclicGraph:
+        """ Method that calculates the transitive closure, the directed
+        acyclic graph with an edge from every vertex to every vertex it can
+        reach. Vertex and edge attributes are kept
+
+        Returns:
+            DirectedAcyclicGraph: the transitive closure, a new graph """
+
+        from pythonalgos.graph import transitive
+        closure = self.copy()
+        core = closure.get_direct_graph_core()
+        for tail, head in transitive.missing_closure_edges(core):
+            core.add_edge(tail, head)
+        return closure
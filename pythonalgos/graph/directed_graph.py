@@ -1,17 +1,31 @@
 from __future__ import annotations
 from . vertex import Vertex
-from . import kosaraju_sccs
-from . import cyclic as cyclic
-from . import directed_trail as trail
 from . directed_graph_core import DirectedGraphCore
+from array import array
 from copy import deepcopy
 from .. util.advisor import Advisor
-from typing import Any, List, Mapping, Set, Collection
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterable, \
+    Iterator, List, Mapping, Optional, Set, Tuple, Union
 from . edge import Edge
 from . algorithm_ordering import AlgorithmOrdering
+from . adjacency import Adjacency
+from . transaction import Transaction
+from . delta import Delta
+from . stats import GraphStats
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ThreadPoolExecutor
+    from . asynchronous import Progress
+    from . dominators import DominatorTree
+    from . partition import Partition
+    from . result_cache import ResultCache
+    from . shortest_paths import ShortestPaths
 
-""" Module that contains the definition of a directed graph as a class """
+
+""" Module that contains the definition of a directed graph as a class. The
+algorithm modules are imported when an algorithm is first run, which keeps
+importing the directed graph fast """
 
 
 class DirectedGraph(object):
@@ -48,6 +62,21 @@ class DirectedGraph(object):
 
         return self.directed_graph.get_vertex(label)
 
+    def has_vertex(self, label: Any) -> bool:
+        return self.directed_graph.has_vertex(label)
+
+    def get_vertex_by_id(self, vertex_id: int) -> Vertex:
+        """ Returns the vertex with the dense integer id
+
+        Args:
+            vertex_id: the id of the vertex
+
+        Returns:
+            The vertex object
+        """
+
+        return self.directed_graph.get_vertex_by_id(vertex_id)
+
     def add_vertex(self, label: Any):
         """ Adds a vertex to the dictionary of vertices
 
@@ -70,9 +99,90 @@ class DirectedGraph(object):
 
         Args:
             tail: the edge that represents the start vertex
-            head: the edge that represents the destination vertex """
+            head: the edge that represents the destination vertex
+
+        Returns:
+            Edge: the added edge """
+
+        return self.directed_graph.add_edge(tail, head)
+
+    def add_edges_batch(self, edges: Iterable[Tuple[Any, Any]]) -> List[Edge]:
+        """ Adds a batch of edges, identified by the labels of their tail and
+        head, in one transaction. Missing vertices are created. If the
+        directed graph rejects the batch, none of it is added
+
+        Args:
+            edges: iterable of (tail, head) label pairs
+
+        Returns:
+            list: the added edges """
+
+        with self.transaction() as batch:
+            for tail, head in edges:
+                batch.add_edge(tail, head)
+        return batch.get_added_edges()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """ Context manager that collects vertices and edges and adds them
+        when the context is left without an exception. The invariant of the
+        directed graph is checked once for the whole batch
+
+        Yields:
+            Transaction: the transaction to add vertices and edges to """
+
+        batch = Transaction(self)
+        yield batch
+        batch.commit()
+
+    def check_added_edges(self, edges: List[Edge]):
+        """ Method that is called after a batch of edges has been added, which
+        raises a RuntimeError if the directed graph doesn't adhere to its
+        invariant anymore. A directed graph has no invariant to check
+
+        Args:
+            edges: the added edges """
+
+        pass
+
+    def record_deltas(self, enabled: bool = True):
+        """ Starts or stops recording the changes to the directed graph, so
+        that they can be applied to replicas
+
+        Args:
+            enabled(bool): if True, the changes from now on are recorded """
+
+        self.directed_graph.record_deltas(enabled)
+
+    def take_delta(self) -> Delta:
+        """ Returns the changes that were recorded since the previous call
+
+        Returns:
+            Delta: the recorded changes """
+
+        return self.directed_graph.take_delta()
+
+    def apply_delta(self, delta: Delta):
+        """ Applies changes that were recorded on another directed graph, of
+        which this directed graph is a replica
+
+        Args:
+            delta (Delta): the changes """
+
+        delta.apply(self.directed_graph)
+
+    def diff(self, other: DirectedGraph) -> Delta:
+        """ Calculates the changes that turn this directed graph into another
+        directed graph, vertices are matched by label
+
+        Args:
+            other (DirectedGraph): the directed graph to turn this one into
+
+        Returns:
+            Delta: the changes """
 
-        self.directed_graph.add_edge(tail, head)
+        from . import delta
+        return delta.diff(self.directed_graph, other.get_direct_graph_core())
 
     def get_edges(self) -> Set[Edge]:
         """ Method that retrieves all edges of all vertices
@@ -82,15 +192,36 @@ class DirectedGraph(object):
 
         return self.directed_graph.get_edges()
 
+    def get_edges_count(self) -> int:
+        return self.directed_graph.get_edges_count()
+
+    def stats(self) -> GraphStats:
+        """ Returns the statistics of the directed graph: the amount of
+        vertices and edges, the sources, the sinks and the degree histograms
+
+        Returns:
+            GraphStats: the statistics """
+
+        return self.directed_graph.stats()
+
     def get_vertices_count(self) -> int:
         return self.directed_graph.get_vertices_count()
 
+    def get_adjacency(self) -> Adjacency:
+        """ Returns a snapshot of the adjacency of the directed graph
+
+        Returns:
+            Adjacency: the snapshot of the adjacency """
+
+        return self.directed_graph.get_adjacency()
+
     def __str__(self):
         return self.directed_graph.__str__()
 
     def create_sccs_kosaraju_dfs(
             self, nontrivial: bool = True,
-            advisor: Advisor = Advisor()) -> List[Set[Vertex]]:
+            advisor: Advisor = Advisor(),
+            cache: Optional[ResultCache] = None) -> List[Set[Vertex]]:
         """ Method that calculates the strongly connected components in a
         directed graph
 
@@ -98,21 +229,202 @@ class DirectedGraph(object):
             nontrivial: indicator that tells whether to calculate only
                 nontrivial sccs (true), or also the trivial ones (false)
             advisor(Advisor): The class that implements the advice that is to
+            cache(ResultCache): If provided, the positions of the sccs are
+                looked up by the structural adjacency key, and stored on a
+                miss. Equal keys mean an equal shape and traversal order, so
+                a hit returns the sccs in the same order as the algorithm
+                would, also for a directed graph with other labels. The
+                cache is skipped when an advisor is provided
         """
-        
-        return kosaraju_sccs.create_sccs_kosaraju_dfs(self.directed_graph,
-                                                      nontrivial, advisor)
 
-    def is_cyclic(self, advisor: Advisor = Advisor()):
+        from . import kosaraju_sccs
+        if cache is None or type(advisor) is not Advisor:
+            return kosaraju_sccs.create_sccs_kosaraju_dfs(
+                self.directed_graph, nontrivial, advisor)
+        adjacency = self.get_adjacency()
+
+        def compute() -> List[List[int]]:
+            sccs = kosaraju_sccs.sccs_positions(adjacency)
+            if nontrivial:
+                sccs = kosaraju_sccs.filter_nontrivial(adjacency, sccs)
+            return sccs
+
+        vertices = adjacency.get_vertices()
+        return [{vertices[i] for i in scc} for scc in cache.get_or_compute(
+            ("sccs", nontrivial,
+             self.directed_graph.get_adjacency_key(labels=False)), compute)]
+
+    def weakly_connected_components(self, component_ids: bool = False) -> \
+            Union[List[Set[Vertex]], array]:
+        """ Method that calculates the weakly connected components of the
+        directed graph, with a union-find over its edges
+
+        Args:
+            component_ids(bool): If True, an array with the component (0..k-1)
+                per vertex id is returned instead of sets of vertices
+
+        Returns:
+            list: The weakly connected components as sets of vertices, or the
+                array with the component per vertex id """
+
+        from . import weakly_connected
+        return weakly_connected.weakly_connected_components(
+            self.directed_graph, component_ids)
+
+    def pagerank(self, damping: float = 0.85, tol: float = 1.0e-6,
+                 max_iter: int = 100,
+                 start: Optional[Mapping[Vertex, float]] = None) -> \
+            Dict[Vertex, float]:
+        """ Method that ranks the vertices of the directed graph with
+        PageRank, using NumPy if it is installed
+
+        Args:
+            damping(float): The probability to follow an edge, rather than to
+                jump to a random vertex
+            tol(float): The tolerance per vertex at which the iteration stops
+            max_iter(int): The maximum amount of iterations
+            start(dict): The ranks of an earlier call to start from
+
+        Returns:
+            dict: The rank per vertex, the ranks add up to 1 """
+
+        from . import pagerank
+        return pagerank.pagerank(self.directed_graph, damping, tol, max_iter,
+                                 start)
+
+    def is_cyclic(self, advisor: Advisor = Advisor(),
+                  cache: Optional[ResultCache] = None):
         """ Method that uses a helper module to check for cycles in the
         directed graph.
 
         Args:
             advisor(Advisor): The class that implements the advice that is to
             be inserted at join points in the algorith. The default advice is
-            empty """
+            empty
+            cache(ResultCache): If provided, the result is looked up by the
+                structural adjacency key, and stored on a miss, so directed
+                graphs of the same shape share it. The cache is skipped when
+                an advisor is provided """
+
+        from . import cyclic
+        if cache is None or type(advisor) is not Advisor:
+            return cyclic.is_cyclic(self.directed_graph, advisor)
+        return cache.get_or_compute(
+            ("is_cyclic",
+             self.directed_graph.get_adjacency_key(labels=False)),
+            lambda: cyclic.is_cyclic(self.directed_graph, advisor))
+
+    def propagate(self, attr: str, transfer: Callable[[Edge, Any], Any],
+                  join: Callable[[Any, Any], Any],
+                  max_visits: Optional[int] = None) -> int:
+        """ Method that propagates the values of a vertex attribute along the
+        edges until a fixpoint is reached. The strongly connected components
+        are processed in topological order, only cyclic components are
+        iterated
+
+        Args:
+            attr(str): The vertex attribute that holds the values, vertices
+                for which it is None have no value yet
+            transfer: Function that returns the contribution of an edge for
+                the value of its tail, or None if the edge contributes nothing
+            join: Function that combines the value of a vertex with a
+                contribution, it must be monotone
+            max_visits(int): If provided, a RuntimeError is raised when more
+                vertices than this are processed
 
-        return cyclic.is_cyclic(self.directed_graph, advisor)
+        Returns:
+            int: The amount of processed vertices """
+
+        from . import propagation
+        return propagation.propagate(self.directed_graph, attr, transfer,
+                                     join, max_visits)
+
+    def partition(self, k: int, method: str = "label_propagation",
+                  imbalance: float = 0.1,
+                  executor: Optional[Executor] = None,
+                  seed: int = 0) -> Partition:
+        """ Method that partitions the directed graph into k balanced parts
+        with few edges between them, to run algorithms on the parts in
+        separate workers
+
+        Args:
+            k(int): The amount of parts
+            method(str): "label_propagation" or "bfs_grow"
+            imbalance(float): The fraction by which label propagation may let
+                a part exceed n / k vertices
+            executor(Executor): If provided, the rounds of label propagation
+                are calculated in chunks in the executor, in parallel if it
+                is a process pool
+            seed(int): The seed of the random moves of label propagation
+
+        Returns:
+            Partition: the directed graph per part, which can be pickled on
+                its own, and the boundary edges of every part """
+
+        from . import partition
+        adjacency = self.get_adjacency()
+        parts = partition.partition_positions(adjacency, k, method,
+                                              imbalance, executor, seed)
+        return partition.Partition(
+            adjacency, parts, k, partition.create_shards(adjacency, parts, k))
+
+    def fingerprint(self, labels: bool = False) -> str:
+        """ Method that calculates a fingerprint of the directed graph in
+        O(V + E). The label-insensitive fingerprint is calculated with a
+        fixed amount of rounds of Weisfeiler-Lehman colour refinement,
+        isomorphic directed graphs have equal fingerprints. The
+        label-sensitive fingerprint determines the vertices and edges
+
+        Args:
+            labels(bool): If True, the labels of the vertices are part of the
+                fingerprint
+
+        Returns:
+            str: The fingerprint, as a hex string """
+
+        return self.directed_graph.fingerprint(labels)
+
+    async def create_sccs_kosaraju_dfs_async(
+            self, nontrivial: bool = True, advisor: Advisor = Advisor(),
+            progress: Optional[Progress] = None,
+            executor: Optional[ThreadPoolExecutor] = None) -> \
+            List[Set[Vertex]]:
+        """ Asyncio variant of create_sccs_kosaraju_dfs, which periodically
+        yields control to the event loop
+
+        Args:
+            nontrivial: indicator that tells whether to calculate only
+                nontrivial sccs (true), or also the trivial ones (false)
+            advisor(Advisor): The class that implements the advice that is to
+            progress: Callable that is called with the amount of processed
+                vertices and get_vertices_count()
+            executor(ThreadPoolExecutor): If provided, the algorithm is run
+                in the executor """
+
+        from . import asynchronous
+        return await asynchronous.create_sccs_kosaraju_dfs_async(
+            self.directed_graph, nontrivial, advisor, progress,
+            executor=executor)
+
+    async def is_cyclic_async(
+            self, advisor: Advisor = Advisor(),
+            progress: Optional[Progress] = None,
+            executor: Optional[ThreadPoolExecutor] = None) -> bool:
+        """ Asyncio variant of is_cyclic, which periodically yields control to
+        the event loop
+
+        Args:
+            advisor(Advisor): The class that implements the advice that is to
+            be inserted at join points in the algorith. The default advice is
+            empty
+            progress: Callable that is called with the amount of processed
+                vertices and get_vertices_count()
+            executor(ThreadPoolExecutor): If provided, the algorithm is run
+                in the executor """
+
+        from . import asynchronous
+        return await asynchronous.is_cyclic_async(
+            self.directed_graph, advisor, progress, executor=executor)
 
     def trail(self, advisor: Advisor = Advisor()):
         """ Method that trails the directed graph
@@ -122,7 +434,248 @@ class DirectedGraph(object):
             be inserted at join points in the algorith. The default advice is
             empty """
 
-        return trail.trail(self.directed_graph, advisor)
+        from . import directed_trail
+        return directed_trail.trail(self.directed_graph, advisor)
+
+    def eulerian_trail(self) -> Optional[List[Edge]]:
+        """ Method that calculates an Eulerian trail, a trail that traverses
+        every edge exactly once, in O(E)
+
+        Returns:
+            list: The edges of the trail in order, or None if there is no
+                Eulerian trail """
+
+        from . import eulerian
+        return eulerian.eulerian_trail(self.directed_graph)
+
+    def eulerian_circuit(self) -> Optional[List[Edge]]:
+        """ Method that calculates an Eulerian circuit, an Eulerian trail
+        that ends where it starts, in O(E)
+
+        Returns:
+            list: The edges of the circuit in order, or None if there is no
+                Eulerian circuit """
+
+        from . import eulerian
+        return eulerian.eulerian_circuit(self.directed_graph)
+
+    def dijkstra(self, source: Any, weight: str = "weight",
+                 flat_weights: bool = True) -> ShortestPaths:
+        """ Method that calculates the shortest paths from a source vertex,
+        using the weights that are stored as an attribute of the edges
+
+        Args:
+            source: The label of the source vertex
+            weight(str): The edge attribute that holds the weight
+            flat_weights(bool): If True, the weights are extracted into a
+                flat array once per run
+
+        Returns:
+            ShortestPaths: the distances and predecessors """
+
+        from . import shortest_paths
+        return shortest_paths.dijkstra(self.directed_graph, source, weight,
+                                       flat_weights)
+
+    def bidirectional_dijkstra(self, source: Any, target: Any,
+                               weight: str = "weight",
+                               flat_weights: bool = True) -> \
+            Optional[Tuple[float, List[Vertex]]]:
+        """ Method that calculates the shortest path between two vertices,
+        using the weights that are stored as an attribute of the edges
+
+        Args:
+            source: The label of the source vertex
+            target: The label of the target vertex
+            weight(str): The edge attribute that holds the weight
+            flat_weights(bool): If True, the weights are extracted into a
+                flat array once per run
+
+        Returns:
+            tuple: The distance and the vertices on the path, or None """
+
+        from . import shortest_paths
+        return shortest_paths.bidirectional_dijkstra(
+            self.directed_graph, source, target, weight, flat_weights)
+
+    def dag_shortest_paths(self, source: Any, weight: str = "weight",
+                           flat_weights: bool = True) -> \
+            ShortestPaths:
+        """ Method that calculates the shortest paths from a source vertex in
+        a directed acyclic graph, by relaxation in topological order
+
+        Args:
+            source: The label of the source vertex
+            weight(str): The edge attribute that holds the weight
+            flat_weights(bool): If True, the weights are extracted into a
+                flat array once per run
+
+        Returns:
+            ShortestPaths: the distances and predecessors """
+
+        from . import shortest_paths
+        return shortest_paths.dag_shortest_paths(self.directed_graph, source,
+                                                 weight, flat_weights)
+
+    def core_numbers(self, mode: str = "total") -> Dict[Vertex, int]:
+        """ Method that calculates the core number of every vertex, the
+        largest k for which it is part of the k-core, in O(V + E)
+
+        Args:
+            mode(str): The degree to use, "in", "out" or "total"
+
+        Returns:
+            dict: The core number per vertex """
+
+        from . import cores
+        return cores.core_numbers(self.directed_graph, mode)
+
+    def k_core(self, k: int, mode: str = "total") -> DirectedGraph:
+        """ Method that creates a read-only view on the k-core, the largest
+        subgraph in which every vertex has a degree of at least k
+
+        Args:
+            k(int): The minimum degree
+            mode(str): The degree to use, "in", "out" or "total"
+
+        Returns:
+            DirectedGraphView: the view on the k-core """
+
+        from . import cores
+        adjacency = self.get_adjacency()
+        numbers = cores.core_positions(adjacency, mode)
+        vertices = adjacency.get_vertices()
+        return self.subgraph(vertex.get_label()
+                             for i, vertex in enumerate(vertices)
+                             if numbers[i] >= k)
+
+    def feedback_arc_set(self, method: str = "eades",
+                         acyclic: bool = False) -> \
+            Union[List[Edge], Tuple[List[Edge], Any]]:
+        """ Method that calculates a small set of edges whose removal makes
+        the directed graph acyclic, with the Eades-Lin-Smyth heuristic
+        within every SCC, in O(V + E)
+
+        Args:
+            method(str): The heuristic, only "eades" is supported
+            acyclic(bool): If True, a DirectedAcyclicGraph without the edges
+                of the feedback arc set is returned as well
+
+        Returns:
+            list: The edges of the feedback arc set, or a tuple of those and
+                the DirectedAcyclicGraph """
+
+        from . import feedback_arc_set
+        edges = feedback_arc_set.feedback_arc_set(self.directed_graph, method)
+        if not acyclic:
+            return edges
+        from . directed_acyclic_graph import DirectedAcyclicGraph
+        removed = set(edges)
+        adjacency = self.get_adjacency()
+        vertices, offsets = adjacency.get_vertices(), adjacency.get_offsets()
+        heads, arcs = adjacency.get_heads(), adjacency.get_edges()
+        return edges, DirectedAcyclicGraph(
+            {vertex.get_label(): [vertices[heads[j]].get_label()
+                                  for j in range(offsets[i], offsets[i + 1])
+                                  if arcs[j] not in removed]
+             for i, vertex in enumerate(vertices)})
+
+    def hop_distances(self, source: Any,
+                      max_hops: Optional[int] = None) -> Dict[Vertex, int]:
+        """ Method that calculates the amount of hops from a source vertex to
+        the vertices that can be reached from it, with a direction
+        optimizing breadth-first search
+
+        Args:
+            source: The label of the source vertex
+            max_hops(int): If provided, only vertices within this amount of
+                hops are included
+
+        Returns:
+            dict: The hops per reachable vertex, 0 for the source """
+
+        from . import bfs
+        return bfs.hop_distances(self.directed_graph, source, max_hops)
+
+    def k_hop(self, source: Any, k: int) -> Set[Vertex]:
+        """ Method that calculates the vertices that can be reached from a
+        source vertex in at most k hops, including the source itself
+
+        Args:
+            source: The label of the source vertex
+            k(int): The maximum amount of hops
+
+        Returns:
+            set: The k-hop neighbourhood """
+
+        from . import bfs
+        return bfs.k_hop(self.directed_graph, source, k)
+
+    def shortest_unweighted_path(self, source: Any, target: Any) -> \
+            Optional[List[Vertex]]:
+        """ Method that calculates a path with the fewest edges between two
+        vertices, with a bidirectional breadth-first search that stops as
+        soon as both sides meet
+
+        Args:
+            source: The label of the source vertex
+            target: The label of the target vertex
+
+        Returns:
+            list: The vertices on the path, or None if there is no path """
+
+        from . import bfs
+        return bfs.shortest_unweighted_path(self.directed_graph, source,
+                                            target)
+
+    def dominator_tree(self, root: Any, post: bool = False) -> DominatorTree:
+        """ Method that calculates the dominator tree of the vertices that
+        can be reached from the root, in near-linear time
+
+        Args:
+            root: The label of the root, the exit vertex for post-dominators
+            post(bool): If True, the post-dominator tree is calculated on the
+                transposed adjacency, the directed graph is not reversed
+
+        Returns:
+            DominatorTree: the immediate (post-)dominators """
+
+        from . import dominators
+        return dominators.dominator_tree(self.directed_graph, root, post)
+
+    def subgraph(self, labels: Iterable[Any]) -> DirectedGraph:
+        """ Method that creates a read-only view on the directed graph,
+        restricted to the vertices with the labels, without copying vertices
+        or edges
+
+        Args:
+            labels: The labels of the vertices of the view
+
+        Returns:
+            DirectedGraphView: the view """
+
+        from . import views
+        return views.subgraph(self.directed_graph, labels)
+
+    def filtered_view(self, vertex_predicate: Callable[[Vertex], bool] = None,
+                      edge_predicate: Callable[[Edge], bool] = None) -> \
+            DirectedGraph:
+        """ Method that creates a read-only view on the directed graph,
+        restricted to the vertices and edges that satisfy the predicates,
+        without copying vertices or edges
+
+        Args:
+            vertex_predicate: if provided, only vertices for which it returns
+                True are part of the view
+            edge_predicate: if provided, only edges for which it returns True
+                are part of the view
+
+        Returns:
+            DirectedGraphView: the view """
+
+        from . import views
+        return views.filtered_view(self.directed_graph, vertex_predicate,
+                                   edge_predicate)
 
     def reversed(self, inplace=True) -> DirectedGraphCore:
         return self.directed_graph.reversed(inplace)
@@ -1,16 +1,44 @@
 from __future__ import annotations
 from . vertex import Vertex
 from copy import deepcopy
-from typing import Collection, Set, Mapping, Any, List
+from typing import Callable, Collection, Dict, Set, Mapping, Any, List, \
+    Optional
 from . edge import Edge
 from . algorithm_ordering import AlgorithmOrdering
+from . adjacency import Adjacency
+from . delta import Delta
+from . stats import GraphStats
 
 """ Module that contains the definition of a directed graph as a class """
 
 
 class DirectedGraphCore(object):
     """ Directed graph core class, it just contains the pure defintion of the
-    concept, not the extra functionalities, like calculating sccs, etc.. """
+    concept, not the extra functionalities, like calculating sccs, etc..
+
+    The algorithms never write scratch state into the vertices or edges of the
+    directed graph, they work on a per-call snapshot of the adjacency. Running
+    several algorithms concurrently (from several threads) on the same
+    directed graph is therefore safe, as long as the directed graph is not
+    mutated at the same time
+
+    Every vertex is assigned a dense integer id when it is added, its position
+    in the list of vertices. Labels are interned in a dict that maps them to
+    their vertex
+
+    A directed graph is pickled (and deep copied) in a flat form: the labels,
+    the offsets and heads arrays of its adjacency and only the attributes
+    that are set, so no recursion through the vertices and edges happens
+
+    Optionally, the changes to the directed graph are recorded in a delta,
+    which can be applied to replicas of the directed graph
+
+    The amount of edges, the sources, the sinks and the degree histograms
+    are maintained on every change, so reading them takes no pass over the
+    directed graph
+
+    Values that are derived from the vertices and edges, like fingerprints,
+    are kept until the directed graph changes """
 
     def __init__(self, vertices: Mapping[Any, List[Any]] = None,
                  algorithm_ordering=AlgorithmOrdering.NATURAL):
@@ -23,7 +51,12 @@ class DirectedGraphCore(object):
         """
 
         self._algorithm_ordering = algorithm_ordering
-        self._vertices: Set[Vertex] = set()
+        self._vertices: List[Vertex] = list()
+        self._labels: Dict[Any, Vertex] = dict()
+        self._delta: Optional[Delta] = None
+        self._stats = GraphStats()
+        self._derived: Dict[str, Any] = dict()
+        self._generation = 0
         if vertices is not None:
             for label in vertices.keys():
                 self.create_add_vertex(label)
@@ -41,11 +74,26 @@ class DirectedGraphCore(object):
         Returns:
             The vertex object
         """
-        for vertex in self._vertices:
-            if vertex.get_label() == label:
-                return vertex
 
-        raise RuntimeError(f"label {label} couldn't be found in vertices")
+        vertex = self._labels.get(label)
+        if vertex is None:
+            raise RuntimeError(f"label {label} couldn't be found in vertices")
+        return vertex
+
+    def get_vertex_by_id(self, vertex_id: int) -> Vertex:
+        """ Returns the vertex with the dense integer id
+
+        Args:
+            vertex_id: the id of the vertex
+
+        Returns:
+            The vertex object
+        """
+
+        return self._vertices[vertex_id]
+
+    def has_vertex(self, label: Any) -> bool:
+        return label in self._labels
 
     def copy(self) -> DirectedGraphCore:
         """ Copies the directed graph and returns it
@@ -55,31 +103,112 @@ class DirectedGraphCore(object):
 
         return deepcopy(self)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """ Returns the flat form of the directed graph, in which vertices are
+        identified by their id and edges by their position in the adjacency
+
+        Returns:
+            dict: the labels, the offsets and heads arrays and the non-empty
+                vertex and edge attributes """
+
+        adjacency = Adjacency.from_dense_vertices(self._vertices)
+        return {
+            "algorithm_ordering": self._algorithm_ordering,
+            "labels": [vertex.get_label() for vertex in self._vertices],
+            "offsets": adjacency.get_offsets(),
+            "heads": adjacency.get_heads(),
+            "vertex_attrs": {vertex.get_id(): vertex.get_attrs()
+                             for vertex in self._vertices
+                             if vertex.get_attrs()},
+            "edge_attrs": {i: edge.get_attrs()
+                           for i, edge in enumerate(adjacency.get_edges())
+                           if edge.get_attrs()}
+        }
+
+    def __setstate__(self, state: Mapping[str, Any]):
+        """ Rebuilds the directed graph from its flat form in one pass over
+        the vertices and one over the edges
+
+        Args:
+            state(dict): the flat form, as returned by __getstate__ """
+
+        self._algorithm_ordering = state["algorithm_ordering"]
+        self._vertices = list()
+        self._labels = dict()
+        self._delta = None
+        self._stats = GraphStats()
+        self._derived: Dict[str, Any] = dict()
+        self._generation = 0
+        for label in state["labels"]:
+            self.create_add_vertex(label)
+        for vertex_id, attrs in state["vertex_attrs"].items():
+            for attr, value in attrs.items():
+                self._vertices[vertex_id].set_attr(attr, value)
+
+        offsets, heads = state["offsets"], state["heads"]
+        edge_attrs = state["edge_attrs"]
+        vertices = self._vertices
+        for i, tail in enumerate(vertices):
+            for j in range(offsets[i], offsets[i + 1]):
+                edge = self.add_edge(tail, vertices[heads[j]])
+                if j in edge_attrs:
+                    for attr, value in edge_attrs[j].items():
+                        edge.set_attr(attr, value)
+
+    def record_deltas(self, enabled: bool = True):
+        """ Starts or stops recording the changes to the directed graph
+
+        Args:
+            enabled(bool): if True, the changes from now on are recorded """
+
+        self._delta = Delta() if enabled else None
+
+    def take_delta(self) -> Delta:
+        """ Returns the changes that were recorded since recording started or
+        since the previous call, and continues recording in a new delta
+
+        Returns:
+            Delta: the recorded changes """
+
+        if self._delta is None:
+            raise RuntimeError("Changes of the directed graph are not "
+                               "recorded")
+        delta, self._delta = self._delta, Delta()
+        return delta
+
     def create_add_vertex(self, label: Any):
         """ Adds a vertex to the dictionary of vertices
 
         Args:
             label: a vertex represented by its label """
 
-        for vertex in self._vertices:
-            if vertex.get_label() == label:
-                raise RuntimeError(
-                    f"Vertex = {label} is already a vertex in this directed " +
-                    " graph")
-
-        self._vertices.add(Vertex(label, self._algorithm_ordering))
+        self.add_vertex(Vertex(label, self._algorithm_ordering))
 
     def add_vertex(self, vertex: Vertex):
-        """ Function that adds a vertex to the directed graph
+        """ Function that adds a vertex to the directed graph and assigns the
+        next dense integer id to it
 
         Args:
             vertex: the vertex
         """
 
-        self._vertices.add(vertex)
+        label = vertex.get_label()
+        if label in self._labels:
+            raise RuntimeError(
+                f"Vertex = {label} is already a vertex in this directed " +
+                " graph")
+
+        vertex.set_id(len(self._vertices))
+        self._vertices.append(vertex)
+        self._labels[label] = vertex
+        self._stats.vertex_added(vertex)
+        self._derived.clear()
+        self._generation += 1
+        if self._delta is not None:
+            self._delta.add_vertex(label)
 
     def get_vertices(self) -> Collection[Vertex]:
-        """ Returns the vertices set
+        """ Returns the vertices, in the order of their ids
 
         Args:
             vertex_sorting: Indicates the ordering of vertices that
@@ -95,16 +224,61 @@ class DirectedGraphCore(object):
                           reverse=self._algorithm_ordering ==
                           AlgorithmOrdering.DESC)
 
-    def add_edge(self, tail: Vertex, head: Vertex):
+    def remove_vertices_from(self, vertex_id: int):
+        """ Removes the vertices with an id from vertex_id onwards, which
+        keeps the ids dense. The vertices must not have any edges anymore
+
+        Args:
+            vertex_id: the id of the first vertex to remove """
+
+        for vertex in self._vertices[vertex_id:]:
+            if vertex.get_outdegree() or vertex.get_indegree():
+                raise RuntimeError(
+                    f"Vertex = {vertex.get_label()} still has edges")
+        for vertex in self._vertices[vertex_id:]:
+            del self._labels[vertex.get_label()]
+            vertex.set_id(-1)
+            self._stats.vertex_removed(vertex)
+        del self._vertices[vertex_id:]
+        self._derived.clear()
+        self._generation += 1
+        if self._delta is not None:
+            self._delta.remove_vertices_from(vertex_id)
+
+    def add_edge(self, tail: Vertex, head: Vertex) -> Edge:
         """ Adds an edge to the graph, the edge is identified by a tail and
         a head vertex.
 
         Args:
             tail: the edge that represents the start vertex
-            head: the edge that represents the destination vertex """
+            head: the edge that represents the destination vertex
+
+        Returns:
+            Edge: the added edge """
 
-        tail.add_edge(head)
+        edge = tail.add_edge(head)
         head.increase_indegree()
+        self._stats.edge_added(tail, head)
+        self._derived.clear()
+        self._generation += 1
+        if self._delta is not None:
+            self._delta.add_edge(tail.get_id(), head.get_id())
+        return edge
+
+    def remove_edge(self, edge: Edge):
+        """ Removes an edge from the graph
+
+        Args:
+            edge: the edge to remove """
+
+        edge.get_tail().remove_edge(edge)
+        edge.get_head().decrease_indegree()
+        self._stats.edge_removed(edge.get_tail(), edge.get_head())
+        self._derived.clear()
+        self._generation += 1
+        if self._delta is not None:
+            self._delta.remove_edge(edge.get_tail().get_id(),
+                                    edge.get_head().get_id())
 
     def get_edges(self) -> Set[Edge]:
         """ Method that retrieves all edges of all vertices
@@ -114,6 +288,18 @@ class DirectedGraphCore(object):
 
         return {e for v in self._vertices for e in v.get_edges()}
 
+    def get_edges_count(self) -> int:
+        return self._stats.get_edges_count()
+
+    def stats(self) -> GraphStats:
+        """ Returns the statistics of the directed graph, which are kept up
+        to date with later changes
+
+        Returns:
+            GraphStats: the statistics """
+
+        return self._stats
+
     def reversed(self, inplace: bool = True) -> DirectedGraphCore:
         """ Function that calculates the transposed graph
 
@@ -134,11 +320,88 @@ class DirectedGraphCore(object):
             vertex.remove_edges()
 
         for edge in edges:
+            edge.get_head().decrease_indegree()
             edge.reverse()
             edge.get_tail().add_edge(edge.get_head())
+            edge.get_head().increase_indegree()
+        graph._stats.reversed()
+        graph._derived.clear()
+        graph._generation += 1
+        if graph._delta is not None:
+            graph._delta.reverse()
 
         return graph
 
+    def get_generation(self) -> int:
+        """ Returns the amount of changes of the vertices and edges so far,
+        so that views can tell whether what they kept is still valid
+
+        Returns:
+            int: the generation of the directed graph """
+
+        return self._generation
+
+    def get_derived(self, name: str, create: Callable[[], Any]) -> Any:
+        """ Returns a value that is derived from the vertices and edges of
+        the directed graph, like a fingerprint. The value is created once and
+        kept until the directed graph changes
+
+        Args:
+            name(str): the name of the value
+            create: function without arguments that creates the value
+
+        Returns:
+            the (kept) value """
+
+        value = self._derived.get(name)
+        if value is None:
+            value = create()
+            self._derived[name] = value
+        return value
+
+    def fingerprint(self, labels: bool = False) -> str:
+        """ Returns the fingerprint of the directed graph, which is
+        calculated once until the directed graph changes
+
+        Args:
+            labels(bool): If True, the labels of the vertices are part of the
+                fingerprint
+
+        Returns:
+            str: The fingerprint, as a hex string """
+
+        from . fingerprint import fingerprint_adjacency
+        return self.get_derived(
+            "labelled_fingerprint" if labels else "fingerprint",
+            lambda: fingerprint_adjacency(self.get_adjacency(), labels))
+
+    def get_adjacency_key(self, labels: bool = True) -> str:
+        """ Returns the hash of the adjacency as the algorithms traverse it,
+        which is calculated once until the directed graph changes
+
+        Args:
+            labels(bool): If False, the labels of the vertices are left out,
+                so the key only depends on the shape of the adjacency
+
+        Returns:
+            str: The key, as a hex string """
+
+        from . fingerprint import adjacency_key
+        return self.get_derived(
+            "adjacency_key" if labels else "structural_adjacency_key",
+            lambda: adjacency_key(self.get_adjacency(), labels))
+
+    def get_adjacency(self) -> Adjacency:
+        """ Returns a snapshot of the adjacency of the directed graph, on
+        which algorithms can keep their scratch state in per-call arrays
+
+        Returns:
+            Adjacency: the snapshot of the adjacency """
+
+        if self._algorithm_ordering == AlgorithmOrdering.NATURAL:
+            return Adjacency.from_dense_vertices(self._vertices)
+        return Adjacency.from_graph(self)
+
     def get_vertices_count(self) -> int:
         return len(self._vertices)
 
@@ -11,44 +11,49 @@ abstract class Advisor, which must be implemented by interested parties
 
 from .. util.advisor import Advisor
 from . directed_graph_core import DirectedGraphCore
-from . vertex import Vertex
 
 
 def trail(directed_graph: DirectedGraphCore, advisor: Advisor):
     """ Main function that walks the directed graph, restricted by the trail
      feature (no edge repetitions)
 
+    Visited edges are marked in a per-call bitmap that is indexed by the dense
+    edge positions of the adjacency, so the edges of the directed graph are
+    not modified and the trail can be repeated.
+
     Args:
         directed_graph (DirectedGraph): The directed graph
         advisor (Advisor): Object that contains advice which can be inserted
         at join points """
 
-    VISITED = "visited"
-
-    def is_edge_visited(edge):
-        if edge.get_attr(VISITED):
-            return True
-        else:
-            return False
-
-    def _trail_dfs(vertex: Vertex):
-        """ Function that recursively walks the directed graph
-
-        Args:
-            directed_graph (DirectedGraph): The directed graph
-            vertex (Vertex): The current vertex
-        """
-
-        advisor.advise("visit_vertex", directed_graph, vertex)
-        for edge in vertex.get_edges():
-            if not is_edge_visited(edge):
-                edge.set_attr(VISITED, True)
-                advisor.advise("edge_not_visited", directed_graph, edge)
-                _trail_dfs(edge.get_head())
+    adjacency = directed_graph.get_adjacency()
+    vertices = adjacency.get_vertices()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    edges = adjacency.get_edges()
+    visited = bytearray(len(heads))
+
+    for start in range(len(vertices)):
+        advisor.advise("visit_vertex", directed_graph, vertices[start])
+        path = [start]
+        cursors = [offsets[start]]
+        while path:
+            vertex = path[-1]
+            cursor = cursors[-1]
+            if cursor == offsets[vertex + 1]:
+                path.pop()
+                cursors.pop()
+                continue
+
+            cursors[-1] = cursor + 1
+            if not visited[cursor]:
+                visited[cursor] = 1
+                advisor.advise("edge_not_visited", directed_graph,
+                               edges[cursor])
+                head = heads[cursor]
+                advisor.advise("visit_vertex", directed_graph, vertices[head])
+                path.append(head)
+                cursors.append(offsets[head])
             else:
-                advisor.advise("edge_visited_already", directed_graph, edge)
-
-        return False
-
-    for vertex in directed_graph.get_vertices():
-        _trail_dfs(vertex)
+                advisor.advise("edge_visited_already", directed_graph,
+                               edges[cursor])
@@ -0,0 +1,266 @@
+""" Module that contains the logic for calculating the dominator tree of a
+rooted directed graph with the Semi-NCA variant of the Lengauer-Tarjan
+algorithm (https://en.wikipedia.org/wiki/Dominator_(graph_theory))
+
+A vertex d dominates a vertex v if every path from the root to v runs through
+d. The immediate dominator of v is its closest strict dominator, the parent
+of v in the dominator tree. Post-dominators are the dominators of the
+transposed adjacency, rooted at the exit vertex. All loops are iterative and
+work on arrays that are indexed by depth-first preorder number """
+
+from array import array
+from typing import Any, List, Optional
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . vertex import Vertex
+
+UNREACHED = -1
+
+
+class DominatorTree(object):
+    """ Class that holds the dominator tree of the vertices that can be
+    reached from the root, indexed by the dense positions of the adjacency of
+    the directed graph """
+
+    def __init__(self, adjacency: Adjacency, root: int, idoms: array):
+        """ Initialises the dominator tree
+
+        Args:
+            adjacency (Adjacency): The adjacency the tree was calculated on
+            root(int): The position of the root
+            idoms(array): The position of the immediate dominator per
+                position, -1 for the root and for unreachable vertices
+        """
+
+        self._adjacency = adjacency
+        self._root = root
+        self._idoms = idoms
+        self._enter: Optional[array] = None
+        self._leave: Optional[array] = None
+
+    def get_root(self) -> Vertex:
+        return self._adjacency.get_vertices()[self._root]
+
+    def get_immediate_dominators(self) -> array:
+        return self._idoms
+
+    def is_reachable(self, vertex: Vertex) -> bool:
+        position = self._adjacency.get_position(vertex)
+        return position == self._root or self._idoms[position] != UNREACHED
+
+    def get_immediate_dominator(self, vertex: Vertex) -> Optional[Vertex]:
+        """ Returns the immediate dominator of a vertex
+
+        Args:
+            vertex: the vertex
+
+        Returns:
+            Vertex: the immediate dominator, or None for the root """
+
+        if not self.is_reachable(vertex):
+            raise RuntimeError(f"Vertex = {vertex.get_label()} can't be "
+                               f"reached from the root")
+        idom = self._idoms[self._adjacency.get_position(vertex)]
+        return None if idom == UNREACHED else \
+            self._adjacency.get_vertices()[idom]
+
+    def get_children(self, vertex: Vertex) -> List[Vertex]:
+        """ Returns the vertices that the vertex immediately dominates
+
+        Args:
+            vertex: the vertex
+
+        Returns:
+            list: the children of the vertex in the dominator tree """
+
+        position = self._adjacency.get_position(vertex)
+        vertices = self._adjacency.get_vertices()
+        return [vertices[i] for i, idom in enumerate(self._idoms)
+                if idom == position]
+
+    def dominates(self, dominator: Vertex, vertex: Vertex) -> bool:
+        """ Checks whether every path from the root to the vertex runs
+        through the dominator, in O(1) after a single walk over the tree
+
+        Args:
+            dominator: the dominating vertex
+            vertex: the dominated vertex
+
+        Returns:
+            bool: True if the dominator dominates the vertex, a vertex
+                dominates itself """
+
+        if not self.is_reachable(dominator) or not self.is_reachable(vertex):
+            return False
+        if self._enter is None:
+            self._number()
+        first = self._adjacency.get_position(dominator)
+        second = self._adjacency.get_position(vertex)
+        return self._enter[first] <= self._enter[second] and \
+            self._leave[second] <= self._leave[first]
+
+    def _number(self):
+        """ Numbers the vertices on entering and leaving them in a walk over
+        the dominator tree """
+
+        n = len(self._idoms)
+        offsets = array("l", [0]) * (n + 1)
+        for idom in self._idoms:
+            if idom != UNREACHED:
+                offsets[idom + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        children = array("l", [0]) * offsets[n]
+        cursors = array("l", offsets[:-1])
+        for i, idom in enumerate(self._idoms):
+            if idom != UNREACHED:
+                children[cursors[idom]] = i
+                cursors[idom] += 1
+
+        enter = array("l", [0]) * n
+        leave = array("l", [0]) * n
+        cursors = array("l", offsets[:-1])
+        clock = 0
+        enter[self._root] = clock
+        stack = [self._root]
+        while stack:
+            vertex = stack[-1]
+            if cursors[vertex] < offsets[vertex + 1]:
+                child = children[cursors[vertex]]
+                cursors[vertex] += 1
+                clock += 1
+                enter[child] = clock
+                stack.append(child)
+            else:
+                stack.pop()
+                clock += 1
+                leave[vertex] = clock
+        self._enter, self._leave = enter, leave
+
+
+def dominator_tree(directed_graph: DirectedGraphCore, root: Any,
+                   post: bool = False) -> DominatorTree:
+    """ Function that calculates the dominator tree of the directed graph
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        root: The label of the root, the exit vertex for post-dominators
+        post(bool): If True, the post-dominator tree is calculated, on the
+            transposed adjacency, the directed graph itself is not reversed
+
+    Returns:
+        DominatorTree: the (post-)dominator tree """
+
+    adjacency = directed_graph.get_adjacency()
+    transposed = adjacency.transpose()
+    position = adjacency.get_position(directed_graph.get_vertex(root))
+    if post:
+        adjacency, transposed = transposed, adjacency
+    return DominatorTree(adjacency, position,
+                         immediate_dominators(adjacency, transposed,
+                                              position))
+
+
+def immediate_dominators(adjacency: Adjacency, transposed: Adjacency,
+                         root: int) -> array:
+    """ Function that calculates the immediate dominators with Semi-NCA
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        transposed (Adjacency): The transposed adjacency, which lists the
+            predecessors of every position
+        root(int): The position of the root
+
+    Returns:
+        array: The position of the immediate dominator per position, -1 for
+            the root and for the positions that can't be reached """
+
+    n = adjacency.get_vertices_count()
+    order, parents, numbers = _preorder(adjacency, root)
+    count = len(order)
+    semis = array("l", range(count))
+    labels = array("l", range(count))
+    ancestors = array("l", [UNREACHED]) * count
+    t_offsets = transposed.get_offsets()
+    t_heads = transposed.get_heads()
+    for w in range(count - 1, 0, -1):
+        position = order[w]
+        semi = semis[w]
+        for i in range(t_offsets[position], t_offsets[position + 1]):
+            v = numbers[t_heads[i]]
+            if v == UNREACHED:
+                continue
+            u = _evaluate(v, ancestors, labels, semis)
+            if semis[u] < semi:
+                semi = semis[u]
+        semis[w] = semi
+        ancestors[w] = parents[w]
+
+    idoms = array("l", parents)
+    for w in range(1, count):
+        idom = idoms[w]
+        while idom > semis[w]:
+            idom = idoms[idom]
+        idoms[w] = idom
+
+    result = array("l", [UNREACHED]) * n
+    for w in range(1, count):
+        result[order[w]] = order[idoms[w]]
+    return result
+
+
+def _preorder(adjacency: Adjacency, root: int):
+    """ Function that numbers the positions that can be reached from the root
+    in depth-first preorder
+
+    Returns:
+        tuple: the positions in preorder, the number of the parent in the
+            depth-first tree per number and the number per position """
+
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    numbers = array("l", [UNREACHED]) * n
+    order = array("l", [root])
+    parents = array("l", [UNREACHED])
+    numbers[root] = 0
+    stack = [root]
+    cursors = [offsets[root]]
+    while stack:
+        vertex = stack[-1]
+        cursor = cursors[-1]
+        if cursor == offsets[vertex + 1]:
+            stack.pop()
+            cursors.pop()
+            continue
+        cursors[-1] = cursor + 1
+        head = heads[cursor]
+        if numbers[head] == UNREACHED:
+            numbers[head] = len(order)
+            parents.append(numbers[vertex])
+            order.append(head)
+            stack.append(head)
+            cursors.append(offsets[head])
+    return order, parents, numbers
+
+
+def _evaluate(v: int, ancestors: array, labels: array, semis: array) -> int:
+    """ Function that returns the number with the minimal semidominator on
+    the path from v up to the root of its tree in the forest of linked
+    numbers, compressing the path on the way """
+
+    if ancestors[v] == UNREACHED:
+        return v
+    path: List[int] = list()
+    x = v
+    while ancestors[ancestors[x]] != UNREACHED:
+        path.append(x)
+        x = ancestors[x]
+    while path:
+        y = path.pop()
+        a = ancestors[y]
+        if semis[labels[a]] < semis[labels[y]]:
+            labels[y] = labels[a]
+        ancestors[y] = ancestors[a]
+    return labels[v]
+
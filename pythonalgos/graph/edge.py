@@ -47,3 +47,6 @@ class Edge(object):
 
     def get_attr(self, attr: str) -> Any:
         return self._attrs.get(attr)
+
+    def get_attrs(self) -> Mapping[str, Any]:
+        return self._attrs
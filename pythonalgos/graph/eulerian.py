@@ -0,0 +1,143 @@
+""" Module that contains functions that calculate Eulerian trails and circuits
+of a directed graph with Hierholzer's algorithm
+(https://en.wikipedia.org/wiki/Eulerian_path#Hierholzer's_algorithm)
+
+An Eulerian trail is a trail that traverses every edge of the directed graph
+exactly once, an Eulerian circuit is an Eulerian trail that ends in the vertex
+where it started """
+
+from array import array
+from typing import List, Optional
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . edge import Edge
+
+
+def eulerian_trail(directed_graph: DirectedGraphCore) -> Optional[List[Edge]]:
+    """ Function that calculates an Eulerian trail of the directed graph
+
+    Such a trail exists iff all vertices with edges are connected and at most
+    one vertex has an outdegree that is one more than its indegree (the start
+    of the trail), at most one vertex has an indegree that is one more than
+    its outdegree (the end of the trail) and all other vertices have an equal
+    indegree and outdegree
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+
+    Returns:
+        list: The edges of the trail in order, or None if there is no
+            Eulerian trail """
+
+    adjacency = directed_graph.get_adjacency()
+    start = _start_position(adjacency, circuit=False)
+    if start is None:
+        return None
+    return _hierholzer(adjacency, start)
+
+
+def eulerian_circuit(directed_graph: DirectedGraphCore) -> \
+        Optional[List[Edge]]:
+    """ Function that calculates an Eulerian circuit of the directed graph
+
+    Such a circuit exists iff all vertices with edges are connected and every
+    vertex has an equal indegree and outdegree
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+
+    Returns:
+        list: The edges of the circuit in order, or None if there is no
+            Eulerian circuit """
+
+    adjacency = directed_graph.get_adjacency()
+    start = _start_position(adjacency, circuit=True)
+    if start is None:
+        return None
+    return _hierholzer(adjacency, start)
+
+
+def _start_position(adjacency: Adjacency, circuit: bool) -> Optional[int]:
+    """ Function that checks the degree conditions and determines the vertex
+    at which the trail or circuit starts. For a directed graph, the degrees of
+    the vertices are used, for a view on a directed graph, the degrees within
+    the view are counted on its adjacency
+
+    Args:
+        adjacency (Adjacency): The adjacency of the directed graph
+        circuit(bool): If True, the conditions for a circuit are checked
+
+    Returns:
+        int: The position of the start vertex, -1 if there are no edges at
+            all, or None if the degree conditions are not met """
+
+    vertices = adjacency.get_vertices()
+    offsets = adjacency.get_offsets()
+    if adjacency.get_id_positions() is None:
+        indegrees = [vertex.get_indegree() for vertex in vertices]
+        outdegrees = [vertex.get_outdegree() for vertex in vertices]
+    else:
+        indegrees = array("l", [0]) * len(vertices)
+        for head in adjacency.get_heads():
+            indegrees[head] += 1
+        outdegrees = [offsets[i + 1] - offsets[i]
+                      for i in range(len(vertices))]
+
+    start, end, any_start = None, None, -1
+    for i in range(len(vertices)):
+        outdegree = outdegrees[i]
+        difference = outdegree - indegrees[i]
+        if difference == 0:
+            if any_start == -1 and outdegree > 0:
+                any_start = i
+        elif difference == 1 and start is None and not circuit:
+            start = i
+        elif difference == -1 and end is None and not circuit:
+            end = i
+        else:
+            return None
+
+    if (start is None) != (end is None):
+        return None
+    return any_start if start is None else start
+
+
+def _hierholzer(adjacency: Adjacency, start: int) -> Optional[List[Edge]]:
+    """ Function that runs Hierholzer's algorithm iteratively in O(E), with a
+    per-vertex cursor into the adjacency in place of removing edges
+
+    Args:
+        adjacency (Adjacency): The adjacency of the directed graph
+        start(int): The position of the start vertex, -1 if there are no
+            edges
+
+    Returns:
+        list: The edges of the trail in order, or None if not all edges are
+            reachable from the start vertex """
+
+    if start == -1:
+        return list()
+
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    edges = adjacency.get_edges()
+    cursors = array("l", offsets[:-1])
+    path_vertices = array("l", [start])
+    path_edges = array("l", [-1])
+    trail = array("l")
+    while path_vertices:
+        vertex = path_vertices[-1]
+        cursor = cursors[vertex]
+        if cursor < offsets[vertex + 1]:
+            cursors[vertex] = cursor + 1
+            path_vertices.append(heads[cursor])
+            path_edges.append(cursor)
+        else:
+            path_vertices.pop()
+            edge = path_edges.pop()
+            if edge != -1:
+                trail.append(edge)
+
+    if len(trail) != adjacency.get_edges_count():
+        return None
+    return [edges[i] for i in reversed(trail)]
@@ -0,0 +1,410 @@
+""" Module that contains external memory (out-of-core) variants of the cycle
+check and the strongly connected components, for directed graphs whose edges
+don't fit in memory as vertex and edge objects.
+
+The directed graph is given as an edge file: a binary file with pairs of
+native 64-bit integers (tail, head), where the vertices are identified by the
+dense ids 0..n-1. The file is read in blocks, sorting it by tail improves the
+locality of the state lookups but is not required. The per-vertex state lives
+in memory-mapped files, no Python object is created per edge.
+
+Both algorithms trim vertices without incoming or outgoing edges, until none
+are left. The in-memory degrees are decreased as soon as a pass reaches an
+edge of a trimmed vertex, so trimming cascades within a pass: a chain whose
+edges are in file order is trimmed in a single pass, instead of one pass per
+vertex. Every vertex remembers the step (the edge index over all passes) at
+which it was trimmed, an edge is subtracted in the first pass that reaches it
+after one of its vertices was trimmed, so exactly once.
+
+The SCCs of what remains are found by colour propagation (Orzan's colouring
+algorithm): the maximum id is propagated forward, after which every vertex
+whose colour is its own id collects its SCC by propagating backward. As soon
+as the remaining edges fit in the memory budget, they are loaded into an
+adjacency and the work is finished in memory """
+
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from . adjacency import Adjacency
+from . import cyclic
+from . import kosaraju_sccs
+
+EDGE_TYPECODE = "q"
+BLOCK_EDGES = 1 << 16
+MEMORY_EDGES = 1 << 20
+UNASSIGNED = -1
+ALIVE = (1 << 63) - 1
+
+
+class MappedArray(object):
+    """ Class that represents an array of fixed length in a memory-mapped
+    file. The values are accessed through a memoryview with the typecode """
+
+    def __init__(self, path: str, length: int, typecode: str, fill: int = 0):
+        """ Creates the file and maps it into memory
+
+        Args:
+            path(str): the path of the file
+            length(int): the amount of values
+            typecode(str): the array typecode of the values
+            fill(int): the initial value of all values
+        """
+
+        itemsize = array(typecode).itemsize
+        with open(path, "wb") as f:
+            if fill == 0:
+                f.truncate(length * itemsize)
+            else:
+                chunk = array(typecode, [fill]) * min(length, BLOCK_EDGES)
+                remaining = length
+                while remaining > 0:
+                    if remaining < len(chunk):
+                        chunk = chunk[:remaining]
+                    chunk.tofile(f)
+                    remaining -= len(chunk)
+
+        self._file = open(path, "r+b")
+        if length:
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(self._file.fileno(),
+                                                        length * itemsize)
+            self._view = memoryview(self._mmap)
+        else:
+            self._mmap = None
+            self._view = memoryview(array(typecode).tobytes())
+        self.values = self._view.cast(typecode)
+
+    def close(self):
+        self.values.release()
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+
+def write_edge_file(path: str, edges: Iterable[Tuple[int, int]]):
+    """ Function that writes edges to an edge file
+
+    Args:
+        path(str): the path of the edge file
+        edges: iterable of (tail, head) pairs of vertex ids """
+
+    with open(path, "wb") as f:
+        block = array(EDGE_TYPECODE)
+        for tail, head in edges:
+            block.append(tail)
+            block.append(head)
+            if len(block) >= 2 * BLOCK_EDGES:
+                block.tofile(f)
+                block = array(EDGE_TYPECODE)
+        block.tofile(f)
+
+
+def read_edge_blocks(path: str,
+                     block_edges: int = BLOCK_EDGES) -> Iterator[array]:
+    """ Function that reads an edge file in blocks
+
+    Args:
+        path(str): the path of the edge file
+        block_edges(int): the maximum amount of edges per block
+
+    Returns:
+        iterator: arrays with the tails and heads interleaved """
+
+    with open(path, "rb") as f:
+        while True:
+            block = array(EDGE_TYPECODE)
+            try:
+                block.fromfile(f, 2 * block_edges)
+            except EOFError:
+                pass
+            if block:
+                yield block
+            if len(block) < 2 * block_edges:
+                return
+
+
+def read_components(path: str) -> array:
+    """ Function that reads a component file, written by sccs_external
+
+    Args:
+        path(str): the path of the component file
+
+    Returns:
+        array: the component id per vertex id """
+
+    components = array(EDGE_TYPECODE)
+    with open(path, "rb") as f:
+        components.frombytes(f.read())
+    return components
+
+
+def count_vertices(path: str, block_edges: int = BLOCK_EDGES) -> int:
+    """ Function that determines the amount of vertices in an edge file as
+    one more than the highest vertex id
+
+    Args:
+        path(str): the path of the edge file
+        block_edges(int): the maximum amount of edges per block
+
+    Returns:
+        int: the amount of vertices """
+
+    return max((max(block) + 1 for block in read_edge_blocks(path,
+                                                            block_edges)),
+               default=0)
+
+
+def sccs_external(edge_path: str, component_path: str,
+                  vertex_count: Optional[int] = None,
+                  block_edges: int = BLOCK_EDGES,
+                  memory_edges: int = MEMORY_EDGES,
+                  work_dir: Optional[str] = None) -> int:
+    """ Function that calculates the strongly connected components of the
+    directed graph in an edge file, in bounded memory. The component id of a
+    vertex is the highest vertex id in its component, the component ids are
+    written to the component file as native 64-bit integers, one per vertex
+
+    Args:
+        edge_path(str): the path of the edge file
+        component_path(str): the path of the component file to write
+        vertex_count(int): the amount of vertices, determined from the edge
+            file if not provided
+        block_edges(int): the maximum amount of edges per block
+        memory_edges(int): the amount of edges that may be loaded in memory
+        work_dir(str): the directory for the state files, a temporary
+            directory if not provided
+
+    Returns:
+        int: the amount of strongly connected components """
+
+    if vertex_count is None:
+        vertex_count = count_vertices(edge_path, block_edges)
+    state = _State(edge_path, vertex_count, block_edges, work_dir,
+                   component_path)
+    try:
+        while True:
+            alive_edges = state.trim()
+            if alive_edges <= memory_edges:
+                state.finish_sccs_in_memory()
+                break
+            state.colour()
+
+        components = state.components.values
+        return sum(1 for v in range(vertex_count) if components[v] == v)
+    finally:
+        state.close()
+
+
+def is_cyclic_external(edge_path: str, vertex_count: Optional[int] = None,
+                       block_edges: int = BLOCK_EDGES,
+                       memory_edges: int = MEMORY_EDGES,
+                       work_dir: Optional[str] = None) -> bool:
+    """ Function that checks whether the directed graph in an edge file
+    contains a cycle, in bounded memory. Vertices without incoming or outgoing
+    edges are trimmed until none are left to trim. Every remaining vertex
+    has incoming and outgoing edges, so the directed graph contains a cycle
+    if any edges remain. Remaining edges that fit in memory are checked in
+    memory
+
+    Args:
+        edge_path(str): the path of the edge file
+        vertex_count(int): the amount of vertices, determined from the edge
+            file if not provided
+        block_edges(int): the maximum amount of edges per block
+        memory_edges(int): the amount of edges that may be loaded in memory
+        work_dir(str): the directory for the state files, a temporary
+            directory if not provided
+
+    Returns:
+        bool: True if the directed graph contains a cycle, otherwise False """
+
+    if vertex_count is None:
+        vertex_count = count_vertices(edge_path, block_edges)
+    state = _State(edge_path, vertex_count, block_edges, work_dir)
+    try:
+        # Every vertex that survives trimming has incoming and outgoing
+        # edges, so if any edges remain, they contain a cycle
+        if state.trim() <= memory_edges:
+            return cyclic.is_cyclic_adjacency(state.load_alive())
+        return True
+    finally:
+        state.close()
+
+
+class _State(object):
+    """ Class that holds the memory-mapped per-vertex state of the external
+    algorithms. A vertex is alive as long as no component is assigned to it,
+    an edge is alive if both its tail and head are alive """
+
+    def __init__(self, edge_path: str, vertex_count: int, block_edges: int,
+                 work_dir: Optional[str],
+                 component_path: Optional[str] = None):
+        self._edge_path = edge_path
+        self._n = vertex_count
+        self._block_edges = block_edges
+        self._own_dir = work_dir is None
+        self._dir = tempfile.mkdtemp() if work_dir is None else work_dir
+        if component_path is None:
+            component_path = os.path.join(self._dir, "components")
+        self.components = MappedArray(component_path, vertex_count,
+                                      EDGE_TYPECODE, UNASSIGNED)
+        self._indegrees = MappedArray(os.path.join(self._dir, "indegrees"),
+                                      vertex_count, EDGE_TYPECODE)
+        self._outdegrees = MappedArray(os.path.join(self._dir, "outdegrees"),
+                                       vertex_count, EDGE_TYPECODE)
+        self._trimmed_at = MappedArray(os.path.join(self._dir, "trimmed_at"),
+                                       vertex_count, EDGE_TYPECODE)
+        self._colours: Optional[MappedArray] = None
+        self._marks: Optional[MappedArray] = None
+        self.trimmed = 0
+
+    def _blocks(self) -> Iterator[array]:
+        return read_edge_blocks(self._edge_path, self._block_edges)
+
+    def trim(self) -> int:
+        """ Method that assigns a component of its own to every alive vertex
+        without alive incoming or outgoing edges, until no such vertex is
+        left. The first pass counts the degrees, every next pass subtracts
+        the edges of the vertices that were trimmed since the previous pass
+        reached them, and trims the vertices that run out of edges
+
+        Returns:
+            int: the amount of alive edges that remain after trimming """
+
+        components = self.components.values
+        indegrees = self._indegrees.values
+        outdegrees = self._outdegrees.values
+        trimmed_at = self._trimmed_at.values
+        for v in range(self._n):
+            indegrees[v] = 0
+            outdegrees[v] = 0
+            trimmed_at[v] = ALIVE if components[v] == UNASSIGNED else -1
+        edges = 0
+        alive_edges = 0
+        for block in self._blocks():
+            for i in range(0, len(block), 2):
+                tail, head = block[i], block[i + 1]
+                if components[tail] == UNASSIGNED and \
+                        components[head] == UNASSIGNED:
+                    outdegrees[tail] += 1
+                    indegrees[head] += 1
+                    alive_edges += 1
+            edges += len(block) // 2
+
+        self.trimmed = 0
+        for v in range(self._n):
+            if components[v] == UNASSIGNED and \
+                    (indegrees[v] == 0 or outdegrees[v] == 0):
+                components[v] = v
+                trimmed_at[v] = edges
+                self.trimmed += 1
+
+        step = edges
+        trimmed = self.trimmed
+        while trimmed:
+            trimmed = 0
+            for block in self._blocks():
+                for i in range(0, len(block), 2):
+                    tail, head = block[i], block[i + 1]
+                    if step - edges < min(trimmed_at[tail],
+                                          trimmed_at[head]) <= step:
+                        alive_edges -= 1
+                        outdegrees[tail] -= 1
+                        indegrees[head] -= 1
+                        for v in (tail, head):
+                            if components[v] == UNASSIGNED and \
+                                    (indegrees[v] == 0 or outdegrees[v] == 0):
+                                components[v] = v
+                                trimmed_at[v] = step + 1
+                                trimmed += 1
+                    step += 1
+            self.trimmed += trimmed
+        return alive_edges
+
+    def load_alive(self) -> Adjacency:
+        """ Method that loads the alive edges into an adjacency, of which the
+        vertices are the vertex ids
+
+        Returns:
+            Adjacency: the adjacency of the alive edges """
+
+        components = self.components.values
+        heads: Dict[int, List[int]] = dict()
+        for block in self._blocks():
+            for i in range(0, len(block), 2):
+                tail, head = block[i], block[i + 1]
+                if components[tail] == UNASSIGNED and \
+                        components[head] == UNASSIGNED:
+                    heads.setdefault(tail, list()).append(head)
+                    heads.setdefault(head, list())
+        return Adjacency.from_mapping(heads)
+
+    def finish_sccs_in_memory(self):
+        """ Method that assigns the components of the alive vertices, by
+        calculating the SCCs of the alive edges in memory """
+
+        components = self.components.values
+        adjacency = self.load_alive()
+        ids = adjacency.get_vertices()
+        for scc in kosaraju_sccs.sccs_positions(adjacency):
+            component = max(ids[i] for i in scc)
+            for i in scc:
+                components[ids[i]] = component
+        for v in range(self._n):
+            if components[v] == UNASSIGNED:
+                components[v] = v
+
+    def colour(self):
+        """ Method that runs one round of the colouring algorithm, which
+        assigns the components of at least one SCC """
+
+        if self._colours is None:
+            self._colours = MappedArray(os.path.join(self._dir, "colours"),
+                                        self._n, EDGE_TYPECODE)
+            self._marks = MappedArray(os.path.join(self._dir, "marks"),
+                                      self._n, "B")
+        components = self.components.values
+        colours = self._colours.values
+        marks = self._marks.values
+        for v in range(self._n):
+            colours[v] = v
+        changed = True
+        while changed:
+            changed = False
+            for block in self._blocks():
+                for i in range(0, len(block), 2):
+                    tail, head = block[i], block[i + 1]
+                    if colours[tail] > colours[head] and \
+                            components[tail] == UNASSIGNED and \
+                            components[head] == UNASSIGNED:
+                        colours[head] = colours[tail]
+                        changed = True
+
+        for v in range(self._n):
+            marks[v] = components[v] == UNASSIGNED and colours[v] == v
+        changed = True
+        while changed:
+            changed = False
+            for block in self._blocks():
+                for i in range(0, len(block), 2):
+                    tail, head = block[i], block[i + 1]
+                    if marks[head] and not marks[tail] and \
+                            colours[tail] == colours[head] and \
+                            components[tail] == UNASSIGNED:
+                        marks[tail] = 1
+                        changed = True
+
+        for v in range(self._n):
+            if marks[v]:
+                components[v] = colours[v]
+
+    def close(self):
+        for mapped in [self.components, self._indegrees, self._outdegrees,
+                       self._trimmed_at, self._colours, self._marks]:
+            if mapped is not None:
+                mapped.close()
+        if self._own_dir:
+            shutil.rmtree(self._dir, ignore_errors=True)
@@ -0,0 +1,175 @@
+""" Module that contains the logic for calculating a feedback arc set of a
+directed graph: a set of edges whose removal leaves a directed acyclic graph
+(https://en.wikipedia.org/wiki/Feedback_arc_set)
+
+Finding a minimum feedback arc set is NP-hard, the Eades-Lin-Smyth heuristic
+finds a small one in O(V + E). Only edges within a strongly connected
+component can be on a cycle, so the heuristic orders the vertices while only
+counting the edges within their SCC. Vertices without outgoing edges are put
+at the end of the order, vertices without incoming edges at the start, and
+otherwise the vertex with the largest outdegree minus indegree goes to the
+start. The vertices are kept in bucket queues keyed on that difference. The
+edges that point backwards in the order form the feedback arc set """
+
+from array import array
+from typing import List
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . edge import Edge
+from . kosaraju_sccs import sccs_positions
+
+METHODS = ["eades"]
+NONE = -1
+
+
+def feedback_arc_set(directed_graph: DirectedGraphCore,
+                     method: str = "eades") -> List[Edge]:
+    """ Function that calculates a feedback arc set of the directed graph
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        method(str): The heuristic, only "eades" is supported
+
+    Returns:
+        list: The edges whose removal makes the directed graph acyclic """
+
+    if method not in METHODS:
+        raise RuntimeError(f"Unknown feedback arc set method {method}")
+    adjacency = directed_graph.get_adjacency()
+    edges = adjacency.get_edges()
+    return [edges[i] for i in feedback_arc_positions(adjacency)]
+
+
+def feedback_arc_positions(adjacency: Adjacency) -> array:
+    """ Function that calculates a feedback arc set of an adjacency with the
+    Eades-Lin-Smyth heuristic, applied within every SCC
+
+    Args:
+        adjacency (Adjacency): The adjacency
+
+    Returns:
+        array: The positions of the edges of the feedback arc set """
+
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    components = array("l", [0]) * n
+    for component, scc in enumerate(sccs_positions(adjacency)):
+        for vertex in scc:
+            components[vertex] = component
+
+    order = _eades_order(adjacency, components)
+    ranks = array("l", [0]) * n
+    for rank, vertex in enumerate(order):
+        ranks[vertex] = rank
+    return array("l", (i for tail in range(n)
+                       for i in range(offsets[tail], offsets[tail + 1])
+                       if components[tail] == components[heads[i]] and
+                       ranks[heads[i]] <= ranks[tail]))
+
+
+def _eades_order(adjacency: Adjacency, components: array) -> array:
+    """ Function that orders the positions with the Eades-Lin-Smyth
+    heuristic, counting only the edges between different positions in the
+    same component
+
+    Returns:
+        array: The positions in order """
+
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    transposed = adjacency.transpose()
+    t_offsets = transposed.get_offsets()
+    t_heads = transposed.get_heads()
+
+    outdegrees = array("l", [0]) * n
+    indegrees = array("l", [0]) * n
+    for tail in range(n):
+        for i in range(offsets[tail], offsets[tail + 1]):
+            head = heads[i]
+            if head != tail and components[head] == components[tail]:
+                outdegrees[tail] += 1
+                indegrees[head] += 1
+
+    # Bucket 0 holds the sinks, bucket 1 the sources and bucket 2 + d + m
+    # the other vertices with outdegree minus indegree d, with m the highest
+    # degree. The buckets are doubly linked lists
+    m = max(max(outdegrees, default=0), max(indegrees, default=0))
+    firsts = array("l", [NONE]) * (2 * m + 3)
+    nexts = array("l", [NONE]) * n
+    previous = array("l", [NONE]) * n
+    buckets = array("l", [0]) * n
+    removed = bytearray(n)
+
+    def bucket_of(vertex: int) -> int:
+        if outdegrees[vertex] == 0:
+            return 0
+        if indegrees[vertex] == 0:
+            return 1
+        return 2 + outdegrees[vertex] - indegrees[vertex] + m
+
+    def insert(vertex: int, bucket: int):
+        buckets[vertex] = bucket
+        first = firsts[bucket]
+        nexts[vertex] = first
+        previous[vertex] = NONE
+        if first != NONE:
+            previous[first] = vertex
+        firsts[bucket] = vertex
+
+    def unlink(vertex: int):
+        before, after = previous[vertex], nexts[vertex]
+        if before == NONE:
+            firsts[buckets[vertex]] = after
+        else:
+            nexts[before] = after
+        if after != NONE:
+            previous[after] = before
+
+    top = 2
+    for vertex in range(n):
+        bucket = bucket_of(vertex)
+        insert(vertex, bucket)
+        top = max(top, bucket)
+
+    start = array("l")
+    end = array("l")
+    remaining = n
+    while remaining:
+        if firsts[0] != NONE:
+            vertex = firsts[0]
+            end.append(vertex)
+        elif firsts[1] != NONE:
+            vertex = firsts[1]
+            start.append(vertex)
+        else:
+            while firsts[top] == NONE:
+                top -= 1
+            vertex = firsts[top]
+            start.append(vertex)
+        unlink(vertex)
+        removed[vertex] = 1
+        remaining -= 1
+
+        component = components[vertex]
+        for i in range(offsets[vertex], offsets[vertex + 1]):
+            head = heads[i]
+            if not removed[head] and components[head] == component:
+                indegrees[head] -= 1
+                unlink(head)
+                bucket = bucket_of(head)
+                insert(head, bucket)
+                top = max(top, bucket)
+        for i in range(t_offsets[vertex], t_offsets[vertex + 1]):
+            tail = t_heads[i]
+            if not removed[tail] and components[tail] == component:
+                outdegrees[tail] -= 1
+                unlink(tail)
+                bucket = bucket_of(tail)
+                insert(tail, bucket)
+                top = max(top, bucket)
+
+    end.reverse()
+    start.extend(end)
+    return start
@@ -0,0 +1,135 @@
+""" Module that contains the logic for calculating fingerprints of directed
+graphs, to find directed graphs with the same shape and to key caches of
+algorithm results by them. All fingerprints take O(V + E) hashing, colours
+and fingerprints are blake2b hashes, so they are equal across processes.
+
+The label-insensitive fingerprint uses Weisfeiler-Lehman colour refinement
+(https://en.wikipedia.org/wiki/Weisfeiler_Leman_graph_isomorphism_test):
+every position starts with the same colour, and in each of a fixed amount of
+rounds its colour is replaced by the hash of its colour and the sorted
+colours of its heads and of its tails. The fingerprint is the hash of the
+sorted final colours. Isomorphic directed graphs get equal fingerprints, but
+directed graphs with equal fingerprints need not be isomorphic, so it must
+not be used to share algorithm results.
+
+The label-sensitive fingerprint is the hash of the sorted label hashes and
+the sorted (tail, head) pairs of label hashes, it determines the vertices
+and edges of the directed graph (up to hash collisions). The adjacency key
+additionally depends on the order in which the algorithms visit the
+vertices and their heads, directed graphs with equal adjacency keys get
+exactly the same results from the algorithms. Without the labels, the
+adjacency key still determines the shape of the directed graph: directed
+graphs with equal structural adjacency keys only differ in the labels of
+their positions, so they get the same results in terms of positions """
+
+from array import array
+from hashlib import blake2b
+from typing import Any, Iterable
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+
+ROUNDS = 3
+
+
+def fingerprint(directed_graph: DirectedGraphCore,
+                labels: bool = False) -> str:
+    """ Function that calculates the fingerprint of the directed graph
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        labels(bool): If True, the labels of the vertices are part of the
+            fingerprint
+
+    Returns:
+        str: The fingerprint, as a hex string """
+
+    return fingerprint_adjacency(directed_graph.get_adjacency(), labels)
+
+
+def fingerprint_adjacency(adjacency: Adjacency, labels: bool = False,
+                          rounds: int = ROUNDS) -> str:
+    """ Function that calculates the fingerprint of an adjacency, see
+    fingerprint
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        labels(bool): If True, the labels of the vertices are part of the
+            fingerprint
+        rounds(int): The amount of refinement rounds of the label-insensitive
+            fingerprint
+
+    Returns:
+        str: The fingerprint, as a hex string """
+
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    digest = blake2b(digest_size=16)
+    if labels:
+        colours = array("Q", (_hash(_label_key(vertex.get_label()))
+                              for vertex in adjacency.get_vertices()))
+        pairs = sorted((colours[tail], colours[heads[i]])
+                       for tail in range(n)
+                       for i in range(offsets[tail], offsets[tail + 1]))
+        digest.update(f"labels {n} {len(pairs)}".encode())
+        digest.update(array("Q", sorted(colours)).tobytes())
+        digest.update(array("Q", (colour for pair in pairs
+                                  for colour in pair)).tobytes())
+        return digest.hexdigest()
+
+    colours = array("Q", [0]) * n
+    sides = [adjacency, adjacency.transpose()]
+    for _ in range(rounds):
+        colours = _refine(sides, colours)
+    digest.update(f"structure {n} {adjacency.get_edges_count()} "
+                  f"{rounds}".encode())
+    digest.update(array("Q", sorted(colours)).tobytes())
+    return digest.hexdigest()
+
+
+def adjacency_key(adjacency: Adjacency, labels: bool = True) -> str:
+    """ Function that calculates the hash of the adjacency as the algorithms
+    traverse it: the labels in the order of the positions, the offsets and
+    the heads in the order of the edges
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        labels(bool): If False, the labels are left out
+
+    Returns:
+        str: The key, as a hex string """
+
+    digest = blake2b(digest_size=16)
+    digest.update(b"labels" if labels else b"structure")
+    for vertex in adjacency.get_vertices() if labels else ():
+        key = _label_key(vertex.get_label())
+        digest.update(len(key).to_bytes(8, "little"))
+        digest.update(key)
+    digest.update(array("q", adjacency.get_offsets()).tobytes())
+    digest.update(array("q", adjacency.get_heads()).tobytes())
+    return digest.hexdigest()
+
+
+def _refine(sides: Iterable[Adjacency], colours: array) -> array:
+    """ Function that calculates the colours of the next round, from the
+    colours of the positions and of their heads in every adjacency """
+
+    n = len(colours)
+    keys = [[colour] for colour in colours]
+    for side in sides:
+        offsets = side.get_offsets()
+        heads = side.get_heads()
+        for vertex in range(n):
+            neighbours = sorted(colours[heads[i]] for i in
+                                range(offsets[vertex], offsets[vertex + 1]))
+            keys[vertex].append(len(neighbours))
+            keys[vertex].extend(neighbours)
+    return array("Q", (_hash(array("Q", key).tobytes()) for key in keys))
+
+
+def _label_key(label: Any) -> bytes:
+    return f"{type(label).__name__}:{label!r}".encode()
+
+
+def _hash(data: bytes) -> int:
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
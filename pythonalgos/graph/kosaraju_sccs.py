@@ -1,8 +1,11 @@
 from pythonalgos.util.advisor import Advisor
 from pythonalgos.graph.vertex import Vertex
 from .. util.logging import Logging
+from .. util.steps import run_steps, Steps, STEP_SIZE
+from . adjacency import Adjacency
 from . directed_graph_core import DirectedGraphCore
-from typing import Any, List, MutableMapping, Set
+from array import array
+from typing import List, Set
 
 """ Module that contains the logic for kosaraju's SCCs algorithm
 """
@@ -17,6 +20,11 @@ def create_sccs_kosaraju_dfs(directed_graph: DirectedGraphCore,
     (https://en.wikipedia.org/wiki/Kosaraju%27s_algorithm) with a
     depth-first-search approach.
 
+    The directed graph is neither copied nor reversed, the second pass of the
+    algorithm follows the transposed adjacency of the directed graph. The SCCs
+    are returned in topological order of the condensation of the directed
+    graph.
+
     Args:
         directed_graph (DirectedGraph): The directed graph for which the SCCS
             should be calculated nontrivial(bool): If True, only nontrivial
@@ -30,92 +38,223 @@ def create_sccs_kosaraju_dfs(directed_graph: DirectedGraphCore,
         list(set()) of SCCs: Each SCC is a set of vertices
     """
 
-    dg = directed_graph.copy()
-
-    def filter_nontrivial(sccs_trivial: List[Set[Vertex]]) -> \
-            List[Set[Vertex]]:
-        """ This function filters out the trivial sccs
-
-        A scc is nontrivial, iff there are at least two vertices in it,
-        or there is only one vertex with a self-loop. A self-loop means
-        that the indegree and the outdegree are both 1 and the tail is equal
-        to the head
-
-        Args:
-            sccs(list): The list of trivial sccs
-
-        Returns:
-            sccs_nontrivial(list): The list of nontrivial sccs
-        """
-
-        sccs_non_trivial = list()
-        for scc in sccs_trivial:
-            vertex = next(iter(scc))
-            if len(scc) >= 2 or \
-                (len(scc) == 1 and vertex.get_indegree() == 1 and
-                    vertex.get_outdegree() == 1 and
-                    vertex.get_edge_heads()[0] == vertex):
-                sccs_non_trivial.append(scc)
-
-        return sccs_non_trivial
-
-    def visit_dfs_sccs(vertex: Vertex, visited: MutableMapping[Any, bool],
-                       scc: Set[Vertex], scc_id: int):
-        """ Function that performs a recursive depth first search on the
-        directed graph to check whether vertices have been visisted
-
-        Args:
-            vertex (label): The current vertex
-            visited (dict): A dictionary that maintains whether vertices have
-                been visited
-            scc (set): The current scc being constructed
-        """
-
-        visited[vertex] = True
-        scc.add(vertex)
-        advisor.advise("add_vertex_to_scc", dg, vertex, scc_id)
-        for head in vertex.get_edge_heads():
-            if visited.get(head) is None:
-                visit_dfs_sccs(head, visited, scc, scc_id)
-
-    def fill_order_dfd_sccs(vertex: Vertex,
-                            visited: MutableMapping[Vertex, bool],
-                            stack: List[Vertex]):
-        """ Function that covers the first part of the algorith by determining
-        the order of vertices, traversing the graph with a depth first search,
-        recursively.
-
-        Args:
-            vertex(str): The current vertex
-            visited (dict): A dictionary that maintains whether vertices have
-                been visited
-            stack (list): stack that will be processed, used to inverse the
-                order
-        """
-
-        visited[vertex] = True
-        advisor.advise("visit_vertex", dg, vertex)
-        for head in vertex.get_edge_heads():
-            if visited.get(head) is None:
-                fill_order_dfd_sccs(head, visited, stack)
-        stack.append(vertex)
-        advisor.advise("add_vertex_to_stack", dg, vertex, len(stack))
-
-    stack: List[Vertex] = list()
+    return run_steps(create_sccs_kosaraju_dfs_steps(directed_graph,
+                                                    nontrivial, advisor))
+
+
+def create_sccs_kosaraju_dfs_steps(directed_graph: DirectedGraphCore,
+                                   nontrivial: bool, advisor: Advisor,
+                                   step_size: int = STEP_SIZE) -> Steps:
+    """ Step generator version of create_sccs_kosaraju_dfs, it yields the
+    amount of vertices that were processed, see sccs_positions_steps
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        nontrivial: if true, retrieves the nontrivial sccs, if not, also the
+            trivial ones
+        advisor(Advisor): Object that contains advice which can be inserted at
+            join points
+        step_size(int): The amount of vertices to process between yields
+
+    Returns:
+        list(set()) of SCCs: Each SCC is a set of vertices
+    """
+
+    adjacency = directed_graph.get_adjacency()
+    vertices = adjacency.get_vertices()
+    yield 0
+    components = yield from sccs_positions_steps(adjacency, directed_graph,
+                                                 advisor, step_size)
+    if nontrivial:
+        components = filter_nontrivial(adjacency, components)
+
     sccs: List[Set[Vertex]] = list()
-    visited: MutableMapping[Vertex, bool] = dict()
-    for vertex in dg.get_vertices():
-        if visited.get(vertex) is None:
-            fill_order_dfd_sccs(vertex, visited, stack)
-        else:
-            Logging.log("Vertex {0} already visited, skipping", vertex)
-
-    visited = dict()
-    dg.reversed()
-    advisor.advise("reverse_directed_graph", dg)
+    converted = 0
+    for component in components:
+        sccs.append({vertices[i] for i in component})
+        converted += len(component)
+        if converted >= step_size:
+            converted = 0
+            yield len(vertices)
+    return sccs
+
+
+def filter_nontrivial(adjacency: Adjacency,
+                      components: List[List[int]]) -> List[List[int]]:
+    """ This function filters out the trivial sccs
+
+    A scc is nontrivial, iff there are at least two vertices in it, or there
+    is only one vertex with a self-loop.
+
+    Args:
+        adjacency (Adjacency): The adjacency the sccs were calculated on
+        components(list): The list of sccs, as lists of vertex positions
+
+    Returns:
+        list: The list of nontrivial sccs
+    """
+
+    return [component for component in components
+            if len(component) >= 2 or
+            adjacency.has_self_loop(component[0])]
+
+
+def postorder_positions(adjacency: Adjacency, directed_graph=None,
+                        advisor: Advisor = None) -> array:
+    """ Function that covers the first part of the algorithm by determining
+    the order of vertices, traversing the adjacency iteratively with a depth
+    first search.
+
+    Args:
+        adjacency (Adjacency): The adjacency to traverse
+        directed_graph (DirectedGraph): The directed graph, passed to advice
+        advisor(Advisor): Object that contains advice, optional
+
+    Returns:
+        array: The positions of the vertices in depth first post-order
+    """
+
+    stack = array("l")
+    run_steps(postorder_positions_steps(adjacency, stack, directed_graph,
+                                        advisor))
+    return stack
+
+
+def postorder_positions_steps(adjacency: Adjacency, stack: array,
+                              directed_graph=None, advisor: Advisor = None,
+                              step_size: int = STEP_SIZE) -> Steps:
+    """ Step generator version of postorder_positions, it appends the
+    positions to the provided stack and yields the amount of vertices that
+    were visited after every step_size vertices
+
+    Args:
+        adjacency (Adjacency): The adjacency to traverse
+        stack (array): The array the post-order is appended to
+        directed_graph (DirectedGraph): The directed graph, passed to advice
+        advisor(Advisor): Object that contains advice, optional
+        step_size(int): The amount of vertices to visit between yields
+    """
+
+    vertices = adjacency.get_vertices()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    visited = bytearray(len(vertices))
+    count = 0
+    for start in range(len(vertices)):
+        if visited[start]:
+            Logging.log("Vertex {0} already visited, skipping",
+                        vertices[start])
+            continue
+
+        visited[start] = 1
+        if advisor is not None:
+            advisor.advise("visit_vertex", directed_graph, vertices[start])
+        count += 1
+        if count % step_size == 0:
+            yield count
+        path = [start]
+        cursors = [offsets[start]]
+        while path:
+            vertex = path[-1]
+            cursor = cursors[-1]
+            if cursor < offsets[vertex + 1]:
+                cursors[-1] = cursor + 1
+                head = heads[cursor]
+                if not visited[head]:
+                    visited[head] = 1
+                    if advisor is not None:
+                        advisor.advise("visit_vertex", directed_graph,
+                                       vertices[head])
+                    path.append(head)
+                    cursors.append(offsets[head])
+                    count += 1
+                    if count % step_size == 0:
+                        yield count
+            else:
+                path.pop()
+                cursors.pop()
+                stack.append(vertex)
+                if advisor is not None:
+                    advisor.advise("add_vertex_to_stack", directed_graph,
+                                   vertices[vertex], len(stack))
+
+
+def sccs_positions(adjacency: Adjacency, directed_graph=None,
+                   advisor: Advisor = None) -> List[List[int]]:
+    """ Function that calculates the sccs on an adjacency, in topological
+    order of the condensation.
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        directed_graph (DirectedGraph): The directed graph, passed to advice
+        advisor(Advisor): Object that contains advice, optional
+
+    Returns:
+        list(list()): Each SCC is a list of vertex positions
+    """
+
+    return run_steps(sccs_positions_steps(adjacency, directed_graph, advisor))
+
+
+def sccs_positions_steps(adjacency: Adjacency, directed_graph=None,
+                         advisor: Advisor = None,
+                         step_size: int = STEP_SIZE) -> Steps:
+    """ Step generator version of sccs_positions. Every vertex is visited
+    twice, once in each pass, the yielded amount of processed vertices is half
+    the amount of visits
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        directed_graph (DirectedGraph): The directed graph, passed to advice
+        advisor(Advisor): Object that contains advice, optional
+        step_size(int): The amount of visits between yields
+
+    Returns:
+        list(list()): Each SCC is a list of vertex positions
+    """
+
+    stack = array("l")
+    for count in postorder_positions_steps(adjacency, stack, directed_graph,
+                                           advisor, step_size):
+        yield count // 2
+    if advisor is not None:
+        advisor.advise("reverse_directed_graph", directed_graph)
+
+    transposed = adjacency.transpose()
+    yield len(stack) // 2
+    vertices = transposed.get_vertices()
+    offsets = transposed.get_offsets()
+    heads = transposed.get_heads()
+    visited = bytearray(len(vertices))
+    sccs: List[List[int]] = list()
+    count = len(vertices)
     for i in reversed(stack):
-        if visited.get(i) is None:
-            sccs.append(set())
-            visit_dfs_sccs(i, visited, sccs[-1], len(sccs))
+        if visited[i]:
+            continue
+
+        visited[i] = 1
+        scc = [i]
+        sccs.append(scc)
+        if advisor is not None:
+            advisor.advise("add_vertex_to_scc", directed_graph, vertices[i],
+                           len(sccs))
+        todo = [i]
+        while todo:
+            vertex = todo.pop()
+            for j in range(offsets[vertex], offsets[vertex + 1]):
+                head = heads[j]
+                if not visited[head]:
+                    visited[head] = 1
+                    scc.append(head)
+                    if advisor is not None:
+                        advisor.advise("add_vertex_to_scc", directed_graph,
+                                       vertices[head], len(sccs))
+                    todo.append(head)
+                    count += 1
+                    if count % step_size == 0:
+                        yield count // 2
+        count += 1
+        if count % step_size == 0:
+            yield count // 2
 
-    return filter_nontrivial(sccs) if nontrivial else sccs
+    return sccs
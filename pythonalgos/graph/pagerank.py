@@ -0,0 +1,137 @@
+""" Module that contains the logic for ranking the vertices of a directed graph
+with PageRank (https://en.wikipedia.org/wiki/PageRank), by power iteration on
+the adjacency.
+
+If NumPy is installed, every iteration is a handful of vector operations on
+the offsets and heads arrays, otherwise the iterations run over the arrays in
+pure Python. Vertices without edges (dangling vertices) spread their rank
+uniformly over all vertices """
+
+from array import array
+from typing import Any, Dict, Mapping, Optional
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . vertex import Vertex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def pagerank(directed_graph: DirectedGraphCore, damping: float = 0.85,
+             tol: float = 1.0e-6, max_iter: int = 100,
+             start: Optional[Mapping[Vertex, float]] = None) -> \
+        Dict[Vertex, float]:
+    """ Function that calculates the PageRank of the vertices of the directed
+    graph
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        damping(float): The probability to follow an edge, rather than to
+            jump to a random vertex
+        tol(float): The iteration stops when the sum of the absolute changes
+            of the ranks is below the amount of vertices times tol
+        max_iter(int): The maximum amount of iterations
+        start(dict): The ranks to start the iteration from, for instance the
+            result of an earlier call before the directed graph was slightly
+            changed. Vertices without a rank in it start at 1/n
+
+    Returns:
+        dict: The rank per vertex, the ranks add up to 1 """
+
+    adjacency = directed_graph.get_adjacency()
+    vertices = adjacency.get_vertices()
+    n = len(vertices)
+    if n == 0:
+        return dict()
+
+    ranks = [1.0 / n] * n
+    if start is not None:
+        ranks = [start.get(vertex, 1.0 / n) for vertex in vertices]
+        total = sum(ranks)
+        if total <= 0:
+            raise RuntimeError("The start ranks must have a positive sum")
+        ranks = [rank / total for rank in ranks]
+
+    if numpy is not None:
+        ranks = pagerank_numpy(adjacency, ranks, damping, tol,
+                               max_iter).tolist()
+    else:
+        ranks = list(pagerank_positions(adjacency, ranks, damping, tol,
+                                        max_iter))
+    return {vertex: ranks[i] for i, vertex in enumerate(vertices)}
+
+
+def pagerank_positions(adjacency: Adjacency, ranks: Any, damping: float,
+                       tol: float, max_iter: int) -> array:
+    """ Function that runs the power iteration in pure Python
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        ranks: The start rank per position, adding up to 1
+        damping(float): The probability to follow an edge
+        tol(float): The tolerance per vertex
+        max_iter(int): The maximum amount of iterations
+
+    Returns:
+        array: The rank per position """
+
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    dangling = array("l", (tail for tail in range(n)
+                           if offsets[tail] == offsets[tail + 1]))
+    ranks = array("d", ranks)
+    for _ in range(max_iter):
+        dangling_rank = sum(ranks[tail] for tail in dangling)
+        base = (1.0 - damping + damping * dangling_rank) / n
+        new_ranks = array("d", [base]) * n
+        for tail in range(n):
+            begin, end = offsets[tail], offsets[tail + 1]
+            if begin != end:
+                share = damping * ranks[tail] / (end - begin)
+                for i in range(begin, end):
+                    new_ranks[heads[i]] += share
+
+        error = sum(abs(new_ranks[i] - ranks[i]) for i in range(n))
+        ranks = new_ranks
+        if error < n * tol:
+            return ranks
+
+    raise RuntimeError(f"PageRank didn't converge in {max_iter} iterations")
+
+
+def pagerank_numpy(adjacency: Adjacency, ranks: Any, damping: float,
+                   tol: float, max_iter: int) -> Any:
+    """ Function that runs the power iteration with NumPy vector operations
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        ranks: The start rank per position, adding up to 1
+        damping(float): The probability to follow an edge
+        tol(float): The tolerance per vertex
+        max_iter(int): The maximum amount of iterations
+
+    Returns:
+        numpy.ndarray: The rank per position """
+
+    n = adjacency.get_vertices_count()
+    offsets = numpy.asarray(adjacency.get_offsets(), dtype=numpy.int64)
+    heads = numpy.asarray(adjacency.get_heads(), dtype=numpy.int64)
+    outdegrees = numpy.diff(offsets)
+    tails = numpy.repeat(numpy.arange(n), outdegrees)
+    dangling = outdegrees == 0
+    weights = numpy.zeros(n)
+    weights[~dangling] = damping / outdegrees[~dangling]
+    ranks = numpy.asarray(ranks, dtype=numpy.float64)
+    for _ in range(max_iter):
+        base = (1.0 - damping + damping * ranks[dangling].sum()) / n
+        new_ranks = numpy.bincount(heads, weights=(ranks * weights)[tails],
+                                   minlength=n) + base
+        error = numpy.abs(new_ranks - ranks).sum()
+        ranks = new_ranks
+        if error < n * tol:
+            return ranks
+
+    raise RuntimeError(f"PageRank didn't converge in {max_iter} iterations")
@@ -0,0 +1,353 @@
+""" Module that contains the logic for partitioning a directed graph into k
+balanced parts with few edges between them, to shard a directed graph over
+worker processes (https://en.wikipedia.org/wiki/Graph_partition)
+
+Two methods are supported, both ignore the direction of the edges:
+
+- "bfs_grow" grows the parts one after the other from a seed, adding the
+  frontier vertex with the most edges into the part first, until a part
+  holds its share of the vertices
+- "label_propagation" starts from the parts of "bfs_grow" and repeatedly
+  moves every vertex to the part that most of its neighbours are in, as long
+  as that part has room. The preferred parts of a round are calculated from
+  the parts of the previous round only, so chunks of positions can be
+  calculated in parallel in an executor. Every vertex that prefers another
+  part moves with probability 1/2, which keeps neighbours from swapping
+  parts back and forth
+
+With an executor, the adjacency arrays are written into a shared memory
+block once, and the parts once per round. The tasks only carry the name of
+the block and the bounds of their chunk, so a process pool doesn't pickle the
+directed graph for every chunk. A thread pool gives the same result, but
+doesn't run the chunks in parallel """
+
+from array import array
+from concurrent.futures import Executor
+from heapq import heappop, heappush
+from multiprocessing import shared_memory
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . edge import Edge
+from . vertex import Vertex
+
+METHODS = ["label_propagation", "bfs_grow"]
+UNASSIGNED = -1
+IMBALANCE = 0.1
+MAX_ROUNDS = 20
+CHUNK_SIZE = 4096
+
+
+class Partition(object):
+    """ Class that holds a partition of a directed graph: the part per
+    position of its adjacency, a directed graph per part and the boundary
+    edges of every part, which cross to another part """
+
+    def __init__(self, adjacency: Adjacency, parts: array, k: int,
+                 shards: List[Any]):
+        """ Initialises the partition
+
+        Args:
+            adjacency (Adjacency): The adjacency that was partitioned
+            parts(array): The part (0..k-1) per position
+            k(int): The amount of parts
+            shards(list): The directed graph per part
+        """
+
+        self._adjacency = adjacency
+        self._parts = parts
+        self._shards = shards
+        self._outgoing = [array("l") for _ in range(k)]
+        self._incoming = [array("l") for _ in range(k)]
+        offsets = adjacency.get_offsets()
+        heads = adjacency.get_heads()
+        for tail in range(adjacency.get_vertices_count()):
+            for i in range(offsets[tail], offsets[tail + 1]):
+                if parts[tail] != parts[heads[i]]:
+                    self._outgoing[parts[tail]].append(i)
+                    self._incoming[parts[heads[i]]].append(i)
+
+    def get_parts(self) -> array:
+        return self._parts
+
+    def get_part(self, vertex: Vertex) -> int:
+        return self._parts[self._adjacency.get_position(vertex)]
+
+    def get_shards(self) -> List[Any]:
+        return self._shards
+
+    def get_shard(self, part: int) -> Any:
+        return self._shards[part]
+
+    def get_outgoing_edges(self, part: int) -> List[Edge]:
+        """ Returns the edges from the part to other parts
+
+        Args:
+            part(int): the part
+
+        Returns:
+            list: the edges of which the tail is in the part and the head in
+                another part """
+
+        edges = self._adjacency.get_edges()
+        return [edges[i] for i in self._outgoing[part]]
+
+    def get_incoming_edges(self, part: int) -> List[Edge]:
+        """ Returns the edges from other parts to the part
+
+        Args:
+            part(int): the part
+
+        Returns:
+            list: the edges of which the head is in the part and the tail in
+                another part """
+
+        edges = self._adjacency.get_edges()
+        return [edges[i] for i in self._incoming[part]]
+
+    def get_cut_size(self) -> int:
+        return sum(len(outgoing) for outgoing in self._outgoing)
+
+
+def partition(directed_graph: DirectedGraphCore, k: int,
+              method: str = "label_propagation",
+              imbalance: float = IMBALANCE,
+              executor: Optional[Executor] = None, seed: int = 0) -> array:
+    """ Function that partitions the directed graph into k parts
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        k(int): The amount of parts
+        method(str): "label_propagation" or "bfs_grow"
+        imbalance(float): The fraction by which label propagation may let a
+            part exceed n / k vertices
+        executor(Executor): If provided, label propagation calculates the
+            preferred parts of chunks of positions in the executor, which
+            runs them in parallel if it is a process pool
+        seed(int): The seed of the random moves of label propagation
+
+    Returns:
+        array: The part per position of the adjacency """
+
+    return partition_positions(directed_graph.get_adjacency(), k, method,
+                               imbalance, executor, seed)
+
+
+def partition_positions(adjacency: Adjacency, k: int,
+                        method: str = "label_propagation",
+                        imbalance: float = IMBALANCE,
+                        executor: Optional[Executor] = None,
+                        seed: int = 0) -> array:
+    """ Function that partitions an adjacency into k parts, see partition
+
+    Returns:
+        array: The part per position """
+
+    if method not in METHODS:
+        raise RuntimeError(f"Unknown partition method {method}")
+    if k < 1:
+        raise RuntimeError("The amount of parts must be positive")
+    transposed = adjacency.transpose()
+    sides = (adjacency.get_offsets(), adjacency.get_heads(),
+             transposed.get_offsets(), transposed.get_heads())
+    if method == "bfs_grow":
+        return _bfs_grow(sides, adjacency.get_vertices_count(), k)
+    return _label_propagation(sides, adjacency.get_vertices_count(), k,
+                              imbalance, executor, seed)
+
+
+def create_shards(adjacency: Adjacency, parts: array, k: int) -> List[Any]:
+    """ Function that creates a directed graph per part, with the vertices of
+    the part and the edges between them. The shards are independent of the
+    partitioned directed graph, so they can be pickled and sent to worker
+    processes on their own. The attributes of the vertices and edges are
+    copied along
+
+    Args:
+        adjacency (Adjacency): The adjacency that was partitioned
+        parts(array): The part per position
+        k(int): The amount of parts
+
+    Returns:
+        list: The directed graph per part """
+
+    from . directed_graph import DirectedGraph
+    shards = [DirectedGraph() for _ in range(k)]
+    cores = [shard.get_direct_graph_core() for shard in shards]
+    vertices = adjacency.get_vertices()
+    for vertex, part in zip(vertices, parts):
+        cores[part].create_add_vertex(vertex.get_label())
+        for attr, value in vertex.get_attrs().items():
+            cores[part].get_vertex(vertex.get_label()).set_attr(attr, value)
+
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    edges = adjacency.get_edges()
+    for tail, vertex in enumerate(vertices):
+        core = cores[parts[tail]]
+        for i in range(offsets[tail], offsets[tail + 1]):
+            if parts[heads[i]] == parts[tail]:
+                edge = core.add_edge(
+                    core.get_vertex(vertex.get_label()),
+                    core.get_vertex(vertices[heads[i]].get_label()))
+                for attr, value in edges[i].get_attrs().items():
+                    edge.set_attr(attr, value)
+    return shards
+
+
+def _bfs_grow(sides, n: int, k: int) -> array:
+    """ Function that grows the parts one after the other from a seed over
+    the edges in both directions. The frontier vertex with the most edges
+    into the part is added first, ties are broken in breadth-first order. A
+    part that runs out of frontier continues from the first unassigned
+    position """
+
+    parts = array("l", [UNASSIGNED]) * n
+    seed = 0
+    counter = 0
+    for part in range(k):
+        size = n // k + (1 if part < n % k else 0)
+        gains: Dict[int, int] = dict()
+        frontier: List[Tuple[int, int, int]] = list()
+        while size:
+            if frontier:
+                gain, _, vertex = heappop(frontier)
+                if parts[vertex] != UNASSIGNED or -gain != gains[vertex]:
+                    continue
+            else:
+                while parts[seed] != UNASSIGNED:
+                    seed += 1
+                vertex = seed
+            parts[vertex] = part
+            size -= 1
+            for offsets, heads in (sides[:2], sides[2:]):
+                for i in range(offsets[vertex], offsets[vertex + 1]):
+                    head = heads[i]
+                    if parts[head] == UNASSIGNED:
+                        gains[head] = gains.get(head, 0) + 1
+                        counter += 1
+                        heappush(frontier, (-gains[head], counter, head))
+    return parts
+
+
+def _label_propagation(sides, n: int, k: int, imbalance: float,
+                       executor: Optional[Executor], seed: int) -> array:
+    """ Function that refines the grown parts with rounds of label
+    propagation, until no vertex prefers another part or MAX_ROUNDS is
+    reached """
+
+    parts = _bfs_grow(sides, n, k)
+    if executor is None:
+        return _propagate(parts, n, k, imbalance, seed,
+                          lambda: _preferred_parts(sides, parts, k, 0, n))
+
+    segments = [array("l", side) for side in sides] + [parts]
+    bounds: List[Tuple[int, int]] = list()
+    for segment in segments:
+        start = bounds[-1][1] if bounds else 0
+        bounds.append((start, start + len(segment)))
+    itemsize = parts.itemsize
+    memory = shared_memory.SharedMemory(
+        create=True, size=max(1, bounds[-1][1] * itemsize))
+    try:
+        for segment, (start, _) in zip(segments, bounds):
+            data = segment.tobytes()
+            memory.buf[start * itemsize:start * itemsize + len(data)] = data
+
+        def preferred_parts() -> array:
+            start = bounds[-1][0] * itemsize
+            memory.buf[start:start + n * itemsize] = parts.tobytes()
+            futures = [executor.submit(_shared_preferred_parts, memory.name,
+                                       bounds, k, chunk,
+                                       min(chunk + CHUNK_SIZE, n))
+                       for chunk in range(0, n, CHUNK_SIZE)]
+            preferred = array("l")
+            for future in futures:
+                preferred.extend(future.result())
+            return preferred
+
+        return _propagate(parts, n, k, imbalance, seed, preferred_parts)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def _propagate(parts: array, n: int, k: int, imbalance: float, seed: int,
+               preferred_parts: Callable[[], array]) -> array:
+    """ Function that runs the rounds of label propagation on the parts, with
+    a function that calculates the preferred part of every position from the
+    current parts """
+
+    loads = array("l", [0]) * k
+    for part in parts:
+        loads[part] += 1
+    capacity = max(-(-n // k), int(n / k * (1 + imbalance)))
+    generator = Random(seed)
+    for _ in range(MAX_ROUNDS):
+        preferred = preferred_parts()
+
+        candidates = 0
+        for vertex in range(n):
+            part, target = parts[vertex], preferred[vertex]
+            if part == target:
+                continue
+            candidates += 1
+            if loads[target] < capacity and generator.random() < 0.5:
+                parts[vertex] = target
+                loads[part] -= 1
+                loads[target] += 1
+        if not candidates:
+            break
+    return parts
+
+
+def _shared_preferred_parts(name: str, bounds: List[Tuple[int, int]], k: int,
+                            start: int, stop: int) -> array:
+    """ Function that calculates the preferred parts of a chunk of positions
+    in a worker, from the adjacency arrays and parts in the shared memory
+    block, see _preferred_parts """
+
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        items = memory.buf[:bounds[-1][1] * array("l").itemsize].cast("l")
+        segments = [items[first:last] for first, last in bounds]
+        try:
+            return _preferred_parts(segments[:4], segments[4], k, start,
+                                    stop)
+        finally:
+            for segment in segments:
+                segment.release()
+            items.release()
+    finally:
+        memory.close()
+
+
+def _preferred_parts(sides, parts: array, k: int, start: int,
+                     stop: int) -> array:
+    """ Function that calculates the part that most neighbours of every
+    position from start to stop are in, the current part wins ties
+
+    Returns:
+        array: The preferred part per position, from start to stop """
+
+    preferred = array("l")
+    counts = array("l", [0]) * k
+    for vertex in range(start, stop):
+        touched: List[int] = list()
+        for offsets, heads in (sides[:2], sides[2:]):
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                head = heads[i]
+                if head != vertex:
+                    part = parts[head]
+                    if not counts[part]:
+                        touched.append(part)
+                    counts[part] += 1
+        best = parts[vertex]
+        for part in touched:
+            if counts[part] > counts[best]:
+                best = part
+        for part in touched:
+            counts[part] = 0
+        preferred.append(best)
+    return preferred
@@ -0,0 +1,97 @@
+""" Module that contains a worklist engine that propagates values along the
+edges of a directed graph until a fixpoint is reached, for dataflow problems
+like taint tracking, constraint propagation or reachability summaries
+(https://en.wikipedia.org/wiki/Data-flow_analysis)
+
+The values are held in a vertex attribute. A vertex pushes its value over
+each of its edges: the transfer function turns it into a contribution for
+the head, which the join function combines with the value of the head. The
+strongly connected components are processed in topological order of the
+condensation, so every vertex of a component has received all contributions
+from earlier components before it is processed. A vertex outside a cycle is
+therefore processed exactly once, only the vertices of cyclic components are
+iterated with a worklist, which holds the vertices whose value changed """
+
+from array import array
+from collections import deque
+from typing import Any, Callable, Optional
+from . directed_graph_core import DirectedGraphCore
+from . edge import Edge
+from . kosaraju_sccs import sccs_positions
+
+Transfer = Callable[[Edge, Any], Any]
+Join = Callable[[Any, Any], Any]
+
+
+def propagate(directed_graph: DirectedGraphCore, attr: str,
+              transfer: Transfer, join: Join,
+              max_visits: Optional[int] = None) -> int:
+    """ Function that propagates the values of a vertex attribute until a
+    fixpoint is reached, and stores the final values in the attribute
+
+    Vertices for which the attribute is None have no value yet, they don't
+    push anything until they receive their first contribution, which becomes
+    their value. The join function must be monotone (the values only grow in
+    some order of finite height), otherwise the propagation may not end
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        attr(str): The vertex attribute that holds the values
+        transfer: Function that returns the contribution of an edge for the
+            value of its tail, or None if the edge contributes nothing
+        join: Function that combines the value of a vertex with a
+            contribution
+        max_visits(int): If provided, a RuntimeError is raised when more
+            vertices than this are processed
+
+    Returns:
+        int: The amount of processed vertices, equal to the amount of
+            vertices with a value if there are no cycles """
+
+    adjacency = directed_graph.get_adjacency()
+    vertices = adjacency.get_vertices()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    edges = adjacency.get_edges()
+    values = [vertex.get_attr(attr) for vertex in vertices]
+    components = array("l", [0]) * len(vertices)
+    sccs = sccs_positions(adjacency)
+    for component, scc in enumerate(sccs):
+        for vertex in scc:
+            components[vertex] = component
+
+    queued = bytearray(len(vertices))
+    worklist: deque = deque()
+    visits = 0
+    for component, scc in enumerate(sccs):
+        for vertex in scc:
+            queued[vertex] = 1
+        worklist.extend(scc)
+        while worklist:
+            vertex = worklist.popleft()
+            queued[vertex] = 0
+            value = values[vertex]
+            if value is None:
+                continue
+            visits += 1
+            if max_visits is not None and visits > max_visits:
+                raise RuntimeError(f"The propagation didn't reach a fixpoint "
+                                   f"within {max_visits} visits")
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                contribution = transfer(edges[i], value)
+                if contribution is None:
+                    continue
+                head = heads[i]
+                old = values[head]
+                new = contribution if old is None else join(old, contribution)
+                if new == old:
+                    continue
+                values[head] = new
+                if components[head] == component and not queued[head]:
+                    queued[head] = 1
+                    worklist.append(head)
+
+    for vertex, value in zip(vertices, values):
+        if value is not None:
+            vertex.set_attr(attr, value)
+    return visits
@@ -0,0 +1,77 @@
+""" Module that contains a bounded cache of algorithm results, keyed by the
+structural adjacency keys of directed graphs, so that the results of a
+directed graph can be reused for every directed graph with the same shape.
+
+The structural adjacency key hashes the offsets and heads of the adjacency
+without the labels, so directed graphs that are built in the same order get
+equal keys, whatever their labels are. Results that contain vertices, like
+the SCCs, are stored as positions and mapped back to the vertices of the
+adjacency of the directed graph on a hit. The label-insensitive fingerprint
+is not used as a key, as directed graphs that are not isomorphic can share
+it """
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+CAPACITY = 1024
+
+
+class ResultCache(object):
+    """ Class that represents a least recently used cache of results, that
+    can be shared by threads """
+
+    def __init__(self, capacity: int = CAPACITY):
+        """ Initialises the cache
+
+        Args:
+            capacity(int): The maximum amount of results, the least recently
+                used result is evicted when it is exceeded """
+
+        if capacity < 1:
+            raise RuntimeError("The capacity of a result cache must be "
+                               "positive")
+        self._capacity = capacity
+        self._results: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """ Returns the result of the key, which is computed and stored if it
+        isn't in the cache. The computation runs outside the lock
+
+        Args:
+            key: The key, which contains the algorithm, its arguments and the
+                fingerprint of the directed graph
+            compute: Function without arguments that computes the result
+
+        Returns:
+            The (cached) result """
+
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return self._results[key]
+            self._misses += 1
+        result = compute()
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            if len(self._results) > self._capacity:
+                self._results.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def get_hits(self) -> int:
+        return self._hits
+
+    def get_misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._results)
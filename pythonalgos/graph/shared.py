@@ -0,0 +1,155 @@
+""" Module that contains the exchange of directed graphs between processes
+through shared memory.
+
+The flat form of a directed graph (the offsets and heads arrays of its
+adjacency, followed by the pickled labels and attributes) is written into a
+single shared memory block. Only the handle, which holds the name and the
+sizes of the block, is pickled when it is sent to another process. There the
+arrays are used in place, or the directed graph is rebuilt from them """
+
+from __future__ import annotations
+import pickle
+from array import array
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, Optional
+from . adjacency import Adjacency
+from . directed_graph import DirectedGraph
+from . directed_graph_core import DirectedGraphCore
+
+TYPECODE = "l"
+
+
+class SharedGraph(object):
+    """ Class that represents a handle to a directed graph in shared memory.
+    The process that creates the handle owns the shared memory block and has
+    to unlink it when no process needs it anymore """
+
+    def __init__(self, name: str, vertices_count: int, edges_count: int,
+                 payload_size: int):
+        """ Initialises the handle, use SharedGraph.create to create the
+        shared memory block
+
+        Args:
+            name(str): the name of the shared memory block
+            vertices_count(int): the amount of vertices
+            edges_count(int): the amount of edges
+            payload_size(int): the size of the pickled labels and attributes
+        """
+
+        self._name = name
+        self._vertices_count = vertices_count
+        self._edges_count = edges_count
+        self._payload_size = payload_size
+        self._memory: Optional[shared_memory.SharedMemory] = None
+
+    @classmethod
+    def create(cls, directed_graph: Any) -> SharedGraph:
+        """ Writes the flat form of a directed graph into a new shared memory
+        block
+
+        Args:
+            directed_graph: a DirectedGraph or a DirectedGraphCore
+
+        Returns:
+            SharedGraph: the handle, that owns the shared memory block """
+
+        if isinstance(directed_graph, DirectedGraph):
+            directed_graph = directed_graph.get_direct_graph_core()
+        state = directed_graph.__getstate__()
+        offsets = state.pop("offsets").tobytes()
+        heads = state.pop("heads").tobytes()
+        payload = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+
+        memory = shared_memory.SharedMemory(
+            create=True, size=max(1, len(offsets) + len(heads) + len(payload)))
+        end = len(offsets) + len(heads)
+        memory.buf[:len(offsets)] = offsets
+        memory.buf[len(offsets):end] = heads
+        memory.buf[end:end + len(payload)] = payload
+
+        shared = cls(memory.name, len(state["labels"]),
+                     len(heads) // array(TYPECODE).itemsize, len(payload))
+        shared._memory = memory
+        return shared
+
+    def get_name(self) -> str:
+        return self._name
+
+    @contextmanager
+    def attach(self) -> Iterator[Adjacency]:
+        """ Context manager that attaches to the shared memory block and
+        yields an adjacency whose offsets and heads are views on it, without
+        copying them. The vertices of the adjacency are the labels. The
+        adjacency must not be used after the context is left
+
+        Yields:
+            Adjacency: the adjacency on the shared memory block """
+
+        memory = shared_memory.SharedMemory(name=self._name)
+        try:
+            offsets, heads, state = self._read(memory)
+            try:
+                yield Adjacency(state["labels"], offsets, heads)
+            finally:
+                offsets.release()
+                heads.release()
+        finally:
+            memory.close()
+
+    def load(self) -> DirectedGraph:
+        """ Rebuilds the directed graph, with its vertex and edge attributes,
+        from the shared memory block
+
+        Returns:
+            DirectedGraph: the rebuilt directed graph """
+
+        memory = shared_memory.SharedMemory(name=self._name)
+        try:
+            offsets, heads, state = self._read(memory)
+            state["offsets"], state["heads"] = offsets, heads
+            core = DirectedGraphCore.__new__(DirectedGraphCore)
+            core.__setstate__(state)
+            offsets.release()
+            heads.release()
+        finally:
+            memory.close()
+
+        directed_graph = DirectedGraph()
+        directed_graph.directed_graph = core
+        return directed_graph
+
+    def _read(self, memory: shared_memory.SharedMemory):
+        itemsize = array(TYPECODE).itemsize
+        offsets_end = (self._vertices_count + 1) * itemsize
+        heads_end = offsets_end + self._edges_count * itemsize
+        buf = memory.buf
+        offsets = buf[:offsets_end].cast(TYPECODE)
+        heads = buf[offsets_end:heads_end].cast(TYPECODE)
+        state: Dict[str, Any] = pickle.loads(
+            buf[heads_end:heads_end + self._payload_size])
+        return offsets, heads, state
+
+    def unlink(self):
+        """ Closes and destroys the shared memory block, by the process that
+        created it """
+
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def __enter__(self) -> SharedGraph:
+        return self
+
+    def __exit__(self, *args):
+        self.unlink()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"name": self._name, "vertices_count": self._vertices_count,
+                "edges_count": self._edges_count,
+                "payload_size": self._payload_size}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["name"], state["vertices_count"],
+                      state["edges_count"], state["payload_size"])
@@ -0,0 +1,257 @@
+""" Module that contains weighted shortest path algorithms on directed graphs:
+Dijkstra's algorithm with a binary heap and lazy deletion, bidirectional
+Dijkstra for point-to-point queries and relaxation in topological order for
+directed acyclic graphs.
+
+The weight of an edge is one of its attributes (see Edge.set_attr). By
+default, the weights are extracted into a flat array once per run, so that the
+relaxation loops don't call get_attr for every edge they relax """
+
+from array import array
+from heapq import heappop, heappush
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . topological_sort import topological_positions
+from . vertex import Vertex
+
+INFINITY = float("inf")
+
+
+class ShortestPaths(object):
+    """ Class that holds the result of a single source shortest path
+    calculation: the distances and predecessors, indexed by the dense
+    positions of the adjacency of the directed graph """
+
+    def __init__(self, adjacency: Adjacency, distances: array,
+                 predecessors: array):
+        """ Initialises the result
+
+        Args:
+            adjacency (Adjacency): The adjacency the paths were calculated on
+            distances(array): The distance per position, infinite if the
+                vertex can't be reached
+            predecessors(array): The position of the predecessor per position
+                on the shortest path, -1 for the source and unreachable ones
+        """
+
+        self._adjacency = adjacency
+        self._distances = distances
+        self._predecessors = predecessors
+
+    def get_vertices(self) -> Sequence[Vertex]:
+        return self._adjacency.get_vertices()
+
+    def get_distances(self) -> array:
+        return self._distances
+
+    def get_predecessors(self) -> array:
+        return self._predecessors
+
+    def get_distance(self, vertex: Vertex) -> float:
+        return self._distances[self._adjacency.get_position(vertex)]
+
+    def get_path(self, vertex: Vertex) -> Optional[List[Vertex]]:
+        """ Returns the shortest path from the source to the vertex
+
+        Args:
+            vertex: the vertex at the end of the path
+
+        Returns:
+            list: the vertices on the path, or None if it can't be reached """
+
+        position = self._adjacency.get_position(vertex)
+        if self._distances[position] == INFINITY:
+            return None
+        return _path(self._adjacency.get_vertices(), self._predecessors,
+                     position)
+
+
+def dijkstra(directed_graph: DirectedGraphCore, source: Any,
+             weight: str = "weight",
+             flat_weights: bool = True) -> ShortestPaths:
+    """ Function that calculates the shortest paths from a source vertex with
+    Dijkstra's algorithm, using a binary heap. Entries that have become stale
+    are not removed from the heap, they are skipped when popped
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        source: The label of the source vertex
+        weight(str): The edge attribute that holds the non-negative weight
+        flat_weights(bool): If True, the weights are extracted into a flat
+            array once, otherwise get_attr is called in every relaxation
+
+    Returns:
+        ShortestPaths: the distances and predecessors """
+
+    adjacency = directed_graph.get_adjacency()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    weight_of = _weights(adjacency, weight, flat_weights)
+    n = adjacency.get_vertices_count()
+    distances = array("d", [INFINITY]) * n
+    predecessors = array("l", [-1]) * n
+    start = adjacency.get_position(directed_graph.get_vertex(source))
+    distances[start] = 0.0
+    heap: List[Tuple[float, int]] = [(0.0, start)]
+    while heap:
+        distance, vertex = heappop(heap)
+        if distance > distances[vertex]:
+            continue
+        for i in range(offsets[vertex], offsets[vertex + 1]):
+            candidate = distance + weight_of(i)
+            head = heads[i]
+            if candidate < distances[head]:
+                distances[head] = candidate
+                predecessors[head] = vertex
+                heappush(heap, (candidate, head))
+
+    return ShortestPaths(adjacency, distances, predecessors)
+
+
+def bidirectional_dijkstra(directed_graph: DirectedGraphCore, source: Any,
+                           target: Any, weight: str = "weight",
+                           flat_weights: bool = True) -> \
+        Optional[Tuple[float, List[Vertex]]]:
+    """ Function that calculates the shortest path between two vertices by
+    running Dijkstra's algorithm forward from the source and backward (on the
+    transposed adjacency) from the target, alternately, until the searches
+    meet
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        source: The label of the source vertex
+        target: The label of the target vertex
+        weight(str): The edge attribute that holds the non-negative weight
+        flat_weights(bool): If True, the weights are extracted into a flat
+            array once, otherwise get_attr is called in every relaxation
+
+    Returns:
+        tuple: The distance and the vertices on the shortest path, or None if
+            the target can't be reached from the source """
+
+    forward = directed_graph.get_adjacency()
+    backward = forward.transpose()
+    weights = _weights(forward, weight, flat_weights)
+    origins = backward.get_origins()
+    n = forward.get_vertices_count()
+    start = forward.get_position(directed_graph.get_vertex(source))
+    end = forward.get_position(directed_graph.get_vertex(target))
+
+    searches = [(forward, weights), (backward, lambda i: weights(origins[i]))]
+    distances = [array("d", [INFINITY]) * n, array("d", [INFINITY]) * n]
+    predecessors = [array("l", [-1]) * n, array("l", [-1]) * n]
+    settled = [bytearray(n), bytearray(n)]
+    heaps: List[List[Tuple[float, int]]] = [[(0.0, start)], [(0.0, end)]]
+    distances[0][start] = 0.0
+    distances[1][end] = 0.0
+    best, meeting = (0.0, start) if start == end else (INFINITY, -1)
+    side = 0
+    while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < best:
+        adjacency, weight_of = searches[side]
+        offsets, heads = adjacency.get_offsets(), adjacency.get_heads()
+        own, other = distances[side], distances[1 - side]
+        distance, vertex = heappop(heaps[side])
+        if distance <= own[vertex] and not settled[side][vertex]:
+            settled[side][vertex] = 1
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                candidate = distance + weight_of(i)
+                head = heads[i]
+                if candidate < own[head]:
+                    own[head] = candidate
+                    predecessors[side][head] = vertex
+                    heappush(heaps[side], (candidate, head))
+                if candidate + other[head] < best:
+                    best, meeting = candidate + other[head], head
+        side = 1 - side
+
+    if meeting == -1:
+        return None
+    vertices = forward.get_vertices()
+    path = _path(vertices, predecessors[0], meeting)
+    vertex = predecessors[1][meeting]
+    while vertex != -1:
+        path.append(vertices[vertex])
+        vertex = predecessors[1][vertex]
+    return best, path
+
+
+def dag_shortest_paths(directed_graph: DirectedGraphCore, source: Any,
+                       weight: str = "weight",
+                       flat_weights: bool = True) -> ShortestPaths:
+    """ Function that calculates the shortest paths from a source vertex in a
+    directed acyclic graph, by relaxing the edges of the vertices in
+    topological order in O(V + E). Negative weights are allowed
+
+    Args:
+        directed_graph (DirectedGraph): The directed acyclic graph
+        source: The label of the source vertex
+        weight(str): The edge attribute that holds the weight
+        flat_weights(bool): If True, the weights are extracted into a flat
+            array once, otherwise get_attr is called in every relaxation
+
+    Returns:
+        ShortestPaths: the distances and predecessors """
+
+    adjacency = directed_graph.get_adjacency()
+    order = topological_positions(adjacency)
+    if order is None:
+        raise RuntimeError("Directed graph has a cycle")
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    weight_of = _weights(adjacency, weight, flat_weights, negative=True)
+    n = adjacency.get_vertices_count()
+    distances = array("d", [INFINITY]) * n
+    predecessors = array("l", [-1]) * n
+    distances[adjacency.get_position(directed_graph.get_vertex(source))] = 0.0
+    for vertex in order:
+        distance = distances[vertex]
+        if distance == INFINITY:
+            continue
+        for i in range(offsets[vertex], offsets[vertex + 1]):
+            candidate = distance + weight_of(i)
+            head = heads[i]
+            if candidate < distances[head]:
+                distances[head] = candidate
+                predecessors[head] = vertex
+
+    return ShortestPaths(adjacency, distances, predecessors)
+
+
+def _weights(adjacency: Adjacency, weight: str, flat_weights: bool,
+             negative: bool = False) -> Callable[[int], float]:
+    """ Function that returns a function that looks up the weight of the edge
+    at a position of the adjacency
+
+    Args:
+        adjacency (Adjacency): The adjacency
+        weight(str): The edge attribute that holds the weight
+        flat_weights(bool): If True, the weights are extracted once
+        negative(bool): If True, negative weights are allowed
+
+    Returns:
+        The function that returns the weight of the edge at a position """
+
+    edges = adjacency.get_edges()
+
+    def weight_of(i: int) -> float:
+        value = edges[i].get_attr(weight)
+        if value is None:
+            raise RuntimeError(f"edge {i} has no attribute {weight}")
+        if value < 0 and not negative:
+            raise RuntimeError(f"edge {i} has a negative {weight}")
+        return value
+
+    if not flat_weights:
+        return weight_of
+    return array("d", (weight_of(i) for i in range(len(edges)))).__getitem__
+
+
+def _path(vertices: Sequence[Vertex], predecessors: array,
+          position: int) -> List[Vertex]:
+    path: List[Vertex] = list()
+    while position != -1:
+        path.append(vertices[position])
+        position = predecessors[position]
+    path.reverse()
+    return path
@@ -0,0 +1,175 @@
+""" Module that contains the statistics of a directed graph, which the directed
+graph core maintains while vertices and edges are added and removed, so that
+reading them doesn't take a pass over the directed graph.
+
+The statistics are the amount of edges, the sources (vertices without
+incoming edges), the sinks (vertices without outgoing edges) and the
+histograms of the indegrees and outdegrees, arrays with the amount of
+vertices per degree """
+
+from __future__ import annotations
+from array import array
+from typing import List, Set
+from . adjacency import Adjacency
+from . vertex import Vertex
+
+
+class GraphStats(object):
+    """ Class that holds the statistics of a directed graph. Every change of
+    the directed graph updates them in O(1) """
+
+    def __init__(self):
+        self._vertices_count = 0
+        self._edges_count = 0
+        self._sources: Set[Vertex] = set()
+        self._sinks: Set[Vertex] = set()
+        self._indegrees = array("l")
+        self._outdegrees = array("l")
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Adjacency) -> GraphStats:
+        """ Calculates the statistics of an adjacency in one pass, for
+        directed graphs that don't maintain them, like views
+
+        Args:
+            adjacency (Adjacency): the adjacency
+
+        Returns:
+            GraphStats: the statistics """
+
+        stats = cls()
+        vertices = adjacency.get_vertices()
+        offsets = adjacency.get_offsets()
+        heads = adjacency.get_heads()
+        indegrees = array("l", [0]) * len(vertices)
+        for head in heads:
+            indegrees[head] += 1
+        for i, vertex in enumerate(vertices):
+            outdegree = offsets[i + 1] - offsets[i]
+            stats._vertices_count += 1
+            stats._edges_count += outdegree
+            _count(stats._indegrees, indegrees[i], 1)
+            _count(stats._outdegrees, outdegree, 1)
+            if not indegrees[i]:
+                stats._sources.add(vertex)
+            if not outdegree:
+                stats._sinks.add(vertex)
+        return stats
+
+    def vertex_added(self, vertex: Vertex):
+        self._vertices_count += 1
+        self._sources.add(vertex)
+        self._sinks.add(vertex)
+        _count(self._indegrees, 0, 1)
+        _count(self._outdegrees, 0, 1)
+
+    def vertex_removed(self, vertex: Vertex):
+        """ Updates the statistics for a removed vertex, which had no edges
+
+        Args:
+            vertex: the removed vertex """
+
+        self._vertices_count -= 1
+        self._sources.discard(vertex)
+        self._sinks.discard(vertex)
+        _count(self._indegrees, 0, -1)
+        _count(self._outdegrees, 0, -1)
+
+    def edge_added(self, tail: Vertex, head: Vertex):
+        """ Updates the statistics for an added edge, after the degrees of
+        its tail and head have been increased
+
+        Args:
+            tail: the tail of the edge
+            head: the head of the edge """
+
+        self._edges_count += 1
+        outdegree = tail.get_outdegree()
+        _count(self._outdegrees, outdegree - 1, -1)
+        _count(self._outdegrees, outdegree, 1)
+        if outdegree == 1:
+            self._sinks.discard(tail)
+        indegree = head.get_indegree()
+        _count(self._indegrees, indegree - 1, -1)
+        _count(self._indegrees, indegree, 1)
+        if indegree == 1:
+            self._sources.discard(head)
+
+    def edge_removed(self, tail: Vertex, head: Vertex):
+        """ Updates the statistics for a removed edge, after the degrees of
+        its tail and head have been decreased
+
+        Args:
+            tail: the tail of the edge
+            head: the head of the edge """
+
+        self._edges_count -= 1
+        outdegree = tail.get_outdegree()
+        _count(self._outdegrees, outdegree + 1, -1)
+        _count(self._outdegrees, outdegree, 1)
+        if outdegree == 0:
+            self._sinks.add(tail)
+        indegree = head.get_indegree()
+        _count(self._indegrees, indegree + 1, -1)
+        _count(self._indegrees, indegree, 1)
+        if indegree == 0:
+            self._sources.add(head)
+
+    def reversed(self):
+        """ Updates the statistics for the reversal of all edges, which swaps
+        indegrees with outdegrees """
+
+        self._sources, self._sinks = self._sinks, self._sources
+        self._indegrees, self._outdegrees = self._outdegrees, self._indegrees
+
+    def get_vertices_count(self) -> int:
+        return self._vertices_count
+
+    def get_edges_count(self) -> int:
+        return self._edges_count
+
+    def get_sources(self) -> Set[Vertex]:
+        return set(self._sources)
+
+    def get_sources_count(self) -> int:
+        return len(self._sources)
+
+    def get_sinks(self) -> Set[Vertex]:
+        return set(self._sinks)
+
+    def get_sinks_count(self) -> int:
+        return len(self._sinks)
+
+    def get_indegree_histogram(self) -> List[int]:
+        """ Returns the amount of vertices per indegree
+
+        Returns:
+            list: the amount of vertices at index d have indegree d, up to the
+                highest indegree """
+
+        return _trimmed(self._indegrees)
+
+    def get_outdegree_histogram(self) -> List[int]:
+        """ Returns the amount of vertices per outdegree
+
+        Returns:
+            list: the amount of vertices at index d have outdegree d, up to
+                the highest outdegree """
+
+        return _trimmed(self._outdegrees)
+
+
+def _count(histogram: array, degree: int, amount: int):
+    """ Function that adds an amount to the count of a degree, the histogram
+    grows when a new highest degree is counted """
+
+    if degree >= len(histogram):
+        histogram.extend([0] * (degree + 1 - len(histogram)))
+    histogram[degree] += amount
+
+
+def _trimmed(histogram: array) -> List[int]:
+    end = len(histogram)
+    while end and not histogram[end - 1]:
+        end -= 1
+    return histogram[:end].tolist()
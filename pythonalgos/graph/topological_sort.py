@@ -0,0 +1,59 @@
+""" Module that contains the logic for sorting the vertices of a directed
+acyclic graph topologically, with Kahn's algorithm
+(https://en.wikipedia.org/wiki/Topological_sorting#Kahn's_algorithm)
+"""
+
+from array import array
+from typing import List, Optional
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . vertex import Vertex
+
+
+def topological_order(directed_graph: DirectedGraphCore) -> List[Vertex]:
+    """ Function that sorts the vertices of the directed graph topologically,
+    every vertex comes before the heads of its edges
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+
+    Returns:
+        list: The vertices in topological order """
+
+    adjacency = directed_graph.get_adjacency()
+    order = topological_positions(adjacency)
+    if order is None:
+        raise RuntimeError("Directed graph has a cycle")
+    vertices = adjacency.get_vertices()
+    return [vertices[i] for i in order]
+
+
+def topological_positions(adjacency: Adjacency) -> Optional[array]:
+    """ Function that sorts the positions of an adjacency topologically
+
+    Args:
+        adjacency (Adjacency): The adjacency
+
+    Returns:
+        array: The positions in topological order, or None if the adjacency
+            contains a cycle """
+
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    indegrees = array("l", [0]) * n
+    for head in heads:
+        indegrees[head] += 1
+
+    order = array("l", (i for i in range(n) if indegrees[i] == 0))
+    done = 0
+    while done < len(order):
+        vertex = order[done]
+        done += 1
+        for i in range(offsets[vertex], offsets[vertex + 1]):
+            head = heads[i]
+            indegrees[head] -= 1
+            if indegrees[head] == 0:
+                order.append(head)
+
+    return order if len(order) == n else None
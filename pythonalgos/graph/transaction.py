@@ -0,0 +1,71 @@
+""" Module that contains transactions on a directed graph. A transaction
+collects vertices and edges, identified by labels, and applies them in one go.
+The directed graph checks its invariant once for the whole batch, if the check
+fails, the whole batch is rolled back
+"""
+
+from typing import Any, Dict, List, Tuple
+from . edge import Edge
+from . vertex import Vertex
+
+
+class Transaction(object):
+    """ Class that represents a batch of vertices and edges that is added to a
+    directed graph atomically """
+
+    def __init__(self, directed_graph):
+        """ Initialises the transaction
+
+        Args:
+            directed_graph (DirectedGraph): The directed graph to add to
+        """
+
+        self._directed_graph = directed_graph
+        self._vertices: List[Any] = list()
+        self._edges: List[Tuple[Any, Any]] = list()
+        self._added_edges: List[Edge] = list()
+
+    def add_vertex(self, label: Any):
+        self._vertices.append(label)
+
+    def add_edge(self, tail: Any, head: Any):
+        """ Adds an edge, tail and head are labels. Vertices that are not
+        part of the directed graph yet are created
+
+        Args:
+            tail: the label of the start vertex
+            head: the label of the destination vertex """
+
+        self._edges.append((tail, head))
+
+    def get_added_edges(self) -> List[Edge]:
+        return self._added_edges
+
+    def commit(self):
+        """ Resolves all labels at once, creating the missing vertices, adds
+        all edges and lets the directed graph check its invariant for the
+        added edges. If the check raises, the batch is rolled back and the
+        exception is propagated """
+
+        core = self._directed_graph.get_direct_graph_core()
+        first_new_id = core.get_vertices_count()
+        resolved: Dict[Any, Vertex] = dict()
+        try:
+            for label in self._vertices:
+                core.create_add_vertex(label)
+            for tail, head in self._edges:
+                for label in (tail, head):
+                    if label not in resolved:
+                        if not core.has_vertex(label):
+                            core.create_add_vertex(label)
+                        resolved[label] = core.get_vertex(label)
+            for tail, head in self._edges:
+                self._added_edges.append(
+                    core.add_edge(resolved[tail], resolved[head]))
+            self._directed_graph.check_added_edges(self._added_edges)
+        except Exception:
+            for edge in self._added_edges:
+                core.remove_edge(edge)
+            self._added_edges = list()
+            core.remove_vertices_from(first_new_id)
+            raise
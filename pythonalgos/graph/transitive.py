@@ -0,0 +1,118 @@
+""" Module that contains the logic for calculating the transitive reduction and
+the transitive closure of a directed acyclic graph
+(https://en.wikipedia.org/wiki/Transitive_reduction)
+
+The vertices are swept in reverse topological order. The set of vertices that
+a vertex reaches is a bitset, a Python int in which bit r stands for the
+vertex with topological rank r, so merging the sets of the heads of a vertex
+is a word-parallel or. A bitset is dropped as soon as all vertices with an
+edge to its vertex have been swept """
+
+from array import array
+from typing import Iterator, List, Optional, Tuple
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . edge import Edge
+from . topological_sort import topological_positions
+from . vertex import Vertex
+
+
+def redundant_edges(directed_graph: DirectedGraphCore) -> List[Edge]:
+    """ Function that determines the edges of a directed acyclic graph that
+    are not part of its transitive reduction: the edges tail -> head for
+    which head can also be reached from tail along another path, and all but
+    one of parallel edges
+
+    Args:
+        directed_graph (DirectedGraph): The directed acyclic graph
+
+    Returns:
+        list: The redundant edges """
+
+    adjacency = directed_graph.get_adjacency()
+    edges = adjacency.get_edges()
+    return [edges[i] for _, _, _, redundant in _sweep(adjacency)
+            for i in redundant]
+
+
+def missing_closure_edges(directed_graph: DirectedGraphCore) -> \
+        List[Tuple[Vertex, Vertex]]:
+    """ Function that determines the edges that are missing from a directed
+    acyclic graph to be its own transitive closure: the pairs tail -> head
+    for which head can be reached from tail, but not along a single edge
+
+    Args:
+        directed_graph (DirectedGraph): The directed acyclic graph
+
+    Returns:
+        list: The (tail, head) pairs of the missing edges """
+
+    adjacency = directed_graph.get_adjacency()
+    vertices = adjacency.get_vertices()
+    order = topological_positions(adjacency)
+    if order is None:
+        raise RuntimeError("Directed graph has a cycle")
+    missing: List[Tuple[Vertex, Vertex]] = list()
+    for tail, reach, direct, _ in _sweep(adjacency, order):
+        bits = reach & ~direct
+        while bits:
+            bit = bits & -bits
+            missing.append((vertices[tail],
+                            vertices[order[bit.bit_length() - 1]]))
+            bits ^= bit
+    return missing
+
+
+def _sweep(adjacency: Adjacency, order: Optional[array] = None) -> \
+        Iterator[Tuple[int, int, int, List[int]]]:
+    """ Function that sweeps the positions of the adjacency in reverse
+    topological order
+
+    Args:
+        adjacency (Adjacency): The adjacency of a directed acyclic graph
+        order(array): The topological order of the positions, if already
+            calculated
+
+    Returns:
+        iterator: per position, a tuple of the position, the bitset of the
+            ranks it reaches, the bitset of the ranks of its heads and the
+            positions of its redundant edges """
+
+    if order is None:
+        order = topological_positions(adjacency)
+        if order is None:
+            raise RuntimeError("Directed graph has a cycle")
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    ranks = array("l", [0]) * n
+    for rank, position in enumerate(order):
+        ranks[position] = rank
+    pending = array("l", [0]) * n
+    for head in heads:
+        pending[head] += 1
+
+    reaches: List[int] = [0] * n
+    for rank in range(n - 1, -1, -1):
+        tail = order[rank]
+        begin, end = offsets[tail], offsets[tail + 1]
+        reach = direct = 0
+        redundant: List[int] = list()
+        for i in sorted(range(begin, end), key=lambda i: ranks[heads[i]]):
+            head = heads[i]
+            bit = 1 << ranks[head]
+            if (reach | direct) & bit:
+                redundant.append(i)
+            else:
+                reach |= reaches[ranks[head]]
+            direct |= bit
+
+        for i in range(begin, end):
+            head = heads[i]
+            pending[head] -= 1
+            if pending[head] == 0:
+                reaches[ranks[head]] = 0
+        reach |= direct
+        if pending[tail]:
+            reaches[rank] = reach
+        yield tail, reach, direct, redundant
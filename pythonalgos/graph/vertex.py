@@ -1,6 +1,6 @@
 from __future__ import annotations
 from . edge import Edge
-from typing import List, Mapping, Any, Collection, Set, Dict
+from typing import List, Mapping, Any, Collection, Dict
 from . algorithm_ordering import AlgorithmOrdering
 
 """ Module that contains the definition of a vertex in the context of a
@@ -22,21 +22,38 @@ class Vertex():
         """
 
         self._label = label
+        self._id: int = -1
         self._algorithm_ordering: AlgorithmOrdering = algorithm_ordering
         self._attrs: Dict[str, Any] = attrs
-        self._edges: Set[Edge] = set()
+        # The edges are kept in insertion order, so that the order in which
+        # the algorithms follow them doesn't depend on their memory addresses
+        self._edges: Dict[Edge, None] = dict()
         self._indegree: int = 0
 
-    def add_edge(self, head_vertex: Vertex):
+    def add_edge(self, head_vertex: Vertex) -> Edge:
         """ This method adds an edge to the set of edges maintained by the
         vertex
 
         Args:
             head_vertex: the head vertex to be added
 
+        Returns:
+            Edge: the added edge
         """
 
-        self._edges.add(Edge(self, head_vertex))
+        edge = Edge(self, head_vertex)
+        self._edges[edge] = None
+        return edge
+
+    def remove_edge(self, edge: Edge):
+        """ This method removes an edge from the set of edges maintained by
+        the vertex
+
+        Args:
+            edge: the edge to be removed
+        """
+
+        self._edges.pop(edge, None)
 
     def set_attr(self, attr: str, value: Any):
         self._attrs[attr] = value
@@ -56,6 +73,14 @@ class Vertex():
     def get_label(self) -> str:
         return self._label
 
+    def get_id(self) -> int:
+        """ Returns the dense integer id that the directed graph assigned to
+        the vertex, or -1 if the vertex doesn't belong to a directed graph """
+        return self._id
+
+    def set_id(self, vertex_id: int):
+        self._id = vertex_id
+
     def increase_indegree(self):
         """ This method increases the indegree for the incumbent vertex """
         self._indegree += 1
@@ -78,7 +103,7 @@ class Vertex():
             self._vertices according to the indicated vertex ordering """
 
         if self._algorithm_ordering == AlgorithmOrdering.NATURAL:
-            return self._edges
+            return self._edges.keys()
         else:
             return sorted(self._edges,
                           key=lambda edge: edge.get_head().get_label(),
@@ -86,7 +111,7 @@ class Vertex():
                           AlgorithmOrdering.DESC)
 
     def remove_edges(self):
-        self._edges = set()
+        self._edges = dict()
 
     def get_indegree(self) -> int:
         return self._indegree
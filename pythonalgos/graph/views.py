@@ -0,0 +1,349 @@
+""" Module that contains read-only views on a directed graph. A view restricts
+the directed graph to the vertices and edges that satisfy predicates, without
+copying vertices or edges. The algorithms accept views in place of directed
+graphs, they traverse the adjacency of the view.
+
+The predicates that the views create themselves, for subgraphs and for
+combining predicates, are picklable objects, so views can be pickled as long
+as the provided predicates can be
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Collection, Dict, Iterable, List, \
+    Optional, Set, Tuple
+from . adjacency import Adjacency
+from . directed_graph import DirectedGraph
+from . directed_graph_core import DirectedGraphCore
+from . edge import Edge
+from . stats import GraphStats
+from . vertex import Vertex
+
+VertexPredicate = Callable[[Vertex], bool]
+EdgePredicate = Callable[[Edge], bool]
+
+
+class DirectedGraphCoreView(object):
+    """ Class that represents a view on a directed graph core. A vertex is
+    part of the view if it satisfies the vertex predicate, an edge if both its
+    tail and head are part of the view and it satisfies the edge predicate.
+    The predicates are evaluated whenever the view is traversed, so the view
+    reflects later changes of the directed graph. A view that only restricts
+    the vertices by membership keeps its vertices until the directed graph
+    changes """
+
+    def __init__(self, directed_graph: DirectedGraphCore,
+                 vertex_predicate: Optional[VertexPredicate] = None,
+                 edge_predicate: Optional[EdgePredicate] = None):
+        """ Initialises the view
+
+        Args:
+            directed_graph (DirectedGraphCore): The viewed directed graph
+            vertex_predicate: if provided, only vertices for which it returns
+                True are part of the view
+            edge_predicate: if provided, only edges for which it returns True
+                are part of the view
+        """
+
+        self._directed_graph = directed_graph
+        self._vertex_predicate = vertex_predicate
+        self._edge_predicate = edge_predicate
+        self._vertices: Optional[Tuple[int, List[Vertex]]] = None
+
+    def filtered(self, vertex_predicate: Optional[VertexPredicate] = None,
+                 edge_predicate: Optional[EdgePredicate] = None) -> \
+            DirectedGraphCoreView:
+        """ Returns a view on the same directed graph, that is restricted by
+        both the predicates of this view and the provided predicates
+
+        Args:
+            vertex_predicate: the additional vertex predicate
+            edge_predicate: the additional edge predicate
+
+        Returns:
+            DirectedGraphCoreView: the restricted view """
+
+        return DirectedGraphCoreView(
+            self._directed_graph,
+            _both(self._vertex_predicate, vertex_predicate),
+            _both(self._edge_predicate, edge_predicate))
+
+    def get_viewed_graph(self) -> DirectedGraphCore:
+        return self._directed_graph
+
+    def includes(self, vertex: Vertex) -> bool:
+        return self._vertex_predicate is None or \
+            self._vertex_predicate(vertex)
+
+    def get_vertex(self, label: Any) -> Vertex:
+        """ Returns the vertex that coincides with the label
+
+        Args:
+            label: the label of the vertex
+
+        Returns:
+            The vertex object
+        """
+
+        vertex = self._directed_graph.get_vertex(label)
+        if not self.includes(vertex):
+            raise RuntimeError(f"label {label} couldn't be found in view")
+        return vertex
+
+    def has_vertex(self, label: Any) -> bool:
+        return self._directed_graph.has_vertex(label) and \
+            self.includes(self._directed_graph.get_vertex(label))
+
+    def get_vertices(self) -> Collection[Vertex]:
+        """ Returns the vertices of the view, in the order of their ids. If
+        the vertex predicate only checks membership, the vertices are kept
+        until the directed graph changes, otherwise the predicate is
+        evaluated for every vertex of the directed graph
+
+        Returns:
+            list: the vertices of the view """
+
+        if not _structural(self._vertex_predicate):
+            return [vertex for vertex in self._directed_graph.get_vertices()
+                    if self.includes(vertex)]
+        generation = self._directed_graph.get_generation()
+        if self._vertices is None or self._vertices[0] != generation:
+            self._vertices = (generation, [
+                vertex for vertex in self._directed_graph.get_vertices()
+                if self.includes(vertex)])
+        return self._vertices[1]
+
+    def get_vertices_count(self) -> int:
+        return len(self.get_vertices())
+
+    def get_edges(self) -> Set[Edge]:
+        return set(self.get_adjacency().get_edges())
+
+    def get_edges_count(self) -> int:
+        return self.get_adjacency().get_edges_count()
+
+    def stats(self) -> GraphStats:
+        """ Returns the statistics of the view, which are calculated from
+        its adjacency on every call, as the view isn't notified of changes
+
+        Returns:
+            GraphStats: the statistics """
+
+        return GraphStats.from_adjacency(self.get_adjacency())
+
+    def get_derived(self, name: str, create: Callable[[], Any]) -> Any:
+        """ Returns a value that is derived from the vertices and edges of
+        the view, which is created on every call, as the view isn't notified
+        of changes
+
+        Args:
+            name(str): the name of the value
+            create: function without arguments that creates the value
+
+        Returns:
+            the value """
+
+        return create()
+
+    def fingerprint(self, labels: bool = False) -> str:
+        """ Returns the fingerprint of the view, which is calculated on every
+        call
+
+        Args:
+            labels(bool): If True, the labels of the vertices are part of the
+                fingerprint
+
+        Returns:
+            str: The fingerprint, as a hex string """
+
+        from . fingerprint import fingerprint_adjacency
+        return fingerprint_adjacency(self.get_adjacency(), labels)
+
+    def get_adjacency_key(self, labels: bool = True) -> str:
+        from . fingerprint import adjacency_key
+        return adjacency_key(self.get_adjacency(), labels)
+
+    def get_adjacency(self) -> Adjacency:
+        """ Returns a snapshot of the adjacency of the view, of which the
+        positions are looked up by vertex id
+
+        Returns:
+            Adjacency: the snapshot of the adjacency """
+
+        return Adjacency.from_filtered_vertices(
+            self.get_vertices(), self._directed_graph.get_vertices_count(),
+            self._edge_predicate)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"directed_graph": self._directed_graph,
+                "vertex_predicate": self._vertex_predicate,
+                "edge_predicate": self._edge_predicate}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["directed_graph"], state["vertex_predicate"],
+                      state["edge_predicate"])
+
+    def __str__(self):
+        adjacency = self.get_adjacency()
+        vertices, offsets = adjacency.get_vertices(), adjacency.get_offsets()
+        heads = adjacency.get_heads()
+        return "".join(
+            "\n" + str(vertex.get_label()) + ", heads: " +
+            ",".join(str(vertices[heads[j]].get_label())
+                     for j in range(offsets[i], offsets[i + 1]))
+            for i, vertex in enumerate(vertices))
+
+
+class DirectedGraphView(DirectedGraph):
+    """ Class that represents a read-only view on a directed graph. All the
+    algorithms of DirectedGraph run on the view, the methods that would
+    modify the directed graph raise a RuntimeError """
+
+    def __init__(self, view: DirectedGraphCoreView):
+        """ Initialises the view, without calling the initializer of
+        DirectedGraph, which would create a new directed graph core
+
+        Args:
+            view (DirectedGraphCoreView): the view on the directed graph core
+        """
+
+        self.directed_graph = view
+
+    def add_vertex(self, label: Any):
+        raise RuntimeError("A view on a directed graph is read-only")
+
+    def add_edge(self, tail: Any, head: Any):
+        raise RuntimeError("A view on a directed graph is read-only")
+
+    def reversed(self, inplace=True):
+        raise RuntimeError("A view on a directed graph is read-only")
+
+    def transaction(self):
+        raise RuntimeError("A view on a directed graph is read-only")
+
+    def apply_delta(self, delta):
+        raise RuntimeError("A view on a directed graph is read-only")
+
+    def record_deltas(self, enabled: bool = True):
+        raise RuntimeError("A view on a directed graph is read-only")
+
+    def take_delta(self):
+        raise RuntimeError("A view on a directed graph is read-only")
+
+    def copy(self) -> DirectedGraph:
+        """ Copies the vertices and edges of the view into a new directed
+        graph
+
+        Returns:
+            DirectedGraph: the new directed graph """
+
+        adjacency = self.get_adjacency()
+        vertices, offsets = adjacency.get_vertices(), adjacency.get_offsets()
+        heads = adjacency.get_heads()
+        return DirectedGraph(
+            {vertex.get_label(): [vertices[heads[j]].get_label()
+                                  for j in range(offsets[i], offsets[i + 1])]
+             for i, vertex in enumerate(vertices)})
+
+    def subgraph(self, labels: Iterable[Any]) -> DirectedGraphView:
+        return DirectedGraphView(self.directed_graph.filtered(
+            _membership(self.directed_graph, labels)))
+
+    def filtered_view(self, vertex_predicate: Optional[VertexPredicate] = None,
+                      edge_predicate: Optional[EdgePredicate] = None) -> \
+            DirectedGraphView:
+        return DirectedGraphView(self.directed_graph.filtered(
+            vertex_predicate, edge_predicate))
+
+
+def subgraph(directed_graph: DirectedGraphCore,
+             labels: Iterable[Any]) -> DirectedGraphView:
+    """ Function that creates a view on the directed graph, restricted to the
+    vertices with the labels
+
+    Args:
+        directed_graph (DirectedGraphCore): The directed graph
+        labels: The labels of the vertices of the view
+
+    Returns:
+        DirectedGraphView: the view """
+
+    return DirectedGraphView(DirectedGraphCoreView(
+        directed_graph, _membership(directed_graph, labels)))
+
+
+def filtered_view(directed_graph: DirectedGraphCore,
+                  vertex_predicate: Optional[VertexPredicate] = None,
+                  edge_predicate: Optional[EdgePredicate] = None) -> \
+        DirectedGraphView:
+    """ Function that creates a view on the directed graph, restricted to the
+    vertices and edges that satisfy the predicates
+
+    Args:
+        directed_graph (DirectedGraphCore): The directed graph
+        vertex_predicate: if provided, only vertices for which it returns
+            True are part of the view
+        edge_predicate: if provided, only edges for which it returns True
+            are part of the view
+
+    Returns:
+        DirectedGraphView: the view """
+
+    return DirectedGraphView(DirectedGraphCoreView(
+        directed_graph, vertex_predicate, edge_predicate))
+
+
+class _Membership(object):
+    """ Class that represents a vertex predicate that checks membership of
+    vertices in a bytearray that is indexed by id """
+
+    def __init__(self, mask: bytearray):
+        self._mask = mask
+
+    def __call__(self, vertex: Vertex) -> bool:
+        vertex_id = vertex.get_id()
+        return vertex_id < len(self._mask) and self._mask[vertex_id] == 1
+
+
+class _Both(object):
+    """ Class that represents a predicate that holds if two predicates
+    hold """
+
+    def __init__(self, first: Callable[[Any], bool],
+                 second: Callable[[Any], bool]):
+        self.first = first
+        self.second = second
+
+    def __call__(self, item: Any) -> bool:
+        return self.first(item) and self.second(item)
+
+
+def _membership(directed_graph, labels: Iterable[Any]) -> VertexPredicate:
+    """ Function that creates a vertex predicate that checks membership of
+    the vertices with the labels, in a bytearray that is indexed by id """
+
+    vertices: List[Vertex] = [directed_graph.get_vertex(label)
+                              for label in labels]
+    mask = bytearray(max((vertex.get_id() for vertex in vertices),
+                         default=-1) + 1)
+    for vertex in vertices:
+        mask[vertex.get_id()] = 1
+    return _Membership(mask)
+
+
+def _both(first: Optional[Callable[[Any], bool]],
+          second: Optional[Callable[[Any], bool]]) -> \
+        Optional[Callable[[Any], bool]]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return _Both(first, second)
+
+
+def _structural(predicate: Optional[VertexPredicate]) -> bool:
+    """ Function that tells whether a vertex predicate only depends on the
+    vertices of the directed graph, and not on their attributes """
+
+    if isinstance(predicate, _Both):
+        return _structural(predicate.first) and _structural(predicate.second)
+    return predicate is None or isinstance(predicate, _Membership)
@@ -0,0 +1,93 @@
+""" Module that contains the logic for calculating the weakly connected
+components of a directed graph, the components of the directed graph when the
+direction of its edges is ignored
+(https://en.wikipedia.org/wiki/Component_(graph_theory))
+
+The edges of the adjacency are streamed once into an array-backed union-find
+with path halving and union by rank, no undirected graph is built """
+
+from array import array
+from typing import List, Set, Union
+from . adjacency import Adjacency
+from . directed_graph_core import DirectedGraphCore
+from . vertex import Vertex
+
+
+def weakly_connected_components(directed_graph: DirectedGraphCore,
+                                component_ids: bool = False) -> \
+        Union[List[Set[Vertex]], array]:
+    """ Function that calculates the weakly connected components of the
+    directed graph
+
+    Args:
+        directed_graph (DirectedGraph): The directed graph
+        component_ids(bool): If True, an array with the component per vertex
+            id is returned instead of sets of vertices. The components are
+            numbered 0..k-1, vertices that are not part of a view on the
+            directed graph have component -1
+
+    Returns:
+        list: The weakly connected components as sets of vertices, or the
+            array with the component per vertex id """
+
+    adjacency = directed_graph.get_adjacency()
+    vertices = adjacency.get_vertices()
+    components = component_positions(adjacency)
+    if component_ids:
+        size = max((vertex.get_id() for vertex in vertices), default=-1) + 1
+        ids = array("l", [-1]) * size
+        for i, vertex in enumerate(vertices):
+            ids[vertex.get_id()] = components[i]
+        return ids
+
+    count = max(components, default=-1) + 1
+    sets: List[Set[Vertex]] = [set() for _ in range(count)]
+    for i, vertex in enumerate(vertices):
+        sets[components[i]].add(vertex)
+    return sets
+
+
+def component_positions(adjacency: Adjacency) -> array:
+    """ Function that calculates the weakly connected components of an
+    adjacency
+
+    Args:
+        adjacency (Adjacency): The adjacency
+
+    Returns:
+        array: The component per position, the components are numbered in
+            the order of their first position """
+
+    n = adjacency.get_vertices_count()
+    offsets = adjacency.get_offsets()
+    heads = adjacency.get_heads()
+    parents = array("l", range(n))
+    ranks = bytearray(n)
+    for tail in range(n):
+        for i in range(offsets[tail], offsets[tail + 1]):
+            first, second = tail, heads[i]
+            while parents[first] != first:
+                parents[first] = parents[parents[first]]
+                first = parents[first]
+            while parents[second] != second:
+                parents[second] = parents[parents[second]]
+                second = parents[second]
+            if first == second:
+                continue
+            if ranks[first] < ranks[second]:
+                first, second = second, first
+            parents[second] = first
+            if ranks[first] == ranks[second]:
+                ranks[first] += 1
+
+    components = array("l", [-1]) * n
+    count = 0
+    for vertex in range(n):
+        root = vertex
+        while parents[root] != root:
+            root = parents[root]
+        if components[root] == -1:
+            components[root] = count
+            count += 1
+        components[vertex] = components[root]
+    return components
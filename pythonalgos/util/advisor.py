@@ -10,9 +10,6 @@ class Advisor(object):
             advice(str): The string that indicates the function in the subclass
         """
 
-        try:
-            advise_function = getattr(self, advice)
+        advise_function = getattr(self, advice, None)
+        if advise_function is not None:
             advise_function(*args, **kwargs)
-        except(AttributeError):
-            # TODO Why doensn't the default work
-            pass
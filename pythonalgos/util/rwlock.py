@@ -0,0 +1,64 @@
+""" Module that defines a reader-writer lock. Readers share the lock and never
+block each other, a writer holds the lock exclusively
+"""
+
+from contextlib import contextmanager
+import threading
+
+
+class ReadWriteLock(object):
+    """ Class that implements a writer preferring reader-writer lock. As soon
+    as a writer is waiting, new readers wait until that writer is done, so
+    writers are not starved by a continuous stream of readers. The lock is not
+    reentrant """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writing = False
+
+    def acquire_read(self):
+        with self._condition:
+            while self._writing or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+
+    def release_write(self):
+        with self._condition:
+            self._writing = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """ Context manager that holds the lock for reading """
+
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """ Context manager that holds the lock for writing """
+
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
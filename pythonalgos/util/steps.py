@@ -0,0 +1,27 @@
+""" Module that defines helpers for algorithms that are written as step
+generators. Such an algorithm periodically yields the amount of work done so
+far and returns its result when the generator is exhausted, which allows the
+same implementation to be run to completion at once, or cooperatively
+"""
+
+from typing import Any, Generator
+
+STEP_SIZE = 1024
+
+Steps = Generator[int, None, Any]
+
+
+def run_steps(steps: Steps) -> Any:
+    """ Function that runs a step generator to completion
+
+    Args:
+        steps(generator): the step generator of the algorithm
+
+    Returns:
+        The result of the algorithm """
+
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
@@ -17,6 +17,8 @@ setup(name="python-algos",
       url="https://github.com/evowilliamson/python-algos",
       packages=find_packages(),
       install_requires=[],
+      extras_require={"numpy": ["numpy"]},
+      entry_points={"console_scripts": ["pythonalgos = pythonalgos.cli:main"]},
       test_suite="tests",
       classifiers=[
         "License :: OSI Approved :: GNU General Public License v2 (GPLv2)",
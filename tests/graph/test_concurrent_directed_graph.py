@@ -0,0 +1,129 @@
+""" Module that contains test for the thread-safe directed graph wrapper
+"""
+
+import pickle
+import threading
+import unittest
+from pythonalgos.graph.concurrent_directed_graph import \
+    ConcurrentDirectedGraph
+
+
+class TestConcurrentDirectedGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [2], 2: []}
+        self.graph = ConcurrentDirectedGraph(self.vertices)
+
+    def test_write_batch(self):
+        with self.graph.write() as batch:
+            batch.add_vertex(3)
+            batch.add_edge(2, 3)
+            batch.add_edge(3, 0)
+        self.assertEqual(self.graph.get_vertices_count(), 4)
+        self.assertTrue(self.graph.is_cyclic())
+
+    def test_failed_write_batch_discarded(self):
+        with self.assertRaises(ValueError):
+            with self.graph.write() as batch:
+                batch.add_vertex(3)
+                raise ValueError()
+        self.assertEqual(self.graph.get_vertices_count(), 3)
+
+    def test_snapshot_published_per_batch(self):
+        snapshot = self.graph.snapshot()
+        self.assertIs(snapshot, self.graph.snapshot())
+        with self.graph.write() as batch:
+            batch.add_edge(2, 0)
+        self.assertFalse(snapshot.is_cyclic())
+        self.assertIsNot(snapshot, self.graph.snapshot())
+        self.assertTrue(self.graph.snapshot().is_cyclic())
+        with self.assertRaises(RuntimeError):
+            self.graph.snapshot().add_vertex(5)
+
+    def test_pickle_snapshot(self):
+        snapshot = pickle.loads(pickle.dumps(self.graph.snapshot()))
+        self.assertEqual(snapshot.get_vertices_count(), 3)
+        self.assertFalse(snapshot.is_cyclic())
+        with self.assertRaises(RuntimeError):
+            snapshot.add_vertex(5)
+
+    def test_snapshot_not_stale_after_write(self):
+        # A write batch that is applied while a reader copies the directed
+        # graph must not leave the reader's copy published
+        copy = self.graph._directed_graph.copy
+        writer = threading.Thread(target=self.write_edge)
+
+        def copy_then_write():
+            result = copy()
+            writer.start()
+            writer.join(0.2)
+            return result
+
+        self.graph._directed_graph.copy = copy_then_write
+        stale = self.graph.snapshot()
+        self.graph._directed_graph.copy = copy
+        writer.join()
+        self.assertFalse(stale.is_cyclic())
+        self.assertTrue(self.graph.snapshot().is_cyclic())
+
+    def write_edge(self):
+        with self.graph.write() as batch:
+            batch.add_edge(2, 0)
+
+    def test_readers_do_not_block_each_other(self):
+        inside = threading.Event()
+        release = threading.Event()
+
+        def hold_read():
+            with self.graph.read():
+                inside.set()
+                release.wait(5)
+
+        reader = threading.Thread(target=hold_read)
+        reader.start()
+        inside.wait(5)
+        entered = threading.Event()
+
+        def second_read():
+            with self.graph.read():
+                entered.set()
+
+        other = threading.Thread(target=second_read)
+        other.start()
+        self.assertTrue(entered.wait(5))
+        release.set()
+        reader.join()
+        other.join()
+
+    def test_concurrent_readers_and_writer(self):
+        errors = list()
+
+        def read():
+            try:
+                for _ in range(50):
+                    self.graph.is_cyclic()
+                    self.graph.create_sccs_kosaraju_dfs()
+            except Exception as e:
+                errors.append(e)
+
+        def write():
+            for label in range(3, 103):
+                with self.graph.write() as batch:
+                    batch.add_vertex(label)
+                    batch.add_edge(label - 1, label)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(errors, list())
+        self.assertEqual(self.graph.get_vertices_count(), 103)
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
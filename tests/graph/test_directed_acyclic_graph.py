@@ -39,6 +39,82 @@ class TestDirectedAcyclicGraph(unittest.TestCase):
         DirectedAcyclicGraph(self.vertices)
         self.assertTrue(True)
 
+    def test_add_edges_batch(self):
+        self.vertices = {0: [1], 1: [2], 2: []}
+        dag = DirectedAcyclicGraph(self.vertices)
+        edges = dag.add_edges_batch([(0, 2), (2, 3), (3, 4)])
+        self.assertEqual(len(edges), 3)
+        self.assertEqual(dag.get_vertices_count(), 5)
+        self.assertEqual(dag.get_vertex(2).get_indegree(), 2)
+
+    def test_add_edges_batch_rollback(self):
+        self.vertices = {0: [1], 1: [2], 2: []}
+        dag = DirectedAcyclicGraph(self.vertices)
+        with self.assertRaises(RuntimeError):
+            dag.add_edges_batch([(2, 3), (3, 4), (4, 0)])
+        self.assertEqual(dag.get_vertices_count(), 3)
+        self.assertEqual(len(dag.get_edges()), 2)
+        self.assertEqual(dag.get_vertex(0).get_indegree(), 0)
+        self.assertFalse(dag.has_vertex(3))
+        dag.add_edges_batch([(2, 3)])
+        self.assertEqual(dag.get_vertex(3).get_id(), 3)
+
+    def test_transaction(self):
+        self.vertices = {0: [1], 1: []}
+        dag = DirectedAcyclicGraph(self.vertices)
+        with self.assertRaises(RuntimeError):
+            with dag.transaction() as batch:
+                batch.add_vertex(2)
+                batch.add_edge(1, 2)
+                batch.add_edge(2, 0)
+        self.assertEqual(dag.get_vertices_count(), 2)
+        with dag.transaction() as batch:
+            batch.add_vertex(2)
+            batch.add_edge(1, 2)
+        self.assertEqual(len(dag.get_edges()), 2)
+
+    def test_add_edge_cycle(self):
+        self.vertices = {0: [1], 1: []}
+        dag = DirectedAcyclicGraph(self.vertices)
+        with self.assertRaises(RuntimeError):
+            dag.add_edge(dag.get_vertex(1), dag.get_vertex(0))
+        self.assertFalse(dag.is_cyclic())
+        self.assertEqual(dag.get_vertex(0).get_indegree(), 0)
+
+    def _heads(self, dag):
+        return {v.get_label(): sorted(h.get_label()
+                                      for h in v.get_edge_heads())
+                for v in dag.get_vertices()}
+
+    def test_transitive_reduction(self):
+        self.vertices = {0: [1, 2, 3], 1: [3], 2: [3, 4], 3: [4], 4: []}
+        dag = DirectedAcyclicGraph(self.vertices)
+        reduction = dag.transitive_reduction()
+        self.assertIsInstance(reduction, DirectedAcyclicGraph)
+        self.assertDictEqual(self._heads(reduction),
+                             {0: [1, 2], 1: [3], 2: [3], 3: [4], 4: []})
+        self.assertEqual(reduction.get_vertex(3).get_indegree(), 2)
+        self.assertEqual(len(dag.get_edges()), 7)
+
+    def test_transitive_closure(self):
+        self.vertices = {0: [1], 1: [2], 2: [], 3: [1]}
+        dag = DirectedAcyclicGraph(self.vertices)
+        dag.get_vertex(0).set_attr("name", "root")
+        closure = dag.transitive_closure()
+        self.assertDictEqual(self._heads(closure),
+                             {0: [1, 2], 1: [2], 2: [], 3: [1, 2]})
+        self.assertEqual(closure.get_vertex(0).get_attr("name"), "root")
+        self.assertDictEqual(self._heads(closure.transitive_reduction()),
+                             self.vertices)
+
+    def test_transitive_reduction_large(self):
+        n = 20000
+        self.vertices = {i: [i + 1, i + 2] if i < n - 2 else [] for i in
+                         range(n)}
+        self.vertices[n - 2] = [n - 1]
+        reduction = DirectedAcyclicGraph(self.vertices).transitive_reduction()
+        self.assertEqual(len(reduction.get_edges()), n - 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -41,6 +41,26 @@ class TestDirectedGraph(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.directed_graph.add_vertex(label)
 
+    def test_dense_ids(self):
+        for i, vertex in enumerate(self.directed_graph.get_vertices()):
+            self.assertEqual(vertex.get_id(), i)
+            self.assertEqual(self.directed_graph.get_vertex_by_id(i), vertex)
+        self.directed_graph.add_vertex("x")
+        self.assertEqual(self.directed_graph.get_vertex("x").get_id(),
+                         len(self.vertices))
+
+    def test_get_unknown_vertex(self):
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.get_vertex(99)
+
+    def test_large_construction(self):
+        n = 100000
+        self.directed_graph = DirectedGraph(
+            {i: [i + 1] if i + 1 < n else [] for i in range(n)})
+        self.assertEqual(self.directed_graph.get_vertex(n - 1).get_id(),
+                         n - 1)
+        self.assertFalse(self.directed_graph.is_cyclic())
+
     def test_add_heads(self):
         vertex_to_test = 7
         self.directed_graph.add_vertex(vertex_to_test)
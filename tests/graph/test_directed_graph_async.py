@@ -0,0 +1,119 @@
+""" Module that contains test for the asyncio variants of the algorithms of
+the directed graph
+"""
+
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph import asynchronous
+from pythonalgos.util.advisor import Advisor
+
+
+class TestDirectedGraphAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 1000
+        self.vertices = {i: [(i + 1) % self.n] for i in range(self.n)}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def test_is_cyclic_async(self):
+        reports = list()
+        result = asyncio.run(self.directed_graph.is_cyclic_async(
+            progress=lambda done, total: reports.append((done, total))))
+        self.assertTrue(result)
+        self.assertEqual(reports[-1], (self.n, self.n))
+
+    def test_sccs_async_progress(self):
+        reports = list()
+        sccs = asyncio.run(asynchronous.create_sccs_kosaraju_dfs_async(
+            self.directed_graph.get_direct_graph_core(),
+            progress=lambda done, total: reports.append(done),
+            step_size=100))
+        self.assertEqual(len(sccs), 1)
+        self.assertEqual(len(sccs[0]), self.n)
+        self.assertListEqual(reports, sorted(reports))
+        self.assertGreater(len(reports), 10)
+
+    def test_event_loop_not_blocked(self):
+        ticks = list()
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            await asynchronous.is_cyclic_async(
+                self.directed_graph.get_direct_graph_core(), step_size=10)
+            task.cancel()
+
+        asyncio.run(main())
+        self.assertGreater(len(ticks), 10)
+
+    def test_yields_between_phases(self):
+        ticks = list()
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            ticks.clear()
+            await asynchronous.create_sccs_kosaraju_dfs_async(
+                self.directed_graph.get_direct_graph_core(),
+                step_size=10 * self.n)
+            task.cancel()
+
+        asyncio.run(main())
+        self.assertGreaterEqual(len(ticks), 2)
+
+    def test_cancellation(self):
+        advisor = VisitCountingAdvisor()
+
+        async def main():
+            task = asyncio.ensure_future(asynchronous.is_cyclic_async(
+                self.directed_graph.get_direct_graph_core(), advisor,
+                step_size=10))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        self.assertLess(advisor.visits, self.n)
+
+    def test_executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sccs = asyncio.run(self.directed_graph
+                               .create_sccs_kosaraju_dfs_async(
+                                   executor=executor))
+        self.assertEqual(len(sccs), 1)
+
+    def test_process_pool_rejected(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(RuntimeError):
+                asyncio.run(self.directed_graph.is_cyclic_async(
+                    executor=executor))
+
+    def tearDown(self):
+        pass
+
+
+class VisitCountingAdvisor(Advisor):
+
+    def __init__(self):
+        super().__init__()
+        self.visits = 0
+
+    def visit_vertex(self, directed_graph, vertex):
+        self.visits += 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+""" Module that contains test for running algorithms over many directed graphs
+in a batch
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph import batch
+
+
+class TestDirectedGraphBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.graphs = list()
+        for i in range(50):
+            vertices = {j: [j + 1] for j in range(i % 7)}
+            vertices[i % 7] = [0] if i % 2 else []
+            self.graphs.append(vertices)
+
+    def test_encode_decode(self):
+        vertices = {"a": ["b"], "b": ["a", "c"], "c": []}
+        encoded = batch.encode(DirectedGraph(vertices))
+        adjacency = batch.decode(encoded)
+        self.assertEqual(adjacency.get_vertices_count(), 3)
+        self.assertEqual(adjacency.get_edges_count(), 3)
+        self.assertEqual(sorted(batch.encode(vertices)[0]), ["a", "b", "c"])
+
+    def test_unknown_head(self):
+        with self.assertRaises(RuntimeError):
+            batch.encode({0: [1]})
+
+    def test_is_cyclic_in_order(self):
+        expected = [DirectedGraph(v).is_cyclic() for v in self.graphs]
+        results = list(batch.run_batch(self.graphs, "is_cyclic",
+                                       chunksize=4, max_workers=2))
+        self.assertListEqual(results, expected)
+
+    def test_sccs_mixed_input(self):
+        graphs = [DirectedGraph(v) if i % 2 else v
+                  for i, v in enumerate(self.graphs)]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(batch.run_batch(graphs, "sccs", chunksize=3,
+                                           executor=executor))
+        for vertices, sccs in zip(self.graphs, results):
+            expected = {frozenset(v.get_label() for v in scc) for scc in
+                        DirectedGraph(vertices).create_sccs_kosaraju_dfs()}
+            self.assertEqual({frozenset(scc) for scc in sccs}, expected)
+
+    def test_lazy_and_cancelled(self):
+        consumed = list()
+
+        def graphs():
+            for vertices in self.graphs:
+                consumed.append(vertices)
+                yield vertices
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = batch.run_batch(graphs(), "is_cyclic", chunksize=2,
+                                      max_workers=1, executor=executor)
+            self.assertEqual(next(results),
+                             DirectedGraph(self.graphs[0]).is_cyclic())
+            # At most two chunks are in flight for a single worker
+            self.assertLessEqual(len(consumed), 6)
+            results.close()
+        self.assertLess(len(consumed), len(self.graphs))
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(RuntimeError):
+            list(batch.run_batch(self.graphs, "unknown"))
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+""" Module that contains test for the breadth-first searches on a directed
+graph
+"""
+
+import random
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph.bfs import BreadthFirstSearch, search_engine
+
+
+class TestDirectedGraphBfs(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1, 2], 1: [3], 2: [3, 4], 3: [5], 4: [5],
+                         5: [0], 6: [0]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def labels(self, vertices):
+        return [vertex.get_label() for vertex in vertices]
+
+    def test_hop_distances(self):
+        hops = self.directed_graph.hop_distances(0)
+        self.assertDictEqual({v.get_label(): h for v, h in hops.items()},
+                             {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 3})
+        hops = self.directed_graph.hop_distances(0, max_hops=1)
+        self.assertEqual(sorted(v.get_label() for v in hops), [0, 1, 2])
+
+    def test_k_hop(self):
+        self.assertEqual(set(self.labels(self.directed_graph.k_hop(3, 2))),
+                         {3, 5, 0})
+        self.assertEqual(self.labels(self.directed_graph.k_hop(6, 0)), [6])
+
+    def test_shortest_unweighted_path(self):
+        path = self.directed_graph.shortest_unweighted_path(6, 5)
+        self.assertEqual(len(path), 5)
+        self.assertEqual(self.labels(path)[:2], [6, 0])
+        self.assertEqual(self.labels(
+            self.directed_graph.shortest_unweighted_path(2, 2)), [2])
+        self.assertIsNone(self.directed_graph.shortest_unweighted_path(0, 6))
+
+    def test_random(self):
+        generator = random.Random(42)
+        for _ in range(20):
+            n = generator.randint(1, 60)
+            vertices = {i: [generator.randrange(n) for _ in
+                            range(generator.randint(0, 4))]
+                        for i in range(n)}
+            directed_graph = DirectedGraph(vertices)
+            adjacency = directed_graph.get_adjacency()
+            expected = BreadthFirstSearch(adjacency, alpha=0) \
+                .distances([0])
+            for alpha, beta in [(1000, 0.001), (1, 1), (14, 24)]:
+                engine = BreadthFirstSearch(adjacency, alpha, beta)
+                self.assertEqual(engine.distances([0]), expected)
+            engine = BreadthFirstSearch(adjacency)
+            for target in range(n):
+                path = engine.shortest_path(0, target)
+                if expected[target] == -1:
+                    self.assertIsNone(path)
+                    continue
+                self.assertEqual(len(path), expected[target] + 1)
+                for tail, head in zip(path, path[1:]):
+                    self.assertIn(head, vertices[tail])
+
+    def test_sparse_distances(self):
+        generator = random.Random(7)
+        for _ in range(20):
+            n = generator.randint(1, 60)
+            vertices = {i: [generator.randrange(n) for _ in
+                            range(generator.randint(0, 4))]
+                        for i in range(n)}
+            engine = BreadthFirstSearch(
+                DirectedGraph(vertices).get_adjacency())
+            for max_hops in [None, 0, 1, 3]:
+                for reverse in [False, True]:
+                    expected = engine.distances([0], max_hops, reverse)
+                    self.assertDictEqual(
+                        engine.sparse_distances([0], max_hops, reverse),
+                        {i: hop for i, hop in enumerate(expected)
+                         if hop != -1})
+
+    def test_engine_kept_until_changed(self):
+        core = self.directed_graph.get_direct_graph_core()
+        engine = search_engine(core)
+        self.directed_graph.k_hop(0, 1)
+        self.assertIs(search_engine(core), engine)
+        self.directed_graph.add_edge(self.directed_graph.get_vertex(6),
+                                     self.directed_graph.get_vertex(5))
+        self.assertIsNot(search_engine(core), engine)
+        self.assertEqual(self.directed_graph.hop_distances(6)[
+            self.directed_graph.get_vertex(5)], 1)
+
+    def test_reverse(self):
+        engine = BreadthFirstSearch(self.directed_graph.get_adjacency())
+        self.assertListEqual(list(engine.distances([0], reverse=True)),
+                             [0, 3, 3, 2, 2, 1, 1])
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+""" Module that contains test for running algorithms concurrently on the same
+directed graph
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.util.advisor import Advisor
+
+
+class TestDirectedGraphConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [2, 3], 2: [3], 3: [4],
+                         4: [5, 2], 5: [6], 6: [7], 7: [5], 8: [8]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def test_trail_repeatable(self):
+        first, second = CountingAdvisor(), CountingAdvisor()
+        self.directed_graph.trail(first)
+        self.directed_graph.trail(second)
+        self.assertEqual(first.not_visited, second.not_visited)
+        self.assertEqual(len(first.not_visited),
+                         len(self.directed_graph.get_edges()))
+
+    def test_no_state_in_graph(self):
+        self.directed_graph.trail()
+        self.directed_graph.is_cyclic()
+        self.directed_graph.create_sccs_kosaraju_dfs()
+        for vertex in self.directed_graph.get_vertices():
+            self.assertEqual(len(vertex.get_attrs()), 0)
+        for edge in self.directed_graph.get_edges():
+            self.assertIsNone(edge.get_attr("visited"))
+
+    def test_concurrent_read_only_runs(self):
+        def run(_):
+            sccs = {frozenset(v.get_label() for v in s)
+                    for s in self.directed_graph.create_sccs_kosaraju_dfs()}
+            advisor = CountingAdvisor()
+            self.directed_graph.trail(advisor)
+            return self.directed_graph.is_cyclic(), sccs, \
+                len(advisor.not_visited)
+
+        expected = run(None)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for result in executor.map(run, range(64)):
+                self.assertEqual(result, expected)
+
+    def test_long_chain(self):
+        n = 3000
+        self.directed_graph = DirectedGraph(
+            {i: [i + 1] if i + 1 < n else [] for i in range(n)})
+        self.assertFalse(self.directed_graph.is_cyclic())
+        self.assertEqual(
+            len(self.directed_graph.create_sccs_kosaraju_dfs(
+                nontrivial=False)), n)
+
+    def tearDown(self):
+        pass
+
+
+class CountingAdvisor(Advisor):
+
+    def __init__(self):
+        super().__init__()
+        self.not_visited = list()
+
+    def edge_not_visited(self, directed_graph, edge):
+        self.not_visited.append((edge.get_tail().get_label(),
+                                 edge.get_head().get_label()))
+
+
+if __name__ == '__main__':
+    unittest.main()
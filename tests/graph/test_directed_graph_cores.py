@@ -0,0 +1,86 @@
+""" Module that contains test for the k-core decomposition of a directed graph
+"""
+
+import random
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+class TestDirectedGraphCores(unittest.TestCase):
+
+    def setUp(self):
+        # A 2-core in total degree (the triangle 0, 1, 2) with a tail 3 -> 4
+        self.vertices = {0: [1], 1: [2], 2: [0, 3], 3: [4], 4: [], 5: [5]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def numbers(self, directed_graph, mode):
+        return {v.get_label(): c for v, c in
+                directed_graph.core_numbers(mode).items()}
+
+    def test_core_numbers(self):
+        self.assertDictEqual(self.numbers(self.directed_graph, "total"),
+                             {0: 2, 1: 2, 2: 2, 3: 1, 4: 1, 5: 0})
+        self.assertDictEqual(self.numbers(self.directed_graph, "in"),
+                             {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 0})
+        self.assertDictEqual(self.numbers(self.directed_graph, "out"),
+                             {0: 1, 1: 1, 2: 1, 3: 0, 4: 0, 5: 0})
+
+    def test_k_core(self):
+        view = self.directed_graph.k_core(2)
+        self.assertEqual(sorted(v.get_label() for v in view.get_vertices()),
+                         [0, 1, 2])
+        self.assertEqual(len(view.get_edges()), 3)
+        self.assertTrue(view.is_cyclic())
+        self.assertEqual(self.directed_graph.k_core(1, "out")
+                         .get_vertices_count(), 3)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.core_numbers("both")
+
+    def test_random(self):
+        generator = random.Random(45)
+        for _ in range(20):
+            n = generator.randint(1, 30)
+            vertices = {i: [generator.randrange(n) for _ in
+                            range(generator.randint(0, 4))]
+                        for i in range(n)}
+            directed_graph = DirectedGraph(vertices)
+            for mode in ["in", "out", "total"]:
+                self.assertDictEqual(self.numbers(directed_graph, mode),
+                                     self.peel(vertices, mode))
+
+    def peel(self, vertices, mode):
+        """ Calculates the core numbers by repeatedly removing the vertices
+        with too low a degree """
+
+        numbers, alive, k = dict(), set(vertices), 0
+        while alive:
+            changed = True
+            while changed:
+                changed = False
+                for vertex in list(alive):
+                    if self.degree(vertices, alive, vertex, mode) < k:
+                        alive.discard(vertex)
+                        changed = True
+            for vertex in alive:
+                numbers[vertex] = k
+            k += 1
+        return numbers
+
+    def degree(self, vertices, alive, vertex, mode):
+        degree = 0
+        if mode in ("out", "total"):
+            degree += sum(1 for head in vertices[vertex]
+                          if head in alive and head != vertex)
+        if mode in ("in", "total"):
+            degree += sum(heads.count(vertex) for tail, heads in
+                          vertices.items() if tail in alive and tail != vertex)
+        return degree
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
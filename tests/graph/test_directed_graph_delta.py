@@ -0,0 +1,91 @@
+""" Module that contains test for replicating directed graphs with deltas
+"""
+
+import pickle
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+class TestDirectedGraphDelta(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {"a": ["b"], "b": ["c"], "c": []}
+        self.directed_graph = DirectedGraph(self.vertices)
+        self.replica = self.directed_graph.copy()
+
+    def heads(self, directed_graph):
+        return {v.get_label(): sorted(h.get_label()
+                                      for h in v.get_edge_heads())
+                for v in directed_graph.get_vertices()}
+
+    def assert_in_sync(self):
+        self.assertDictEqual(self.heads(self.replica),
+                             self.heads(self.directed_graph))
+        for vertex in self.directed_graph.get_vertices():
+            replica = self.replica.get_vertex(vertex.get_label())
+            self.assertEqual(replica.get_id(), vertex.get_id())
+            self.assertEqual(replica.get_indegree(), vertex.get_indegree())
+
+    def test_record_apply(self):
+        self.directed_graph.record_deltas()
+        self.directed_graph.add_vertex("d")
+        vertex = self.directed_graph.get_vertex
+        self.directed_graph.add_edge(vertex("c"), vertex("d"))
+        edge = self.directed_graph.add_edge(vertex("d"), vertex("a"))
+        self.directed_graph.get_direct_graph_core().remove_edge(edge)
+        delta = pickle.loads(pickle.dumps(self.directed_graph.take_delta()))
+        self.assertEqual(len(delta), 4)
+        self.replica.apply_delta(delta)
+        self.assert_in_sync()
+        self.assertEqual(len(self.directed_graph.take_delta()), 0)
+
+    def test_rolled_back_transaction(self):
+        self.directed_graph.record_deltas()
+        with self.assertRaises(RuntimeError):
+            with self.directed_graph.transaction() as batch:
+                batch.add_edge("c", "x")
+                raise RuntimeError("abort")
+        self.directed_graph.add_edges_batch([("c", "y")])
+        self.replica.apply_delta(self.directed_graph.take_delta())
+        self.assert_in_sync()
+
+    def test_diff(self):
+        other = DirectedGraph({"a": ["c"], "b": [], "c": ["a", "a"],
+                               "d": ["a"]})
+        delta = self.directed_graph.diff(other)
+        self.replica.apply_delta(delta)
+        self.assertDictEqual(self.heads(self.replica), {
+            "a": ["c"], "b": [], "c": ["a", "a"], "d": ["a"]})
+
+    def test_diff_removes_last_vertices(self):
+        other = DirectedGraph({"a": ["b"], "b": []})
+        self.replica.apply_delta(self.directed_graph.diff(other))
+        self.assertDictEqual(self.heads(self.replica), self.heads(other))
+        with self.assertRaises(RuntimeError):
+            other.diff(DirectedGraph({"b": []}))
+
+    def test_diff_then_recorded_delta(self):
+        other = DirectedGraph({"a": [], "b": ["a"], "c": [], "d": [],
+                               "e": ["d"]})
+        self.replica.apply_delta(self.directed_graph.diff(other))
+        other.record_deltas()
+        other.add_edge(other.get_vertex("e"), other.get_vertex("a"))
+        other.add_edge(other.get_vertex("d"), other.get_vertex("b"))
+        self.replica.apply_delta(other.take_delta())
+        self.directed_graph = other
+        self.assert_in_sync()
+
+    def test_diff_different_ids(self):
+        with self.assertRaises(RuntimeError):
+            DirectedGraph({"a": []}).diff(DirectedGraph({"b": [], "a": []}))
+
+    def test_not_recording(self):
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.take_delta()
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+""" Module that contains test for the dominator tree of a directed graph
+"""
+
+import random
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+class TestDirectedGraphDominators(unittest.TestCase):
+
+    def setUp(self):
+        # The example of Lengauer and Tarjan's paper
+        self.vertices = {"R": ["A", "B", "C"], "A": ["D"],
+                         "B": ["A", "D", "E"], "C": ["F", "G"], "D": ["L"],
+                         "E": ["H"], "F": ["I"], "G": ["I", "J"],
+                         "H": ["E", "K"], "I": ["K"], "J": ["I"],
+                         "K": ["I", "R"], "L": ["H"], "X": ["R"]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def idoms(self, tree, directed_graph):
+        return {v.get_label(): (None if tree.get_immediate_dominator(v) is
+                                None else
+                                tree.get_immediate_dominator(v).get_label())
+                for v in directed_graph.get_vertices()
+                if tree.is_reachable(v)}
+
+    def test_dominator_tree(self):
+        tree = self.directed_graph.dominator_tree("R")
+        self.assertDictEqual(self.idoms(tree, self.directed_graph),
+                             {"R": None, "A": "R", "B": "R", "C": "R",
+                              "D": "R", "E": "R", "F": "C", "G": "C",
+                              "H": "R", "I": "R", "J": "G", "K": "R",
+                              "L": "D"})
+        vertex = self.directed_graph.get_vertex
+        self.assertFalse(tree.is_reachable(vertex("X")))
+        self.assertTrue(tree.dominates(vertex("C"), vertex("J")))
+        self.assertTrue(tree.dominates(vertex("J"), vertex("J")))
+        self.assertFalse(tree.dominates(vertex("G"), vertex("I")))
+        self.assertFalse(tree.dominates(vertex("X"), vertex("R")))
+        self.assertEqual({v.get_label() for v in
+                          tree.get_children(vertex("C"))}, {"F", "G"})
+        with self.assertRaises(RuntimeError):
+            tree.get_immediate_dominator(vertex("X"))
+
+    def test_post_dominator_tree(self):
+        directed_graph = DirectedGraph({"entry": ["a", "b"], "a": ["c"],
+                                        "b": ["c"], "c": ["exit"],
+                                        "exit": []})
+        tree = directed_graph.dominator_tree("exit", post=True)
+        self.assertDictEqual(self.idoms(tree, directed_graph),
+                             {"exit": None, "c": "exit", "a": "c", "b": "c",
+                              "entry": "c"})
+        self.assertEqual(directed_graph.get_vertex("entry").get_outdegree(),
+                         2)
+
+    def test_random(self):
+        generator = random.Random(41)
+        for _ in range(30):
+            n = generator.randint(2, 25)
+            vertices = {i: [generator.randrange(n) for _ in
+                            range(generator.randint(0, 3))] for i in range(n)}
+            directed_graph = DirectedGraph(vertices)
+            tree = directed_graph.dominator_tree(0)
+            reachable = self.reachable(vertices, 0, None)
+            for v in reachable:
+                dominators = {d for d in reachable
+                              if d == v or v not in
+                              self.reachable(vertices, 0, d)}
+                vertex = directed_graph.get_vertex(v)
+                for d in range(n):
+                    self.assertEqual(
+                        tree.dominates(directed_graph.get_vertex(d), vertex),
+                        d in dominators)
+
+    def reachable(self, vertices, root, removed):
+        if root == removed:
+            return set()
+        seen, stack = {root}, [root]
+        while stack:
+            for head in vertices[stack.pop()]:
+                if head not in seen and head != removed:
+                    seen.add(head)
+                    stack.append(head)
+        return seen
+
+    def test_long_chain(self):
+        n = 50000
+        vertices = {i: [i + 1] for i in range(n - 1)}
+        vertices[n - 1] = []
+        directed_graph = DirectedGraph(vertices)
+        tree = directed_graph.dominator_tree(0)
+        self.assertEqual(tree.get_immediate_dominator(
+            directed_graph.get_vertex(n - 1)).get_label(), n - 2)
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+""" Module that contains test for the Eulerian trail and circuit
+functionality of the directed graph
+"""
+
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+class TestDirectedGraphEulerian(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [2, 3], 2: [0], 3: [4], 4: [1]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def test_eulerian_circuit(self):
+        circuit = self.directed_graph.eulerian_circuit()
+        self.check_trail(circuit)
+        self.assertEqual(circuit[0].get_tail(), circuit[-1].get_head())
+
+    def test_eulerian_trail(self):
+        self.vertices = {0: [1], 1: [2, 3], 2: [0, 4], 3: [4], 4: [1]}
+        self.directed_graph = DirectedGraph(self.vertices)
+        self.assertIsNone(self.directed_graph.eulerian_circuit())
+        trail = self.directed_graph.eulerian_trail()
+        self.check_trail(trail)
+        self.assertEqual(trail[0].get_tail().get_label(), 2)
+        self.assertEqual(trail[-1].get_head().get_label(), 4)
+
+    def test_degree_condition_not_met(self):
+        self.vertices = {0: [1, 2], 1: [], 2: []}
+        self.directed_graph = DirectedGraph(self.vertices)
+        self.assertIsNone(self.directed_graph.eulerian_trail())
+
+    def test_disconnected(self):
+        self.vertices = {0: [1], 1: [0], 2: [3], 3: [2]}
+        self.directed_graph = DirectedGraph(self.vertices)
+        self.assertIsNone(self.directed_graph.eulerian_circuit())
+
+    def test_no_edges(self):
+        self.directed_graph = DirectedGraph({0: [], 1: []})
+        self.assertListEqual(self.directed_graph.eulerian_trail(), list())
+
+    def test_long_circuit(self):
+        n = 2000
+        self.directed_graph = DirectedGraph(
+            {i: [(i + 1) % n] for i in range(n)})
+        self.check_trail(self.directed_graph.eulerian_circuit())
+
+    def check_trail(self, trail):
+        self.assertEqual(len(trail), len(self.directed_graph.get_edges()))
+        self.assertEqual(set(trail), self.directed_graph.get_edges())
+        for previous, edge in zip(trail, trail[1:]):
+            self.assertEqual(previous.get_head(), edge.get_tail())
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+""" Module that contains test for the feedback arc set of a directed graph
+"""
+
+import random
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph.directed_acyclic_graph import DirectedAcyclicGraph
+
+
+class TestDirectedGraphFeedbackArcSet(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [2], 2: [0, 3], 3: [4], 4: [3], 5: [5],
+                         6: [0]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def remaining(self, directed_graph, edges):
+        removed = set(edges)
+        return DirectedGraph({v.get_label(): [e.get_head().get_label()
+                                              for e in v.get_edges()
+                                              if e not in removed]
+                              for v in directed_graph.get_vertices()})
+
+    def test_feedback_arc_set(self):
+        edges = self.directed_graph.feedback_arc_set()
+        self.assertEqual(len(edges), 3)
+        self.assertIn((5, 5), [(e.get_tail().get_label(),
+                                e.get_head().get_label()) for e in edges])
+        self.assertFalse(self.remaining(self.directed_graph,
+                                        edges).is_cyclic())
+
+    def test_acyclic(self):
+        edges, dag = self.directed_graph.feedback_arc_set(acyclic=True)
+        self.assertIsInstance(dag, DirectedAcyclicGraph)
+        self.assertEqual(len(dag.get_edges()), 8 - len(edges))
+
+    def test_acyclic_view(self):
+        view = self.directed_graph.subgraph([0, 1, 2, 3])
+        edges, dag = view.feedback_arc_set(acyclic=True)
+        self.assertEqual(len(edges), 1)
+        self.assertEqual(dag.get_vertices_count(), 4)
+        self.assertEqual(len(dag.get_edges()), 3)
+        self.assertFalse(dag.is_cyclic())
+
+    def test_acyclic_graph(self):
+        directed_graph = DirectedGraph({0: [1, 2], 1: [2], 2: []})
+        self.assertListEqual(directed_graph.feedback_arc_set(), [])
+
+    def test_unknown_method(self):
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.feedback_arc_set("exact")
+
+    def test_random(self):
+        generator = random.Random(44)
+        for _ in range(30):
+            n = generator.randint(1, 40)
+            vertices = {i: [generator.randrange(n) for _ in
+                            range(generator.randint(0, 4))]
+                        for i in range(n)}
+            directed_graph = DirectedGraph(vertices)
+            edges = directed_graph.feedback_arc_set()
+            self.assertFalse(self.remaining(directed_graph,
+                                            edges).is_cyclic())
+            loops = sum(heads.count(tail) for tail, heads in vertices.items())
+            others = sum(map(len, vertices.values())) - loops
+            self.assertLessEqual(len(edges), others / 2 + loops)
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+""" Module that contains test for the fingerprints of directed graphs and the
+cache of algorithm results
+"""
+
+import random
+import time
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph.result_cache import ResultCache
+from pythonalgos.util.advisor import Advisor
+
+
+class CountingAdvisor(Advisor):
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def visit_vertex(self, directed_graph, vertex):
+        self.count += 1
+
+
+class TestDirectedGraphFingerprint(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [2], 2: [0, 3], 3: []}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def relabeled(self, vertices, mapping):
+        return DirectedGraph({mapping[tail]: [mapping[head] for head in heads]
+                              for tail, heads in vertices.items()})
+
+    def test_isomorphic(self):
+        relabeled = self.relabeled(self.vertices,
+                                   {0: "c", 1: "a", 2: "d", 3: "b"})
+        self.assertEqual(self.directed_graph.fingerprint(),
+                         relabeled.fingerprint())
+        self.assertNotEqual(self.directed_graph.fingerprint(labels=True),
+                            relabeled.fingerprint(labels=True))
+        same = DirectedGraph({3: [], 2: [3, 0], 1: [2], 0: [1]})
+        self.assertEqual(self.directed_graph.fingerprint(labels=True),
+                         same.fingerprint(labels=True))
+
+    def test_changes(self):
+        before = self.directed_graph.fingerprint()
+        self.directed_graph.add_edge(self.directed_graph.get_vertex(3),
+                                     self.directed_graph.get_vertex(1))
+        self.assertNotEqual(self.directed_graph.fingerprint(), before)
+        self.directed_graph.reversed()
+        self.assertNotEqual(self.directed_graph.fingerprint(), before)
+        self.assertNotEqual(DirectedGraph({0: [1], 1: []}).fingerprint(),
+                            DirectedGraph({0: [], 1: [0, 1]}).fingerprint())
+
+    def test_random_relabeling(self):
+        generator = random.Random(47)
+        for _ in range(10):
+            n = generator.randint(1, 20)
+            vertices = {i: [generator.randrange(n) for _ in
+                            range(generator.randint(0, 3))]
+                        for i in range(n)}
+            permutation = list(range(n))
+            generator.shuffle(permutation)
+            self.assertEqual(
+                DirectedGraph(vertices).fingerprint(),
+                self.relabeled(vertices, permutation).fingerprint())
+
+    def test_cache(self):
+        cache = ResultCache(2)
+        copy = self.directed_graph.copy()
+        self.assertTrue(self.directed_graph.is_cyclic(cache=cache))
+        self.assertTrue(copy.is_cyclic(cache=cache))
+        self.assertEqual((cache.get_hits(), cache.get_misses()), (1, 1))
+
+        sccs = self.directed_graph.create_sccs_kosaraju_dfs(cache=cache)
+        self.assertEqual([{v.get_label() for v in scc} for scc in
+                          copy.create_sccs_kosaraju_dfs(cache=cache)],
+                         [{v.get_label() for v in scc} for scc in sccs])
+        for scc in copy.create_sccs_kosaraju_dfs(cache=cache):
+            for vertex in scc:
+                self.assertIs(vertex, copy.get_vertex(vertex.get_label()))
+        relabeled = self.relabeled(self.vertices, {0: 5, 1: 6, 2: 7, 3: 8})
+        hits = cache.get_hits()
+        self.assertTrue(relabeled.is_cyclic(cache=cache))
+        self.assertEqual([{v.get_label() for v in scc} for scc in
+                          relabeled.create_sccs_kosaraju_dfs(cache=cache)],
+                         [{5, 6, 7}])
+        self.assertEqual(cache.get_hits(), hits + 2)
+        self.assertEqual(len(cache), 2)
+
+        advisor = CountingAdvisor()
+        self.directed_graph.is_cyclic(advisor, cache)
+        self.assertGreater(advisor.count, 0)
+
+    def test_cache_keeps_results(self):
+        # Both have the same label-insensitive fingerprint, one is a path
+        path = DirectedGraph({i: [i + 1] if i < 15 else [] for i in range(16)})
+        cycle = DirectedGraph({i: [(i + 1) % 8 if i < 8 else i + 1]
+                               if i < 15 else [] for i in range(16)})
+        self.assertEqual(path.fingerprint(), cycle.fingerprint())
+        cache = ResultCache()
+        self.assertFalse(path.is_cyclic(cache=cache))
+        self.assertTrue(cycle.is_cyclic(cache=cache))
+
+        vertices = {0: [1], 1: [0], 2: [3], 3: [2], 4: []}
+        inserted = DirectedGraph(vertices)
+        reversed_insertion = DirectedGraph(dict(reversed(vertices.items())))
+        for directed_graph in (inserted, reversed_insertion):
+            expected = [{v.get_label() for v in scc} for scc in
+                        directed_graph.create_sccs_kosaraju_dfs(False)]
+            self.assertEqual([{v.get_label() for v in scc} for scc in
+                              directed_graph.create_sccs_kosaraju_dfs(
+                                  False, cache=cache)], expected)
+            self.assertEqual([{v.get_label() for v in scc} for scc in
+                              directed_graph.copy().create_sccs_kosaraju_dfs(
+                                  False, cache=cache)], expected)
+
+    def test_same_shape_same_key(self):
+        vertices = {i: [(i * 7 + j) % 50 for j in range(5)] for i in range(50)}
+        keys = {DirectedGraph(vertices).get_direct_graph_core()
+                .get_adjacency_key(labels=False) for _ in range(5)}
+        keys.add(DirectedGraph(vertices).copy().get_direct_graph_core()
+                 .get_adjacency_key(labels=False))
+        keys.add(self.relabeled(vertices, {i: -i for i in range(50)})
+                 .get_direct_graph_core().get_adjacency_key(labels=False))
+        self.assertEqual(len(keys), 1)
+
+    def test_linear_time(self):
+        def seconds(n):
+            path = DirectedGraph({i: [i + 1] if i < n - 1 else []
+                                  for i in range(n)})
+            start = time.perf_counter()
+            path.fingerprint()
+            path.fingerprint(labels=True)
+            path.get_direct_graph_core().get_adjacency_key()
+            return time.perf_counter() - start
+
+        # Linear time gives a ratio near 8, quadratic time one near 64
+        small = min(seconds(1000) for _ in range(3))
+        self.assertLess(seconds(8000), 30 * small)
+
+    def test_capacity(self):
+        with self.assertRaises(RuntimeError):
+            ResultCache(0)
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+""" Module that contains test for ranking the vertices of a directed graph
+with PageRank
+"""
+
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph import pagerank
+
+
+class TestDirectedGraphPagerank(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1, 2], 1: [2], 2: [0], 3: [2], 4: []}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def test_cycle(self):
+        ranks = DirectedGraph({0: [1], 1: [2], 2: [0]}).pagerank()
+        for rank in ranks.values():
+            self.assertAlmostEqual(rank, 1 / 3)
+
+    def test_dangling(self):
+        directed_graph = DirectedGraph({"a": ["b"], "b": []})
+        ranks = directed_graph.pagerank(tol=1.0e-10)
+        self.assertAlmostEqual(ranks[directed_graph.get_vertex("a")],
+                               0.5 / 1.425)
+        self.assertAlmostEqual(sum(ranks.values()), 1.0)
+
+    def test_ordering(self):
+        ranks = self.directed_graph.pagerank()
+        self.assertAlmostEqual(sum(ranks.values()), 1.0)
+        vertex = self.directed_graph.get_vertex
+        self.assertGreater(ranks[vertex(2)], ranks[vertex(0)])
+        self.assertGreater(ranks[vertex(0)], ranks[vertex(1)])
+        self.assertAlmostEqual(ranks[vertex(3)], ranks[vertex(4)])
+
+    def test_warm_start(self):
+        ranks = self.directed_graph.pagerank(tol=1.0e-9)
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.pagerank(tol=1.0e-9, max_iter=2)
+        warm = self.directed_graph.pagerank(tol=1.0e-9, max_iter=2,
+                                            start=ranks)
+        for vertex, rank in ranks.items():
+            self.assertAlmostEqual(warm[vertex], rank)
+
+    def test_pure_python(self):
+        adjacency = self.directed_graph.get_adjacency()
+        ranks = pagerank.pagerank_positions(adjacency, [0.2] * 5, 0.85,
+                                            1.0e-6, 100)
+        expected = self.directed_graph.pagerank()
+        for vertex, rank in expected.items():
+            self.assertAlmostEqual(ranks[vertex.get_id()], rank, places=5)
+
+    def test_empty(self):
+        self.assertDictEqual(DirectedGraph().pagerank(), dict())
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+""" Module that contains test for the partitioning of a directed graph
+"""
+
+import pickle
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+class TestDirectedGraphPartition(unittest.TestCase):
+
+    def setUp(self):
+        # Four dense groups of 10 vertices, connected in a ring by single
+        # edges, with the positions of the vertices shuffled
+        generator = random.Random(49)
+        order = list(range(40))
+        generator.shuffle(order)
+        self.vertices = {i: [j for j in range(40)
+                             if j != i and j // 10 == i // 10 and
+                             generator.random() < 0.5]
+                         for i in order}
+        for group in range(4):
+            self.vertices[group * 10].append((group + 1) % 4 * 10)
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def assert_partition(self, partition, k, maximum):
+        shards = partition.get_shards()
+        self.assertEqual(len(shards), k)
+        self.assertEqual(sum(shard.get_vertices_count() for shard in shards),
+                         40)
+        for part, shard in enumerate(shards):
+            self.assertIsInstance(shard, DirectedGraph)
+            self.assertLessEqual(shard.get_vertices_count(), maximum)
+            for vertex in shard.get_vertices():
+                self.assertEqual(partition.get_part(
+                    self.directed_graph.get_vertex(vertex.get_label())), part)
+            for edge in partition.get_outgoing_edges(part):
+                self.assertEqual(partition.get_part(edge.get_tail()), part)
+                self.assertNotEqual(partition.get_part(edge.get_head()), part)
+            for edge in partition.get_incoming_edges(part):
+                self.assertEqual(partition.get_part(edge.get_head()), part)
+        inner = sum(len(shard.get_edges()) for shard in shards)
+        self.assertEqual(inner + partition.get_cut_size(),
+                         len(self.directed_graph.get_edges()))
+
+    def test_bfs_grow(self):
+        partition = self.directed_graph.partition(4, "bfs_grow")
+        self.assert_partition(partition, 4, 10)
+        self.assertLessEqual(partition.get_cut_size(), 4)
+
+    def test_label_propagation(self):
+        partition = self.directed_graph.partition(4)
+        self.assert_partition(partition, 4, 11)
+        self.assertLessEqual(partition.get_cut_size(), 4)
+
+    def test_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            partition = self.directed_graph.partition(4, executor=executor)
+        self.assertEqual(list(partition.get_parts()),
+                         list(self.directed_graph.partition(4).get_parts()))
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(2) as executor:
+            parts = self.directed_graph.partition(4, executor=executor) \
+                .get_parts()
+        self.assertEqual(list(parts),
+                         list(self.directed_graph.partition(4).get_parts()))
+
+    def test_executor_tasks_small(self):
+        # The tasks carry the chunk bounds, not the adjacency or the parts
+        generator = random.Random(3)
+        directed_graph = DirectedGraph(
+            {i: [generator.randrange(9000) for _ in range(2)]
+             for i in range(9000)})
+        executor = RecordingExecutor(2)
+        with executor:
+            parts = directed_graph.partition(4, executor=executor) \
+                .get_parts()
+        self.assertEqual(list(parts),
+                         list(directed_graph.partition(4).get_parts()))
+        self.assertGreater(len(executor.sizes), 4)
+        self.assertLess(max(executor.sizes), 1000)
+
+    def test_shard_algorithms(self):
+        partition = self.directed_graph.partition(4, "bfs_grow")
+        for shard in partition.get_shards():
+            self.assertTrue(shard.is_cyclic())
+
+    def test_pickle_shard(self):
+        self.directed_graph.get_vertex(0).set_attr("weight", 3)
+        partition = self.directed_graph.partition(4)
+        part = partition.get_part(self.directed_graph.get_vertex(0))
+        shard = pickle.loads(pickle.dumps(partition.get_shard(part)))
+        self.assertEqual(shard.get_vertices_count(), 10)
+        self.assertEqual(shard.get_vertex(0).get_attr("weight"), 3)
+        sccs = shard.create_sccs_kosaraju_dfs(False)
+        self.assertEqual(sum(len(scc) for scc in sccs), 10)
+        self.assertEqual({v.get_label() // 10 for scc in sccs for v in scc},
+                         {0})
+
+    def test_seed(self):
+        first = self.directed_graph.partition(4, seed=1).get_parts()
+        self.assertEqual(list(first), list(
+            self.directed_graph.partition(4, seed=1).get_parts()))
+
+    def test_errors(self):
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.partition(0)
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.partition(2, "metis")
+
+    def test_more_parts_than_vertices(self):
+        partition = DirectedGraph({0: [1], 1: []}).partition(3)
+        self.assertEqual(sorted(shard.get_vertices_count()
+                                for shard in partition.get_shards()),
+                         [0, 1, 1])
+
+    def tearDown(self):
+        pass
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers)
+        self.sizes = list()
+
+    def submit(self, fn, *args, **kwargs):
+        self.sizes.append(len(pickle.dumps((fn, args, kwargs))))
+        return super().submit(fn, *args, **kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
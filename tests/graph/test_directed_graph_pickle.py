@@ -0,0 +1,90 @@
+""" Module that contains test for pickling directed graphs and exchanging them
+through shared memory
+"""
+
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph.shared import SharedGraph
+from pythonalgos.graph import cyclic
+
+
+def _is_cyclic_shared(shared: SharedGraph) -> bool:
+    with shared.attach() as adjacency:
+        return cyclic.is_cyclic_adjacency(adjacency)
+
+
+class TestDirectedGraphPickle(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [2, 3], 2: [0], 3: [4], 4: []}
+        self.directed_graph = DirectedGraph(self.vertices)
+        self.directed_graph.get_vertex(1).set_attr("colour", "red")
+        edge = next(iter(self.directed_graph.get_vertex(3).get_edges()))
+        edge.set_attr("weight", 5)
+
+    def assert_same_graph(self, directed_graph: DirectedGraph):
+        self.assertEqual(directed_graph.get_vertices_count(), 5)
+        for label, heads in self.vertices.items():
+            vertex = directed_graph.get_vertex(label)
+            self.assertEqual(vertex.get_id(), label)
+            self.assertEqual(sorted(h.get_label()
+                                    for h in vertex.get_edge_heads()),
+                             heads)
+            self.assertEqual(vertex.get_indegree(),
+                             self.directed_graph.get_vertex(label)
+                             .get_indegree())
+        self.assertEqual(directed_graph.get_vertex(1).get_attr("colour"),
+                         "red")
+        edge = next(iter(directed_graph.get_vertex(3).get_edges()))
+        self.assertEqual(edge.get_attr("weight"), 5)
+
+    def test_pickle(self):
+        directed_graph = pickle.loads(pickle.dumps(self.directed_graph))
+        self.assert_same_graph(directed_graph)
+        self.assertTrue(directed_graph.is_cyclic())
+
+    def test_copy_is_independent(self):
+        directed_graph = self.directed_graph.copy()
+        self.assert_same_graph(directed_graph)
+        directed_graph.get_vertex(1).set_attr("colour", "blue")
+        directed_graph.add_edge(directed_graph.get_vertex(4),
+                                directed_graph.get_vertex(0))
+        self.assertEqual(self.directed_graph.get_vertex(1).get_attr("colour"),
+                         "red")
+        self.assertEqual(self.directed_graph.get_vertex(4).get_outdegree(),
+                         0)
+
+    def test_long_chain(self):
+        n = 100000
+        vertices = {i: [i + 1] for i in range(n - 1)}
+        vertices[n - 1] = []
+        directed_graph = pickle.loads(pickle.dumps(DirectedGraph(vertices)))
+        self.assertEqual(directed_graph.get_vertices_count(), n)
+        self.assertEqual(directed_graph.get_vertex(n - 1).get_indegree(), 1)
+        self.assertFalse(directed_graph.is_cyclic())
+
+    def test_shared_load(self):
+        with SharedGraph.create(self.directed_graph) as shared:
+            self.assert_same_graph(shared.load())
+            with shared.attach() as adjacency:
+                self.assertListEqual(list(adjacency.get_vertices()),
+                                     list(self.vertices))
+                self.assertEqual(adjacency.get_edges_count(), 5)
+                self.assertTrue(cyclic.is_cyclic_adjacency(adjacency))
+
+    def test_shared_in_process_pool(self):
+        acyclic = DirectedGraph({0: [1], 1: []})
+        with SharedGraph.create(self.directed_graph) as first, \
+                SharedGraph.create(acyclic) as second, \
+                ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_is_cyclic_shared, [first, second]))
+        self.assertListEqual(results, [True, False])
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+""" Module that contains test for the propagation of values along the edges of
+a directed graph
+"""
+
+import random
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+def union(first, second):
+    return first | second
+
+
+def keep(edge, value):
+    return value
+
+
+class TestDirectedGraphPropagation(unittest.TestCase):
+
+    def setUp(self):
+        # 0 -> 1 -> {2 <-> 3} -> 4, 5 is isolated
+        self.vertices = {0: [1], 1: [2], 2: [3], 3: [2, 4], 4: [], 5: []}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def values(self, directed_graph, attr):
+        return {vertex.get_label(): vertex.get_attr(attr)
+                for vertex in directed_graph.get_vertices()}
+
+    def test_taint(self):
+        self.directed_graph.get_vertex(0).set_attr("taint", frozenset("a"))
+        self.directed_graph.get_vertex(3).set_attr("taint", frozenset("b"))
+        self.directed_graph.propagate("taint", keep, union)
+        self.assertDictEqual(self.values(self.directed_graph, "taint"), {
+            0: frozenset("a"), 1: frozenset("a"), 2: frozenset("ab"),
+            3: frozenset("ab"), 4: frozenset("ab"), 5: None})
+
+    def test_distances(self):
+        self.directed_graph.get_vertex(0).set_attr("hops", 0)
+        self.directed_graph.propagate(
+            "hops", lambda edge, value: value + 1, min)
+        self.assertDictEqual(self.values(self.directed_graph, "hops"),
+                             {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: None})
+
+    def test_edge_filter(self):
+        for vertex in self.directed_graph.get_vertices():
+            for edge in vertex.get_edges():
+                edge.set_attr("blocked", edge.get_head().get_label() == 2)
+        self.directed_graph.get_vertex(0).set_attr("seen", True)
+        self.directed_graph.propagate(
+            "seen", lambda edge, value: None if edge.get_attr("blocked")
+            else value, lambda first, second: first or second)
+        self.assertEqual(self.values(self.directed_graph, "seen"),
+                         {0: True, 1: True, 2: None, 3: None, 4: None,
+                          5: None})
+
+    def test_single_pass(self):
+        n = 200
+        generator = random.Random(48)
+        vertices = {i: sorted({generator.randrange(i + 1, n + 1)
+                               for _ in range(3)}) if i < n else []
+                    for i in range(n + 1)}
+        directed_graph = DirectedGraph(vertices)
+        for vertex in directed_graph.get_vertices():
+            vertex.set_attr("labels", frozenset([vertex.get_label()]))
+        self.assertEqual(directed_graph.propagate("labels", keep, union),
+                         n + 1)
+        self.assertEqual(
+            len(directed_graph.get_vertex(n).get_attr("labels")), n + 1)
+
+    def test_random(self):
+        generator = random.Random(48)
+        for _ in range(10):
+            n = generator.randint(1, 25)
+            vertices = {i: [generator.randrange(n) for _ in
+                            range(generator.randint(0, 3))]
+                        for i in range(n)}
+            directed_graph = DirectedGraph(vertices)
+            sources = {i for i in range(n) if generator.random() < 0.2}
+            for i in sources:
+                directed_graph.get_vertex(i).set_attr("reached",
+                                                      frozenset([i]))
+            directed_graph.propagate("reached", keep, union)
+            for i in range(n):
+                expected = frozenset(source for source in sources
+                                     if self.reaches(vertices, source, i))
+                self.assertEqual(
+                    directed_graph.get_vertex(i).get_attr("reached"),
+                    expected or None)
+
+    def reaches(self, vertices, source, target):
+        seen, todo = {source}, [source]
+        while todo:
+            for head in vertices[todo.pop()]:
+                if head not in seen:
+                    seen.add(head)
+                    todo.append(head)
+        return target in seen
+
+    def test_max_visits(self):
+        self.directed_graph.get_vertex(2).set_attr("count", 0)
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.propagate(
+                "count", lambda edge, value: value + 1, max, max_visits=50)
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+""" Module that contains test for the weighted shortest path functionality of
+the directed graph
+"""
+
+import random
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+WEIGHTS = {(0, 1): 4, (0, 2): 1, (2, 1): 2, (1, 3): 1, (2, 3): 5, (3, 4): 3}
+
+
+class TestDirectedGraphShortestPaths(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1, 2], 1: [3], 2: [1, 3], 3: [4], 4: [], 5: []}
+        self.directed_graph = DirectedGraph(self.vertices)
+        self.set_weights(self.directed_graph, WEIGHTS)
+
+    def test_dijkstra(self):
+        for flat_weights in [True, False]:
+            paths = self.directed_graph.dijkstra(0, flat_weights=flat_weights)
+            self.assertEqual(paths.get_distance(self.vertex(4)), 7)
+            self.assertListEqual(self.labels(paths.get_path(self.vertex(4))),
+                                 [0, 2, 1, 3, 4])
+            self.assertIsNone(paths.get_path(self.vertex(5)))
+
+    def test_dag_shortest_paths(self):
+        paths = self.directed_graph.dag_shortest_paths(0)
+        self.assertEqual(paths.get_distance(self.vertex(3)), 4)
+        self.assertEqual(paths.get_distance(self.vertex(5)), float("inf"))
+
+    def test_dag_shortest_paths_cyclic(self):
+        self.directed_graph = DirectedGraph({0: [1], 1: [0]})
+        self.set_weights(self.directed_graph, {(0, 1): 1, (1, 0): 1})
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.dag_shortest_paths(0)
+
+    def test_negative_weight(self):
+        self.set_weights(self.directed_graph, {(0, 1): -1})
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.dijkstra(0)
+
+    def test_bidirectional_dijkstra(self):
+        distance, path = self.directed_graph.bidirectional_dijkstra(0, 4)
+        self.assertEqual(distance, 7)
+        self.assertListEqual(self.labels(path), [0, 2, 1, 3, 4])
+        self.assertIsNone(self.directed_graph.bidirectional_dijkstra(0, 5))
+        self.assertEqual(self.directed_graph.bidirectional_dijkstra(3, 3),
+                         (0.0, [self.vertex(3)]))
+
+    def test_bidirectional_dijkstra_random(self):
+        generator = random.Random(7)
+        n = 60
+        vertices = {i: generator.sample(range(n), 4) for i in range(n)}
+        self.directed_graph = DirectedGraph(vertices)
+        for edge in self.directed_graph.get_edges():
+            edge.set_attr("weight", generator.randint(1, 20))
+        for _ in range(30):
+            source, target = generator.randrange(n), generator.randrange(n)
+            paths = self.directed_graph.dijkstra(source)
+            result = self.directed_graph.bidirectional_dijkstra(source,
+                                                                target)
+            distance = float("inf") if result is None else result[0]
+            self.assertEqual(distance,
+                             paths.get_distance(self.vertex(target)))
+
+    def set_weights(self, directed_graph, weights):
+        for edge in directed_graph.get_edges():
+            key = (edge.get_tail().get_label(), edge.get_head().get_label())
+            if key in weights:
+                edge.set_attr("weight", weights[key])
+
+    def vertex(self, label):
+        return self.directed_graph.get_vertex(label)
+
+    def labels(self, vertices):
+        return [vertex.get_label() for vertex in vertices]
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
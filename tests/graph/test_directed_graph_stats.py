@@ -0,0 +1,91 @@
+""" Module that contains test for the maintained statistics of a directed graph
+"""
+
+import random
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph.stats import GraphStats
+
+
+class TestDirectedGraphStats(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1, 2], 1: [2], 2: [], 3: [3], 4: []}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def labels(self, vertices):
+        return sorted(vertex.get_label() for vertex in vertices)
+
+    def assert_stats(self, directed_graph):
+        """ Compares the maintained statistics with statistics that are
+        calculated from the adjacency """
+
+        stats = directed_graph.stats()
+        expected = GraphStats.from_adjacency(directed_graph.get_adjacency())
+        self.assertEqual(stats.get_vertices_count(),
+                         directed_graph.get_vertices_count())
+        self.assertEqual(stats.get_edges_count(),
+                         len(directed_graph.get_edges()))
+        self.assertEqual(self.labels(stats.get_sources()),
+                         self.labels(expected.get_sources()))
+        self.assertEqual(self.labels(stats.get_sinks()),
+                         self.labels(expected.get_sinks()))
+        self.assertEqual(stats.get_indegree_histogram(),
+                         expected.get_indegree_histogram())
+        self.assertEqual(stats.get_outdegree_histogram(),
+                         expected.get_outdegree_histogram())
+
+    def test_stats(self):
+        stats = self.directed_graph.stats()
+        self.assertEqual(self.directed_graph.get_edges_count(), 4)
+        self.assertEqual(self.labels(stats.get_sources()), [0, 4])
+        self.assertEqual(self.labels(stats.get_sinks()), [2, 4])
+        self.assertEqual(stats.get_sources_count(), 2)
+        self.assertEqual(stats.get_indegree_histogram(), [2, 2, 1])
+        self.assertEqual(stats.get_outdegree_histogram(), [2, 2, 1])
+        self.assert_stats(self.directed_graph)
+
+    def test_changes(self):
+        stats = self.directed_graph.stats()
+        self.directed_graph.add_vertex(5)
+        self.assertEqual(self.labels(stats.get_sources()), [0, 4, 5])
+        core = self.directed_graph.get_direct_graph_core()
+        edge = next(iter(self.directed_graph.get_vertex(1).get_edges()))
+        core.remove_edge(edge)
+        self.assertEqual(self.directed_graph.get_edges_count(), 3)
+        self.assertEqual(self.labels(stats.get_sinks()), [1, 2, 4, 5])
+        self.assert_stats(self.directed_graph)
+        self.directed_graph.reversed()
+        self.assertEqual(self.labels(stats.get_sources()), [1, 2, 4, 5])
+        self.assert_stats(self.directed_graph)
+        core.remove_vertices_from(5)
+        self.assert_stats(self.directed_graph)
+        self.assert_stats(self.directed_graph.copy())
+
+    def test_random(self):
+        generator = random.Random(46)
+        directed_graph = DirectedGraph({i: [] for i in range(20)})
+        core = directed_graph.get_direct_graph_core()
+        for _ in range(300):
+            if generator.random() < 0.6:
+                directed_graph.add_edge(
+                    directed_graph.get_vertex(generator.randrange(20)),
+                    directed_graph.get_vertex(generator.randrange(20)))
+            else:
+                edges = list(directed_graph.get_edges())
+                if edges:
+                    core.remove_edge(generator.choice(edges))
+        self.assert_stats(directed_graph)
+
+    def test_view(self):
+        view = self.directed_graph.subgraph([0, 1, 3])
+        self.assertEqual(view.get_edges_count(), 2)
+        self.assertEqual(self.labels(view.stats().get_sinks()), [1])
+        self.assertEqual(view.stats().get_indegree_histogram(), [1, 2])
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+""" Module that contains test for the subgraph and filtered views of the
+directed graph
+"""
+
+import pickle
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+class TestDirectedGraphViews(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [2, 3], 2: [0], 3: [4],
+                         4: [5], 5: [3], 6: [6]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def test_subgraph(self):
+        view = self.directed_graph.subgraph([0, 1, 2, 3])
+        self.assertEqual(view.get_vertices_count(), 4)
+        self.assertEqual(len(view.get_edges()), 4)
+        self.assertTrue(view.is_cyclic())
+        self.assertEqual(self.labels(view.create_sccs_kosaraju_dfs()),
+                         {frozenset([0, 1, 2])})
+        self.assertTrue(self.directed_graph.subgraph([3, 4, 5, 0])
+                        .is_cyclic())
+        self.assertFalse(self.directed_graph.subgraph([0, 1, 3, 4])
+                         .is_cyclic())
+
+    def test_subgraph_shares_vertices(self):
+        view = self.directed_graph.subgraph([0, 1])
+        self.assertIs(view.get_vertex(0), self.directed_graph.get_vertex(0))
+        with self.assertRaises(RuntimeError):
+            view.get_vertex(2)
+        with self.assertRaises(RuntimeError):
+            self.directed_graph.subgraph([99])
+
+    def test_filtered_view(self):
+        self.directed_graph.get_vertex(6).set_attr("tenant", "b")
+        view = self.directed_graph.filtered_view(
+            lambda vertex: vertex.get_attr("tenant") != "b",
+            lambda edge: edge.get_head().get_label() != 0)
+        self.assertEqual(view.get_vertices_count(), 6)
+        self.assertEqual(self.labels(view.create_sccs_kosaraju_dfs()),
+                         {frozenset([3, 4, 5])})
+
+    def test_view_of_view(self):
+        view = self.directed_graph.subgraph([0, 1, 2, 3]) \
+            .filtered_view(edge_predicate=lambda edge:
+                           edge.get_tail().get_label() != 2)
+        self.assertFalse(view.is_cyclic())
+        self.assertEqual(view.subgraph([0, 1]).get_vertices_count(), 2)
+
+    def test_view_eulerian(self):
+        view = self.directed_graph.subgraph([0, 1, 2])
+        self.assertEqual(len(view.eulerian_circuit()), 3)
+        self.assertIsNone(self.directed_graph.eulerian_circuit())
+
+    def test_view_read_only(self):
+        view = self.directed_graph.subgraph([0, 1])
+        with self.assertRaises(RuntimeError):
+            view.add_vertex(7)
+        copy = view.copy()
+        copy.add_vertex(7)
+        self.assertEqual(copy.get_vertices_count(), 3)
+        self.assertEqual(self.directed_graph.get_vertices_count(), 7)
+
+    def test_view_deltas_read_only(self):
+        view = self.directed_graph.subgraph([0, 1])
+        with self.assertRaises(RuntimeError):
+            view.record_deltas()
+        with self.assertRaises(RuntimeError):
+            view.take_delta()
+
+    def test_pickle_view(self):
+        view = self.directed_graph.subgraph([0, 1, 2, 3]).subgraph([0, 1, 2])
+        loaded = pickle.loads(pickle.dumps(view))
+        self.assertEqual(sorted(v.get_label() for v in loaded.get_vertices()),
+                         [0, 1, 2])
+        self.assertEqual(self.labels(loaded.create_sccs_kosaraju_dfs()),
+                         {frozenset([0, 1, 2])})
+
+    def test_vertices_kept_until_changed(self):
+        view = self.directed_graph.subgraph([0, 1, 2])
+        vertices = view.get_vertices()
+        self.assertIs(view.get_vertices(), vertices)
+        self.directed_graph.add_edge(self.directed_graph.get_vertex(2),
+                                     self.directed_graph.get_vertex(1))
+        self.assertIsNot(view.get_vertices(), vertices)
+        self.assertEqual(len(view.get_edges()), 4)
+        filtered = self.directed_graph.filtered_view(
+            lambda vertex: vertex.get_attr("hidden") is None)
+        self.assertEqual(filtered.get_vertices_count(), 7)
+        self.directed_graph.get_vertex(6).set_attr("hidden", True)
+        self.assertEqual(filtered.get_vertices_count(), 6)
+
+    def labels(self, sccs):
+        return {frozenset(v.get_label() for v in scc) for scc in sccs}
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+""" Module that contains test for the weakly connected components of a
+directed graph
+"""
+
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+
+
+class TestDirectedGraphWeaklyConnected(unittest.TestCase):
+
+    def setUp(self):
+        self.vertices = {0: [1], 1: [], 2: [1], 3: [4], 4: [3], 5: [],
+                         6: [6]}
+        self.directed_graph = DirectedGraph(self.vertices)
+
+    def test_components(self):
+        components = self.directed_graph.weakly_connected_components()
+        self.assertEqual({frozenset(v.get_label() for v in component)
+                          for component in components},
+                         {frozenset([0, 1, 2]), frozenset([3, 4]),
+                          frozenset([5]), frozenset([6])})
+
+    def test_component_ids(self):
+        ids = self.directed_graph.weakly_connected_components(
+            component_ids=True)
+        self.assertListEqual(list(ids), [0, 0, 0, 1, 1, 2, 3])
+
+    def test_view(self):
+        view = self.directed_graph.subgraph([0, 2, 3, 4])
+        ids = view.weakly_connected_components(component_ids=True)
+        self.assertListEqual(list(ids), [0, -1, 1, 2, 2])
+
+    def test_long_chain(self):
+        n = 100000
+        vertices = {i: [i - 1] if i else [] for i in range(n)}
+        components = DirectedGraph(vertices).weakly_connected_components()
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), n)
+
+    def test_empty(self):
+        self.assertListEqual(DirectedGraph().weakly_connected_components(),
+                             [])
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
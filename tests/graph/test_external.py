@@ -0,0 +1,105 @@
+""" Module that contains test for the external memory cycle check and
+strongly connected components
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from pythonalgos.graph.directed_graph import DirectedGraph
+from pythonalgos.graph import external
+
+
+class TestExternal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.edge_path = os.path.join(self.directory.name, "edges")
+        self.component_path = os.path.join(self.directory.name, "components")
+
+    def test_read_write_edge_file(self):
+        edges = [(i, (i * 7) % 11) for i in range(11)]
+        external.write_edge_file(self.edge_path, edges)
+        blocks = list(external.read_edge_blocks(self.edge_path, 4))
+        self.assertEqual(len(blocks), 3)
+        read = [(b[i], b[i + 1]) for b in blocks for i in range(0, len(b), 2)]
+        self.assertListEqual(read, edges)
+        self.assertEqual(external.count_vertices(self.edge_path), 11)
+
+    def test_sccs_external(self):
+        generator = random.Random(3)
+        for memory_edges in [0, external.MEMORY_EDGES]:
+            for _ in range(5):
+                n = 40
+                vertices = {i: generator.sample(range(n), 2)
+                            for i in range(n)}
+                external.write_edge_file(
+                    self.edge_path, sorted((tail, head) for tail, heads in
+                                           vertices.items() for head in heads))
+                count = external.sccs_external(
+                    self.edge_path, self.component_path, n,
+                    block_edges=16, memory_edges=memory_edges)
+                components = external.read_components(self.component_path)
+                groups = dict()
+                for v, component in enumerate(components):
+                    groups.setdefault(component, set()).add(v)
+                expected = {frozenset(v.get_label() for v in scc) for scc in
+                            DirectedGraph(vertices).create_sccs_kosaraju_dfs(
+                                nontrivial=False)}
+                self.assertEqual({frozenset(g) for g in groups.values()},
+                                 expected)
+                self.assertEqual(count, len(expected))
+                for component, group in groups.items():
+                    self.assertEqual(component, max(group))
+
+    def test_is_cyclic_external(self):
+        for memory_edges in [0, external.MEMORY_EDGES]:
+            external.write_edge_file(self.edge_path,
+                                     [(0, 1), (1, 2), (2, 3), (3, 1)])
+            self.assertTrue(external.is_cyclic_external(
+                self.edge_path, memory_edges=memory_edges))
+            external.write_edge_file(self.edge_path,
+                                     [(0, 1), (1, 2), (0, 2), (2, 3)])
+            self.assertFalse(external.is_cyclic_external(
+                self.edge_path, memory_edges=memory_edges))
+            external.write_edge_file(self.edge_path, [(0, 1), (2, 2)])
+            self.assertTrue(external.is_cyclic_external(
+                self.edge_path, memory_edges=memory_edges))
+
+    def test_trim_cascades_within_pass(self):
+        # A path is trimmed in a few passes in either file order, instead of
+        # one pass per vertex
+        n = 500
+        for edges in [[(i, i + 1) for i in range(n)],
+                      [(i, i + 1) for i in reversed(range(n))]]:
+            external.write_edge_file(self.edge_path, edges)
+            passes = list()
+            read_edge_blocks = external.read_edge_blocks
+
+            def counting(*args):
+                passes.append(1)
+                return read_edge_blocks(*args)
+
+            external.read_edge_blocks = counting
+            try:
+                self.assertFalse(external.is_cyclic_external(
+                    self.edge_path, memory_edges=0))
+                self.assertEqual(external.sccs_external(
+                    self.edge_path, self.component_path, n + 1,
+                    memory_edges=0), n + 1)
+            finally:
+                external.read_edge_blocks = read_edge_blocks
+            self.assertLessEqual(len(passes), 10)
+
+    def test_empty_edge_file(self):
+        external.write_edge_file(self.edge_path, [])
+        self.assertFalse(external.is_cyclic_external(self.edge_path))
+        self.assertEqual(external.sccs_external(
+            self.edge_path, self.component_path, 3), 3)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+""" Module that contains test for the command line interface
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pythonalgos import cli
+from pythonalgos.graph.external import write_edge_file
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "graph.txt")
+        with open(self.path, "w") as f:
+            f.write("# a cycle and a tail\na b\nb c\nc a\nc d\ne\n")
+
+    def run_cli(self, *argv):
+        out, err = io.StringIO(), io.StringIO()
+        status = cli.main(list(argv), out, err)
+        return status, [json.loads(line) for line in
+                        out.getvalue().splitlines()], \
+            [json.loads(line) for line in err.getvalue().splitlines()]
+
+    def test_is_cyclic(self):
+        status, results, _ = self.run_cli("is_cyclic", self.path)
+        self.assertEqual(status, 0)
+        self.assertListEqual(results, [True])
+
+    def test_sccs(self):
+        _, results, _ = self.run_cli("sccs", self.path)
+        self.assertListEqual(results, [["a", "b", "c"]])
+        _, results, _ = self.run_cli("sccs", self.path, "--trivial")
+        self.assertEqual(len(results), 3)
+
+    def test_trail(self):
+        _, results, _ = self.run_cli("trail", self.path)
+        self.assertEqual(sorted(map(tuple, results)),
+                         [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+
+    def test_topological_binary(self):
+        path = os.path.join(self.dir.name, "graph.bin")
+        write_edge_file(path, [(2, 0), (0, 1), (2, 1)])
+        status, results, _ = self.run_cli("topological", path)
+        self.assertEqual(status, 0)
+        self.assertListEqual(results, [2, 0, 1])
+
+    def test_topological_cycle(self):
+        status, results, errors = self.run_cli("topological", self.path)
+        self.assertEqual(status, 1)
+        self.assertListEqual(results, [])
+        self.assertEqual(errors, [{"error": "Directed graph has a cycle"}])
+
+    def test_profile(self):
+        _, _, phases = self.run_cli("is_cyclic", self.path, "--profile")
+        self.assertListEqual([phase["phase"] for phase in phases],
+                             ["read", "build", "is_cyclic"])
+        for phase in phases:
+            self.assertGreaterEqual(phase["seconds"], 0)
+            self.assertGreater(phase["peak_bytes"], 0)
+
+    def test_profile_stdin(self):
+        stdin = sys.stdin
+        sys.stdin = io.StringIO("a b\nb a\n")
+        try:
+            status, results, phases = self.run_cli("sccs", "-", "--profile")
+        finally:
+            sys.stdin = stdin
+        self.assertEqual(status, 0)
+        self.assertListEqual(results, [["a", "b"]])
+        self.assertEqual(len(phases), 3)
+        for phase in phases:
+            self.assertGreater(phase["peak_bytes"], 0)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()